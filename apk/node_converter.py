@@ -37,34 +37,24 @@ for _res in _files:
 
 print('[+] Found %d nodes...' % len(nodes))
 nodes.sort()
-txt_elements = {}
+table_elements = {}
 for node_file_name in nodes:
   content = open(path + '/' + node_file_name, 'r').read()
   match = re.search(RE_EXTENDS, content)
   ext_class = match.group()[4:-5]
   class_name = re.search(RE_NAME, content).group()[6:-2]
 
+  args = None
+  labels = None
   if 'NodeE8' in ext_class: # enum class type
+    ext_class = 'NodeE8'
     enum_type = content[content.find('enum') + 4:]
     enum_type = enum_type[enum_type.find('{'):enum_type.find('}')]
     
-    txt = 'class %s(NodeE8):\n  ' % class_name
-    txt += 'def __init__(self, value: int = 0) -> None:\n'
     x = enum_type.replace('\n', '').replace('{', '').replace(' ', '').split(',')
-    tx_1 = []
-    for y in x:
-      if y: tx_1.append(y)
-    
-    txt += '    super().__init__(value, { %s })\n' % (
-      ', '.join('%d: "%s"' %(i, val) for i, val in enumerate(tx_1))
-    )
-    txt += '    self.prototype = NodePrototype(arg=NodeArg(data_type=ARG_TYPE_E8))\n'
+    labels = tuple(y for y in x if y)
     
   elif ext_class in ['NodeList']:
-    txt = 'class %s(NodeList):\n  ' % class_name
-    txt += 'def __init__(self) -> None:\n'
-    txt += '    super().__init__()\n'
-    
     prototype = content[content.find('Prototype == null'):]
     prototype = prototype[prototype.find('{')+1:prototype.find('}')].split('\n')
     args = []
@@ -74,17 +64,8 @@ for node_file_name in nodes:
       if '"' in name: name = name[1:-1]
       else: name = '$' + name
       length = length[:length.find(')')]
-      args.append("NodeArg('%s', %d, %d)" % (
-        name, int(length), data_type_from_str(data_type)
-      ))
-    txt += '    self.prototype = NodePrototype(args=[%s])\n' % (', '.join(args))
-  else:
-    txt = 'class %s(%s):\n' % (class_name, ext_class)
-    txt += '  def __init__(self, value: str = None) -> None:\n'
-    txt += '    super().__init__(value, 1024)\n'
-    txt += '    self.prototype = NodePrototype(arg=NodeArg(data_type=ARG_TYPE_%s))\n' % (
-      ext_class.replace('Node', '')
-    )
+      args.append((name, int(length), data_type_from_str(data_type)))
+    args = tuple(args)
 
   cacheable = True if 'true' in re.search(RE_IS_CACHEABLE, content).group() else False
   notifying = True if 'true' in re.search(RE_IS_NOTIFYING, content).group() else False
@@ -93,36 +74,29 @@ for node_file_name in nodes:
   node_name =  re.search(RE_NODE_NAME, content).group()
   node_name = node_name[node_name.find('"')+1:node_name.rfind('"')]
 
-  txt += """
-  @staticmethod
-  def is_cacheable() -> bool:
-    return %s
-  
-  @staticmethod
-  def is_notifying() -> bool:
-    return %s
-
-  @staticmethod
-  def is_readonly() -> bool:
-    return %s
-  
-  @staticmethod
-  def get_name() -> str:
-    return '%s'
-  
-  def get_prototype(self) -> str:
-    return self.prototype\n
-""" % (cacheable, notifying, readonly, node_name)
-  txt_elements[node_name] = txt
-  print(txt)
+  table_elements[node_name] = (class_name, ext_class, 
+    (0x01 if cacheable else 0) | (0x02 if notifying else 0) | (0x04 if readonly else 0), 
+    args, labels
+  )
+  print('  - %s: %s' % (node_name, table_elements[node_name]))
 
+# The node classes in nodes.py are created from this table when they are
+# accessed for the first time.
 base_path = input('[~] Choose a folder to save the code: ')
-with open(base_path + 'nodes.py', 'w') as _res:
+with open(base_path + 'nodetable.py', 'w') as _res:
   txt = """# This code was generated from JAVA source code
-# DO NOT CHANGE\nfrom .basenode import *\n"""
+# DO NOT CHANGE
+NODE_CACHEABLE = 0x01
+NODE_NOTIFYING = 0x02
+NODE_READONLY  = 0x04
+
+# <node name>: (<class name>, <base class>, <flags>, <list arguments>, <enum values>)
+#
+# List arguments are stored as (<name>, <length>, <data type>) and enum values
+# are numbered by their position.
+NODE_TABLE = {
+  'CREATE_SESSION': ('BaseCreateSession', 'NodeC', 0, None, None),\n"""
   _res.write(txt)
-  for node_name in txt_elements:
-    _res.write('\n' + txt_elements[node_name])
-    
-
-
+  for node_name in table_elements:
+    _res.write('  %r: %r,\n' % (node_name, table_elements[node_name]))
+  _res.write('}\n')
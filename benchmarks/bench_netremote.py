@@ -0,0 +1,188 @@
+"""
+Measures the latency and throughput of ``netremote_request`` against the
+local stand-in server (see ``fsapi_server.py``) or a given host.
+
+Workloads:
+  get     GET of netRemote.sys.audio.volume
+  set     SET of netRemote.sys.audio.volume
+  list    LIST_GET_NEXT of one page of netRemote.nav.presets
+  sweep   GET of all value nodes, one node per operation
+
+Modes:
+  unpooled  one request at a time, each on a new connection (``Connection:
+            close``) like the client before connections were kept alive
+  pooled    one request at a time with an own FSNetConfiguration
+  async     concurrent requests from asyncio tasks running the pooled client
+            in a thread pool (the client itself is blocking)
+
+In addition, the cost of the client-side steps of a request (URL building,
+the lookup of the default transport, XML parsing and node construction) is
+measured without any network access.
+
+    $ python3 benchmarks/bench_netremote.py [-n N] [-c CONCURRENCY] [--json FILE]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import timeit
+
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fsapi.all as fsapi
+from fsapi.netremote.radiohttp import _get_url_path
+from fsapi_server import StandInServer
+
+WORKLOADS = ['get', 'set', 'list', 'sweep']
+MODES = ['unpooled', 'pooled', 'async']
+
+def percentile(values: list, fraction: float) -> float:
+  # Nearest-rank percentile of sorted values
+  index = max(0, min(len(values) - 1, int(round(fraction * len(values) + 0.5)) - 1))
+  return values[index]
+
+def create_operation(workload: str, radio: fsapi.RadioHttp, netconfig):
+  registry = fsapi.get_node_registry()
+  if workload == 'get':
+    node_class = registry['netRemote.sys.audio.volume']
+    return lambda i: fsapi.netremote_request(fsapi.GET, node_class, radio, netconfig)
+  if workload == 'set':
+    node_class = registry['netRemote.sys.audio.volume']
+    return lambda i: fsapi.netremote_request(fsapi.SET, node_class, radio, netconfig,
+                                             {'value': i % 20})
+  if workload == 'list':
+    node_class = registry['netRemote.nav.presets']
+    return lambda i: fsapi.netremote_request(fsapi.LIST_GET_NEXT, node_class, radio, netconfig,
+                                             {'maxItems': 20})
+  if workload == 'sweep':
+    node_types = list(registry.types(list_only=False).values())
+    return lambda i: fsapi.netremote_request(fsapi.GET, node_types[i % len(node_types)],
+                                             radio, netconfig)
+  raise ValueError('Unknown workload: %s' % workload)
+
+def timed(operation, i: int) -> float:
+  start = time.perf_counter()
+  operation(i)
+  return time.perf_counter() - start
+
+def run_sequential(operation, number: int) -> list:
+  return [timed(operation, i) for i in range(number)]
+
+def run_async(operation, number: int, concurrency: int) -> list:
+  async def main() -> list:
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+      semaphore = asyncio.Semaphore(concurrency)
+      async def task(i: int) -> float:
+        async with semaphore:
+          return await loop.run_in_executor(executor, timed, operation, i)
+      return await asyncio.gather(*(task(i) for i in range(number)))
+  return asyncio.run(main())
+
+def summarize(latencies: list, wall: float) -> dict:
+  values = sorted(latencies)
+  return {
+    'requests': len(values),
+    'p50_ms': percentile(values, 0.50) * 1e3,
+    'p95_ms': percentile(values, 0.95) * 1e3,
+    'p99_ms': percentile(values, 0.99) * 1e3,
+    'mean_ms': sum(values) / len(values) * 1e3,
+    'throughput_rps': len(values) / wall
+  }
+
+def run(host: str, number: int, concurrency: int, workloads: list = None,
+        modes: list = None) -> dict:
+  radio = fsapi.RadioHttp(host)
+  pooled = fsapi.FSNetConfiguration(maxsize=concurrency)
+  # The server closes the connection after each response
+  unpooled = fsapi.FSNetConfiguration(headers={'Connection': 'close'})
+  results = {}
+  for workload in workloads or WORKLOADS:
+    for mode in modes or MODES:
+      netconfig = unpooled if mode == 'unpooled' else pooled
+      operation = create_operation(workload, radio, netconfig)
+      operation(0) # warm-up
+
+      start = time.perf_counter()
+      if mode == 'async':
+        latencies = run_async(operation, number, concurrency)
+      else:
+        latencies = run_sequential(operation, number)
+      results['%s/%s' % (workload, mode)] = summarize(latencies, time.perf_counter() - start)
+  return results
+
+def run_phases(number: int) -> dict:
+  # Client-side steps of a single GET request, without network access
+  node_class = fsapi.get_node_type('netRemote.sys.info.friendlyName')
+  radio = fsapi.RadioHttp('127.0.0.1')
+  content = (b'<fsapiResponse><status>FS_OK</status><value><c8_array>Radio'
+             b'</c8_array></value></fsapiResponse>')
+  phases = {
+    'url': lambda: 'http://%s%s?pin=%s' % (radio.host, _get_url_path(fsapi.GET, node_class),
+                                          radio.pin),
+    'netconfig': lambda: fsapi.get_default_netconfig().get_pool(),
+    'parsexml': lambda: fsapi.ApiResponse(node_class).parsexml(content),
+    'node': node_class,
+  }
+  return {
+    name: min(timeit.repeat(phase, number=number, repeat=5)) / number * 1e6
+    for name, phase in phases.items()
+  }
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description="NetRemote client benchmark")
+  parser.add_argument('-n', '--number', type=int, default=500,
+    help="Number of requests per workload and mode (default 500)."
+  )
+  parser.add_argument('-c', '--concurrency', type=int, default=8,
+    help="Number of concurrent requests in async mode (default 8)."
+  )
+  parser.add_argument('-w', '--workload', action='append', choices=WORKLOADS,
+    help="The workloads to run (default: all)."
+  )
+  parser.add_argument('-m', '--mode', action='append', choices=MODES,
+    help="The modes to run (default: all)."
+  )
+  parser.add_argument('--host', type=str, default=None,
+    help="Runs against the given host instead of the local stand-in server."
+  )
+  parser.add_argument('--delay', type=float, default=0.0, metavar='MS',
+    help="Response delay of the stand-in server in milliseconds."
+  )
+  parser.add_argument('--json', type=str, default=None, metavar='FILE',
+    help="Saves the results in JSON-format."
+  )
+  nspace = parser.parse_args()
+
+  server = None
+  host = nspace.host
+  if not host:
+    server = StandInServer(delay=nspace.delay / 1000).start()
+    host = server.host
+
+  try:
+    results = run(host, nspace.number, nspace.concurrency, nspace.workload, nspace.mode)
+  finally:
+    if server: server.stop()
+  phases = run_phases(2000)
+
+  print('%-16s %8s %9s %9s %9s %10s' % ('workload/mode', 'requests', 'p50[ms]', 'p95[ms]',
+                                        'p99[ms]', 'req/s'))
+  for name, result in results.items():
+    print('%-16s %8d %9.3f %9.3f %9.3f %10.1f' % (
+      name, result['requests'], result['p50_ms'], result['p95_ms'], result['p99_ms'],
+      result['throughput_rps']
+    ))
+  print()
+  print('%-16s %9s' % ('phase', 'time[us]'))
+  for name, value in phases.items():
+    print('%-16s %9.2f' % (name, value))
+
+  if nspace.json:
+    with open(nspace.json, 'w') as fp:
+      json.dump({'host': host, 'number': nspace.number, 'concurrency': nspace.concurrency,
+                 'results': results, 'phases': phases}, fp, indent=2)
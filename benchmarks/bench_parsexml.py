@@ -0,0 +1,106 @@
+"""
+Compares ``ApiResponse.parsexml`` against the implementation it replaced
+(``fromstring()`` followed by ``find()`` lookups) using the recorded responses
+in ``tests/responses``. The name of each response file is the name of the node
+it was recorded from.
+
+    $ python3 benchmarks/bench_parsexml.py [--number N] [--repeat R] [--json FILE]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import fsapi.all as fsapi
+from xml.etree import ElementTree as xmltree
+
+RESPONSES_DIR = os.path.join(ROOT, 'tests', 'responses')
+
+def legacy_parsexml(api_response: fsapi.ApiResponse, content: bytes, as_list: bool = False):
+  # ApiResponse.parsexml and NodeList.loadxml as they were before the single
+  # pass parser, kept here as the reference for this benchmark. List items are
+  # stored as NodeListItem objects in a plain list.
+  api_response.xml_root = xmltree.fromstring(content)
+  api_response.status = api_response.xml_root.find('status').text
+  if api_response.status != 'FS_OK':
+    return
+
+  api_response.content = api_response.node_class()
+  prototype = api_response.content.get_prototype()
+  if not as_list:
+    if 'CreateSession' in api_response.node_class.__name__:
+      api_response.content.value = api_response.xml_root.find('sessionId').text
+    else:
+      value = api_response.xml_root.find('value')
+      if value:
+        for i, argument in enumerate(prototype):
+          api_response.content.value = value[i].text
+          api_response.content.update()
+  else:
+    items = []
+    for item in api_response.xml_root.findall('item'):
+      node_item = fsapi.NodeListItem()
+      node_item.attr['key'] = item.get('key', None)
+      for field_node in item.findall('field'):
+        node_item.attr[field_node.attrib['name']] = field_node[0].text
+      items.append(node_item)
+    return items
+
+def load_responses() -> list:
+  node_types = fsapi.get_all_node_types()
+  responses = []
+  for name in sorted(os.listdir(RESPONSES_DIR)):
+    node = name[:-4]
+    if not name.endswith('.xml') or node not in node_types:
+      continue
+    with open(os.path.join(RESPONSES_DIR, name), 'rb') as fp:
+      responses.append((node_types[node], fp.read()))
+  return responses
+
+def run(number: int, repeat: int = 5) -> dict:
+  results = {}
+  for node_class, content in load_responses():
+    as_list = bool(fsapi.is_list_class(node_class))
+    legacy = min(timeit.repeat(
+      lambda: legacy_parsexml(fsapi.ApiResponse(node_class), content, as_list),
+      number=number, repeat=repeat
+    ))
+    current = min(timeit.repeat(
+      lambda: fsapi.ApiResponse(node_class).parsexml(content, as_list),
+      number=number, repeat=repeat
+    ))
+    results[node_class.get_name()] = {
+      'size': len(content),
+      'legacy_us': legacy / number * 1e6,
+      'current_us': current / number * 1e6,
+      'speedup': legacy / current
+    }
+  return results
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description="ApiResponse.parsexml benchmark")
+  parser.add_argument('-n', '--number', type=int, default=2000,
+    help="Number of parse operations per response (default 2000)."
+  )
+  parser.add_argument('-r', '--repeat', type=int, default=5,
+    help="Number of repetitions, the fastest one is reported (default 5)."
+  )
+  parser.add_argument('--json', type=str, default=None, metavar='FILE',
+    help="Saves the results in JSON-format."
+  )
+  nspace = parser.parse_args()
+
+  results = run(nspace.number, nspace.repeat)
+  print('%-36s %8s %12s %12s %8s' % ('node', 'bytes', 'legacy[us]', 'current[us]', 'speedup'))
+  for name, result in results.items():
+    print('%-36s %8d %12.2f %12.2f %7.2fx' % (
+      name, result['size'], result['legacy_us'], result['current_us'], result['speedup']
+    ))
+
+  if nspace.json:
+    with open(nspace.json, 'w') as fp:
+      json.dump(results, fp, indent=2)
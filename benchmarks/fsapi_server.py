@@ -0,0 +1,178 @@
+"""
+A local stand-in for the NetRemote API of a radio. It answers GET, SET,
+LIST_GET_NEXT, CREATE_SESSION and DELETE_SESSION requests for all nodes of
+the node table, so the client can be benchmarked without a device:
+
+    $ python3 benchmarks/fsapi_server.py [--port PORT] [--items N] [--delay MS]
+
+Values are generated from the node definitions and SET requests update the
+stored value. Nodes given in ``unsupported`` return FS_NODE_DOES_NOT_EXIST and
+a fraction of all node requests (``timeout_rate``) returns FS_TIMEOUT to simulate
+a flaky device.
+"""
+import argparse
+import random
+import threading
+import time
+
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from xml.sax.saxutils import escape
+
+from fsapi.netremote.basenode import *
+from fsapi.netremote.nodetable import NODE_TABLE, NODE_READONLY
+
+VALUE_TAGS = {
+  'NodeC': 'c8_array', 'NodeU': 'array', 'NodeE8': 'e8',
+  'NodeU8': 'u8', 'NodeU16': 'u16', 'NodeU32': 'u32',
+  'NodeS8': 's8', 'NodeS16': 's16', 'NodeS32': 's32',
+}
+
+# Tags of the list arguments by NodeArg.data_type
+ARG_TAGS = {
+  ARG_TYPE_C: 'c8_array', ARG_TYPE_E8: 'e8', ARG_TYPE_U8: 'u8', ARG_TYPE_U16: 'u16',
+  ARG_TYPE_U32: 'u32', ARG_TYPE_S8: 's8', ARG_TYPE_S16: 's16', ARG_TYPE_S32: 's32',
+  ARG_TYPE_U: 'array'
+}
+
+def _response(status: str, body: str = '') -> bytes:
+  return ('<fsapiResponse><status>%s</status>%s</fsapiResponse>' % (status, body)).encode()
+
+class StandInHandler(BaseHTTPRequestHandler):
+  protocol_version = 'HTTP/1.1'
+  disable_nagle_algorithm = True
+
+  def log_message(self, format, *args):
+    pass
+
+  def do_GET(self):
+    server: StandInServer = self.server
+    if server.delay: time.sleep(server.delay)
+
+    url = urlparse(self.path)
+    query = {key: values[0] for key, values in parse_qs(url.query).items()}
+    parts = url.path.split('/')
+    method = parts[2] if len(parts) > 2 else ''
+    node = parts[3] if len(parts) > 3 else None
+
+    if query.get('pin') != server.pin:
+      self.send_error(403)
+      return
+
+    if method == 'CREATE_SESSION':
+      body = _response('FS_OK', '<sessionId>%d</sessionId>' % server.session_id)
+    elif method == 'DELETE_SESSION':
+      body = _response('FS_OK')
+    elif node not in NODE_TABLE or node in server.unsupported:
+      body = _response('FS_NODE_DOES_NOT_EXIST')
+    elif server.timeout_rate and random.random() < server.timeout_rate:
+      body = _response('FS_TIMEOUT')
+    elif method == 'GET':
+      body = _response('FS_OK', server.get_value(node))
+    elif method == 'SET':
+      body = server.set_value(node, query.get('value'))
+    elif method in ('LIST_GET_NEXT', 'LIST_GET'):
+      body = server.get_list(node, int(parts[4]), int(query.get('maxItems', 10)))
+    else:
+      body = _response('FS_FAIL')
+
+    with server.lock: server.requests += 1
+    self.send_response(200)
+    self.send_header('Content-Type', 'text/xml')
+    self.send_header('Content-Length', str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+class StandInServer(ThreadingHTTPServer):
+  '''The stand-in server (listening on ``127.0.0.1``).
+
+  :param port: the port to bind (default ``0`` for a free port)
+  :param items: the amount of items of each list node
+  :param delay: the delay of each response in seconds
+  :param unsupported: node names returning FS_NODE_DOES_NOT_EXIST
+  :param pin: the expected PIN
+  :param timeout_rate: the fraction of node requests answered with FS_TIMEOUT
+  '''
+  daemon_threads = True
+
+  def __init__(self, port: int = 0, items: int = 100, delay: float = 0.0,
+               unsupported: set = None, pin: str = '1234', timeout_rate: float = 0.0) -> None:
+    super().__init__(('127.0.0.1', port), StandInHandler)
+    self.items = items
+    self.delay = delay
+    self.unsupported = set(unsupported or ())
+    self.pin = pin
+    self.timeout_rate = timeout_rate
+    self.session_id = 1
+    self.values = {'netRemote.sys.info.version': 'ir-mmi-FS2026-0500-0015_V2.5.15.EX44478-1B9'}
+    self.lock = threading.Lock()
+    self.requests = 0
+
+  @property
+  def host(self) -> str:
+    return '%s:%d' % self.server_address[:2]
+
+  def start(self) -> 'StandInServer':
+    threading.Thread(target=self.serve_forever, daemon=True).start()
+    return self
+
+  def stop(self) -> None:
+    self.shutdown()
+    self.server_close()
+
+  def get_value(self, node: str) -> str:
+    tag = VALUE_TAGS[NODE_TABLE[node][1]]
+    value = self.values.get(node)
+    if value is None:
+      value = 'value' if tag in ('c8_array', 'array') else '0'
+    return '<value><%s>%s</%s></value>' % (tag, escape(str(value)), tag)
+
+  def set_value(self, node: str, value: str) -> bytes:
+    if NODE_TABLE[node][2] & NODE_READONLY or value is None:
+      return _response('FS_PACKET_BAD')
+    self.values[node] = value
+    return _response('FS_OK')
+
+  def get_list(self, node: str, start_key: int, max_items: int) -> bytes:
+    args = NODE_TABLE[node][3]
+    if not args:
+      return _response('FS_FAIL')
+
+    keys = range(max(start_key + 1, 0), min(start_key + 1 + max_items, self.items))
+    if not keys:
+      return _response('FS_LIST_END')
+
+    items = []
+    for key in keys:
+      fields = []
+      for name, length, data_type in args:
+        if name == 'key': continue
+        tag = ARG_TAGS.get(data_type, 'c8_array')
+        text = '%s %d' % (name, key) if tag in ('c8_array', 'array') else str(key % 100)
+        fields.append('<field name="%s"><%s>%s</%s></field>' % (name, tag, text, tag))
+      items.append('<item key="%d">%s</item>' % (key, ''.join(fields)))
+    if keys[-1] == self.items - 1:
+      items.append('<listend/>')
+    return _response('FS_OK', ''.join(items))
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description="NetRemote stand-in server")
+  parser.add_argument('-p', '--port', type=int, default=8080)
+  parser.add_argument('--items', type=int, default=100,
+    help="Number of items of each list node (default 100)."
+  )
+  parser.add_argument('--delay', type=float, default=0.0, metavar='MS',
+    help="Delay of each response in milliseconds."
+  )
+  parser.add_argument('--timeout-rate', type=float, default=0.0, metavar='RATE',
+    help="Fraction of node requests answered with FS_TIMEOUT (default 0)."
+  )
+  nspace = parser.parse_args()
+
+  server = StandInServer(nspace.port, nspace.items, nspace.delay / 1000,
+                         timeout_rate=nspace.timeout_rate)
+  print('Serving NetRemote on %s' % server.host)
+  try:
+    server.serve_forever()
+  except KeyboardInterrupt:
+    server.server_close()
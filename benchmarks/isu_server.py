@@ -0,0 +1,229 @@
+"""
+A local stand-in for the firmware update servers. Files are served from
+memory under their URL path, e.g. ``/srupdates/srupdates/<c>/<name>.isu.bin``.
+Requests to ``/Update.aspx?f=<path>`` are answered with the file at <path>
+and ``/FindUpdate.aspx`` answers with the entries of ``updates`` (404 for an
+unknown customisation or version, 304 if there is no update). These answers
+carry an ETag and ``Cache-Control: max-age`` (``max_age``) and conditional
+requests with a matching ``If-None-Match`` are answered with 304 as well:
+
+    $ python3 benchmarks/isu_server.py [--port PORT] [--files N] [--size BYTES]
+
+GET and HEAD requests are supported, as well as single byte ranges. Connections
+are kept alive, so clients reusing connections can be told apart from clients
+opening a new connection per request (see ``connections``). ``drop_after``
+cuts each response body after the given amount of bytes to test resuming.
+"""
+import argparse
+import hashlib
+import os
+import re
+import sys
+import threading
+import time
+
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+class ISUHandler(BaseHTTPRequestHandler):
+  protocol_version = 'HTTP/1.1'
+  disable_nagle_algorithm = True
+
+  def log_message(self, format, *args):
+    pass
+
+  def setup(self):
+    super().setup()
+    with self.server.lock: self.server.connections += 1
+
+  def do_HEAD(self):
+    self.handle_request(head=True)
+
+  def do_GET(self):
+    self.handle_request(head=False)
+
+  def handle_find_update(self, query: dict):
+    server: ISUServer = self.server
+    with server.lock: server.find_requests += 1
+    key = (query.get('customisation', [''])[0], query.get('version', [''])[0])
+    if key not in server.updates:
+      status, body = 404, b''
+    elif not server.updates[key]:
+      status, body = 304, b''
+    else:
+      status, body = 200, create_update_xml(server.updates[key]).encode('utf-8')
+
+    etag = '"%s"' % hashlib.md5(body).hexdigest()
+    if status == 200 and self.headers.get('If-None-Match') == etag:
+      status, body = 304, b''
+      with server.lock: server.not_modified += 1
+
+    self.send_response(status)
+    if status != 404:
+      self.send_header('ETag', etag)
+      self.send_header('Cache-Control', 'max-age=%d' % server.max_age)
+    if status == 200:
+      self.send_header('Content-Type', 'text/xml')
+    if status != 304:
+      self.send_header('Content-Length', str(len(body)))
+    self.end_headers()
+    if body and self.command != 'HEAD':
+      self.wfile.write(body)
+
+  def get_path(self) -> str:
+    url = urlparse(self.path)
+    if url.path.lower() == '/update.aspx':
+      return parse_qs(url.query).get('f', [''])[0]
+    return url.path
+
+  def handle_request(self, head: bool):
+    server: ISUServer = self.server
+    if server.delay: time.sleep(server.delay)
+    with server.lock: server.requests += 1
+
+    url = urlparse(self.path)
+    if url.path.lower() == '/findupdate.aspx':
+      self.handle_find_update(parse_qs(url.query))
+      return
+
+    data = server.files.get(self.get_path())
+    if data is None:
+      self.send_response(404)
+      self.send_header('Content-Length', '0')
+      self.end_headers()
+      return
+
+    status, size = 200, len(data)
+    match = re.match(r"bytes=(\d*)-(\d*)$", self.headers.get('Range', ''))
+    if match and (match.group(1) or match.group(2)):
+      first, last = match.groups()
+      if not first:
+        first, last = max(0, size - int(last)), size - 1
+      else:
+        first, last = int(first), min(int(last), size - 1) if last else size - 1
+      if first >= size or first > last:
+        self.send_response(416)
+        self.send_header('Content-Range', 'bytes */%d' % size)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+        return
+      status, data = 206, data[first:last + 1]
+
+    self.send_response(status)
+    self.send_header('Content-Type', 'application/octet-stream')
+    self.send_header('Content-Length', str(len(data)))
+    self.send_header('Accept-Ranges', 'bytes')
+    if status == 206:
+      self.send_header('Content-Range', 'bytes %d-%d/%d' % (first, last, size))
+    self.end_headers()
+    if not head:
+      self.send_body(data)
+
+  def send_body(self, data: bytes):
+    drop_after = self.server.drop_after
+    if drop_after and len(data) > drop_after:
+      # Simulates an interrupted transfer
+      data = data[:drop_after]
+      self.close_connection = True
+
+    rate = self.server.rate
+    if not rate:
+      self.wfile.write(data)
+      return
+    # Limits the bandwidth of each connection to simulate a slow link
+    chunk_size = max(1024, rate // 20)
+    for offset in range(0, len(data), chunk_size):
+      self.wfile.write(data[offset:offset + chunk_size])
+      time.sleep(chunk_size / rate)
+
+class ISUServer(ThreadingHTTPServer):
+  '''The stand-in server (listening on ``127.0.0.1``).
+
+  :param files: the served files by URL path
+  :param port: the port to bind (default ``0`` for a free port)
+  :param delay: the delay of each response in seconds
+  :param rate: the bandwidth of each connection in bytes per second (``0`` for no limit)
+  :param drop_after: the amount of bytes after which each response body is cut off
+                     (``0`` to send complete responses)
+  :param updates: the answers of ``FindUpdate.aspx`` by ``(customisation, version)``. Each
+                  value is a list of dictionaries with the attributes of a software
+                  element (an empty list for "no update").
+  :param max_age: the freshness lifetime of ``FindUpdate.aspx`` answers in seconds
+  '''
+  daemon_threads = True
+
+  def __init__(self, files: dict = None, port: int = 0, delay: float = 0.0,
+               rate: int = 0, drop_after: int = 0, updates: dict = None,
+               max_age: int = 0) -> None:
+    super().__init__(('127.0.0.1', port), ISUHandler)
+    self.files = dict(files or {})
+    self.delay = delay
+    self.rate = rate
+    self.drop_after = drop_after
+    self.updates = dict(updates or {})
+    self.find_requests = 0
+    self.not_modified = 0
+    self.max_age = max_age
+    self.lock = threading.Lock()
+    self.requests = 0
+    self.connections = 0
+
+  def handle_error(self, request, client_address) -> None:
+    # Clients aborting a transfer are expected, e.g. after a failed verification
+    if not isinstance(sys.exc_info()[1], ConnectionError):
+      super().handle_error(request, client_address)
+
+  @property
+  def base_url(self) -> str:
+    return 'http://%s:%d' % self.server_address[:2]
+
+  def start(self) -> 'ISUServer':
+    threading.Thread(target=self.serve_forever, daemon=True).start()
+    return self
+
+  def stop(self) -> None:
+    self.shutdown()
+    self.server_close()
+
+def create_update_xml(updates: list) -> str:
+  # The layout of a FindUpdate.aspx response
+  lines = ['<?xml version="1.0" encoding="UTF-8"?>', '<updates>']
+  for update in updates:
+    lines.append('<software customisation="%s" version="%s">' % (
+      update['customisation'], update['version']))
+    for name in ('download', 'mandatory', 'product', 'size', 'md5', 'summary', 'vendor'):
+      lines.append('<%s>%s</%s>' % (name, update.get(name, ''), name))
+    lines.append('</software>')
+  lines.append('</updates>')
+  return '\n'.join(lines)
+
+def create_files(count: int, size: int) -> dict:
+  # Random firmware files in the layout of the update servers
+  files = {}
+  for i in range(count):
+    name = 'ir-mmi-FS2026-0500-%04d_V2.12.25c.EX72088-1A12' % i
+    files['/updates/%s.isu.bin' % name.replace('_V', '.')] = os.urandom(size)
+  return files
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description="Firmware update stand-in server")
+  parser.add_argument('-p', '--port', type=int, default=8081)
+  parser.add_argument('--files', type=int, default=20,
+    help="Number of generated firmware files (default 20)."
+  )
+  parser.add_argument('--size', type=int, default=0x100000,
+    help="Size of each generated file in bytes (default 1 MiB)."
+  )
+  parser.add_argument('--rate', type=int, default=0,
+    help="Bandwidth of each connection in bytes per second (default unlimited)."
+  )
+  nspace = parser.parse_args()
+
+  server = ISUServer(create_files(nspace.files, nspace.size), nspace.port, rate=nspace.rate)
+  print('Serving %d files on %s' % (len(server.files), server.base_url))
+  for path in server.files:
+    print('  %s%s' % (server.base_url, path))
+  try:
+    server.serve_forever()
+  except KeyboardInterrupt:
+    server.server_close()
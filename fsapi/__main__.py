@@ -24,7 +24,7 @@ import os
 import re
 
 from . import all as fsapi
-from json import dump
+from json import dump, dumps
 from time import sleep, time
 
 RE_IPV4 = r"^\d{1,3}(.\d{1,3}){3}$"
@@ -47,14 +47,33 @@ def delegate_explore(args: dict, radio: fsapi.RadioHttp):
 
   results = {}
   node_types = fsapi.get_all_node_types()
-  for name in node_types:
+  names = list(node_types)
+
+  cache, version = None, None
+  if not args['no_cache']:
+    cache = fsapi.CapabilityCache(args['cache'])
+    version = fsapi.get_device_version(radio, parameters={'sid': sid})
+    names = cache.filter(version, names)
+    if verbose and len(names) != len(node_types): 
+      print('[+] Skipping %d unsupported node(s) of: %s' % (len(node_types) - len(names), version))
+
+    # Skipped nodes stay in the result, marked as answered by the cache
+    status = 'FS_NODE_DOES_NOT_EXIST'
+    if args['json'] and status not in exclude:
+      for name in cache.get_unsupported(version) & set(node_types):
+        results[name] = {'status': status, 'result': '', 'cached': True}
+
+  for name in names:
     node_type = node_types[name]
     if fsapi.is_list_class(node_type):
-      result = fsapi.netremote_request('LIST_GET_NEXT', node_type, radio, 
-                                       parameters={'maxItems': 100, 'sid': sid})
+      pages = fsapi.netremote_list_pages(node_type, radio, parameters={'sid': sid})
+      result = next(pages)
+      for page in pages:
+        result.content.get_items().extend(page.content.get_items())
     else: 
       result = fsapi.netremote_request('GET', node_type, radio, parameters={'sid': sid})
 
+    if cache: cache.record(version, name, result.status)
     if result.status not in exclude:
       if args['json']:
         results[node_type.get_name()] = {
@@ -63,6 +82,10 @@ def delegate_explore(args: dict, radio: fsapi.RadioHttp):
         }
       if verbose: print('  - %s --> %s' % (node_type.get_name(), result.status))
 
+  if cache and cache.modified:
+    cache.save()
+    if verbose: print('\n[+] Updated capability cache:', cache.path)
+
   if args['json']:
     name = 'fsapi_exploration-%s.json' % time()
     with open(name, 'w') as _res:
@@ -71,6 +94,7 @@ def delegate_explore(args: dict, radio: fsapi.RadioHttp):
 
 def delegate_isu(args: dict, radio: fsapi.RadioHttp):
   verbose = args['verbose']
+  store = fsapi.FirmwareStore(args['store']) if args['store'] else None
   
   if args['find']:
     # REVISIT: add not null checks
@@ -78,7 +102,10 @@ def delegate_isu(args: dict, radio: fsapi.RadioHttp):
     version = fsapi.netremote_request('GET', fsapi.nodes.BaseSysInfoVersion, radio).content.value
     
     values = version.split('_V')
-    result = fsapi.isu_find_update(mac, values[0], values[1], verbose)
+    software = None
+    cache = fsapi.UpdateCache(args['cache']) if not args['no_cache'] else None
+    result = fsapi.isu_find_update(mac, values[0], values[1], verbose, cache=cache)
+    if cache and cache.modified: cache.save()
     if not result or not result['update_present']:
       print('\n[+] Generating current URL...')
       sleep(1)
@@ -91,13 +118,34 @@ def delegate_isu(args: dict, radio: fsapi.RadioHttp):
       for update in result['updates']:
         print("    -", update)
         url = update.download_url
+        software = update
 
     path = args['collect']
     if path:
       if path == '_': path = version
       if verbose: print('\n[+] Downloading update file to: %s.isu.bin' % path)
-      fsapi.isu_get_update(args['collect'] + 'isu.bin', url, verbose=verbose)
+      fsapi.isu_get_update(args['collect'] + 'isu.bin', url, software, verbose=verbose, store=store)
       if verbose: print('[+] Download complete')
+  elif args['crawl']:
+    path = args['target']
+    customisation, _, template = args['crawl'].partition('_V')
+    if not template:
+      print('[-] Invalid template (expected <customisation>_V<version template>):', args['crawl'])
+      return
+
+    known = fsapi.load_catalogue(path)
+    crawler = fsapi.ISUCrawler(args['workers'], rate=args['rate'])
+    start = time()
+    hits = crawler.crawl(customisation, template, known)
+    if verbose:
+      print('[+] Checked %d versions in %.1fs' % (crawler.checked, time() - start))
+      if crawler.skipped:
+        print('[-] Skipped %d malformed versions' % crawler.skipped)
+    for name, url in hits:
+      print("    -", name)
+      if verbose: print('     ::url "%s"' % url)
+    added = fsapi.save_catalogue(path, [name for name, _ in hits])
+    print('[+] Added %d new firmware names to: %s' % (added, path))
   elif args['file']:
     path = args['target']
     if verbose: print('\n[+] Downloading updates located in file: %s' % path)
@@ -105,30 +153,54 @@ def delegate_isu(args: dict, radio: fsapi.RadioHttp):
     try: os.mkdir('isu-download')
     except Exception: pass
     
-    for _firmware in open(path, 'r').read().split('\n'):
-      if not _firmware: continue
-      
-      url = fsapi.isu_new_url(_firmware)
+    names = [x for x in open(path, 'r').read().split('\n') if x]
+    urls = {}
+    if args['probe']:
+      prober = fsapi.ISUProber(cache_path=fsapi.PROBE_CACHE_PATH)
+      urls = prober.probe(names)
+      if prober.modified: prober.save()
+      if verbose: print('[+] Found %d/%d download locations' % (sum(map(bool, urls.values())), len(urls)))
+
+    tasks = []
+    for _firmware in names:
+      url = urls.get(_firmware) if args['probe'] else fsapi.isu_new_url(_firmware)
       if not url:
-        if verbose: print('[-] Could not create download URL')
+        if verbose: print('[-] Could not create download URL for:', _firmware)
         continue
-      
-      if verbose: 
-        print(' > Donwload of: isu-download/%s.isu.bin' % _firmware)
-        print('     ::url "%s"' % url)
-      fsapi.isu_get_update('isu-download/%s.isu.bin' % _firmware, url, verbose=verbose)
-      print()
+      software = None
+      if '_V' in _firmware:
+        customisation, version = _firmware.split('_V', 1)
+        software = fsapi.ISUSoftwareElement(customisation, version, url)
+      tasks.append(fsapi.DownloadTask(url, 'isu-download/%s.isu.bin' % _firmware, software))
+
+    def print_progress(progress: fsapi.DownloadProgress):
+      print('\r     ::progress %s' % progress, end='', flush=True)
+
+    downloader = fsapi.ISUDownloader(args['workers'], progress=print_progress if verbose else None,
+                                     store=store)
+    failed, cached = [], 0
+    for result in downloader.download(tasks):
+      if result.error: failed.append(result)
+      if result.cached: cached += 1
+    
+    if verbose: print()
+    if verbose and store: print('[+] Taken from the firmware store: %d/%d' % (cached, len(tasks)))
+    for result in failed:
+      print('[-] Download of %s failed: %s' % (result.path, result.error))
+      if verbose: print('     ::url "%s"' % result.url)
+      if verbose and result.size:
+        print('     ::received %d of %s bytes' % (result.size, result.expected or '?'))
     if verbose: print('[+] Download complete')
 
 def delegate_get(args: dict, radio: fsapi.RadioHttp):
-  node_types = fsapi.get_all_node_types()
   node = args['node']
+  node_type = fsapi.get_node_type(node)
   
-  if node not in node_types:
+  if node_type is None:
     print('[-] Undefined node:', node)
     exit(0)
 
-  result = fsapi.netremote_request(fsapi.GET, node_types[node], radio)
+  result = fsapi.netremote_request(fsapi.GET, node_type, radio)
   if result:
     print_result(node, result)
     if result.status == 'FS_OK':
@@ -141,12 +213,12 @@ def print_result(node, result):
     print('     - status: %s' % (result.status))
 
 def delegate_set(args: dict, radio: fsapi.RadioHttp):
-  node_types = fsapi.get_all_node_types()
   node = args['node']
+  node_type = fsapi.get_node_type(node)
 
-  if node not in node_types:
+  if node_type is None:
     print('[-] Unknown node class')
-  elif node_types[node].is_readonly():
+  elif node_type.is_readonly():
     print('[-] Node is set to be read only. A SET-request is not possible.')
   else:
     params = {}
@@ -154,7 +226,11 @@ def delegate_set(args: dict, radio: fsapi.RadioHttp):
       name, value = key.split(':')
       params[name] = value
     
-    result = fsapi.netremote_request(fsapi.SET, node_types[node], radio, parameters=params)
+    try:
+      result = fsapi.netremote_request(fsapi.SET, node_type, radio, parameters=params)
+    except fsapi.NodeValueError as error:
+      print('[-] Invalid value:', error)
+      return
     if result:
       print("[+] fsapiResponse of %s:" % node)
       print('     - status: %s' % (result.status))
@@ -162,10 +238,10 @@ def delegate_set(args: dict, radio: fsapi.RadioHttp):
       print('[-] Failed to read response or to fetch url.')
 
 def delegate_list(args: dict, radio: fsapi.RadioHttp):
-  node_types = fsapi.get_all_node_types()
   node = args['node']
+  node_type = fsapi.get_node_type(node)
 
-  if node not in node_types:
+  if node_type is None:
     print('[-] Unknown node class')
   else:
     params = {}
@@ -173,17 +249,72 @@ def delegate_list(args: dict, radio: fsapi.RadioHttp):
       name, value = key.split(':')
       params[name] = value
     
-    result = fsapi.netremote_request(fsapi.LIST_GET_NEXT, node_types[node], radio, parameters=params)
-    if result:
-      print_result(node, result)
-      if result.status == 'FS_OK':
-        result_list: fsapi.NodeList = result.content
-        print('     - list: size=%d' % (result_list.size()))
-        for item in result_list.get_items():
-          print('         | %s' % (item.attr))
-    else:
-      print('[-] Failed to read response or to fetch url.')
+    size = 0
+    for index, result in enumerate(fsapi.netremote_list_pages(node_type, radio, parameters=params)):
+      if index == 0: print_result(node, result)
+      if result.status != 'FS_OK': break
+
+      result_list: fsapi.NodeList = result.content
+      for item in result_list.get_items():
+        print('         | %s' % (item.attr))
+      size += result_list.size()
+    
+    print('     - list: size=%d' % size)
 
+def delegate_fleet(args: dict, radio: fsapi.RadioHttp):
+  target = args['target']
+  if os.path.isfile(target):
+    targets = fsapi.load_targets(target, args['pin'])
+  else:
+    targets = fsapi.expand_targets(target, args['pin'])
+
+  plan = []
+  for node in args['get'] or []:
+    plan.append(fsapi.FleetTask(fsapi.GET, node))
+  for node in args['list'] or []:
+    plan.append(fsapi.FleetTask(fsapi.LIST_GET_NEXT, node))
+  for key in args['set'] or []:
+    node, value = key.split('=', 1)
+    plan.append(fsapi.FleetTask(fsapi.SET, node, {'value': value}))
+
+  for task in plan:
+    if fsapi.get_node_type(task.node) is None:
+      print('[-] Undefined node:', task.node)
+      exit(0)
+
+  if args['verbose']: 
+    print('[+] Running %d task(s) on %d target(s)...' % (len(plan), len(targets)))
+
+  metrics = None
+  if args['metrics']:
+    metrics = fsapi.RequestMetrics(by_host=True)
+    fsapi.add_request_hook(metrics)
+
+  policy = None
+  if args['retry']:
+    policy = fsapi.RetryPolicy(budget=args['retry_budget'])
+
+  cache = None
+  if not args['no_cache']:
+    cache = fsapi.CapabilityCache(args['cache'])
+
+  executor = fsapi.FleetExecutor(args['workers'], args['per_host'], args['timeout'],
+                                 session=args['session'], retry_policy=policy,
+                                 capabilities=cache)
+  out = open(args['output'], 'w') if args['output'] else None
+  try:
+    for result in executor.run(targets, plan):
+      line = dumps(result.to_json())
+      if out: out.write(line + '\n')
+      else: print(line)
+  finally:
+    if out: out.close()
+    if cache and cache.modified: cache.save()
+    if metrics:
+      fsapi.remove_request_hook(metrics)
+      with open(args['metrics'], 'w') as fp:
+        fp.write(metrics.to_prometheus())
+      if args['verbose']: print('[+] Saved request metrics to:', args['metrics'])
 
 if __name__ == '__main__':
   parser = argparse.ArgumentParser(
@@ -202,6 +333,12 @@ if __name__ == '__main__':
   explore_parser.add_argument('-E', '--exclude', type=str, default='', required=False,
     help="Exclude the following arguments from being analysed (if more that one, separate them with a comma)"
   )
+  explore_parser.add_argument('--cache', type=str, default=fsapi.CAPABILITY_CACHE_PATH, metavar='FILE',
+    help="The cache of unsupported nodes per firmware version, which are skipped (default ~/.fsapi/capabilities.json)."
+  )
+  explore_parser.add_argument('--no-cache', action='store_true', default=False,
+    help="Queries all nodes without reading or updating the capability cache."
+  )
   explore_parser.set_defaults(func=delegate_explore)
 
   isu_parser = subparsers.add_parser('isu', help="ISU Firmware Context")
@@ -214,6 +351,28 @@ if __name__ == '__main__':
   isu_parser.add_argument('-F', '--file', action='store_true', default=False, 
     help="Collect the firmware from the specified path."
   )
+  isu_parser.add_argument('-w', '--workers', type=int, default=4,
+    help="The amount of concurrent requests (default 4, only together with --file or --crawl)."
+  )
+  isu_parser.add_argument('--crawl', type=str, default=None, metavar='TEMPLATE',
+    help="Search versions like 'ir-mmi-FS2026-0500-0549_V2.12.25{,c}.EX72088-1A{1..40}' and "
+         "append the hits to the catalogue file given as target."
+  )
+  isu_parser.add_argument('--rate', type=float, default=20.0,
+    help="The maximum amount of requests per second of --crawl (default 20)."
+  )
+  isu_parser.add_argument('--probe', action='store_true', default=False,
+    help="Check all URL variants of each firmware before downloading (only together with --file)."
+  )
+  isu_parser.add_argument('--cache', type=str, default=fsapi.UPDATE_CACHE_PATH, metavar='FILE',
+    help="The cache of update server answers used by --find (default ~/.fsapi/updates.json)."
+  )
+  isu_parser.add_argument('--no-cache', action='store_true', default=False,
+    help="Always query the update server without reading or updating the cache."
+  )
+  isu_parser.add_argument('--store', type=str, default=None, metavar='DIR',
+    help="A firmware store that is checked before and updated after each download."
+  )
   isu_parser.set_defaults(func=delegate_isu)
 
   get_parser = subparsers.add_parser('get', help="Request a simple property")
@@ -241,9 +400,51 @@ if __name__ == '__main__':
   
   list_parser.set_defaults(func=delegate_list)
 
+  fleet_parser = subparsers.add_parser('fleet', help='Run requests on many devices (target: host, CIDR or file)')
+  fleet_parser.add_argument('--get', action='append', metavar='NODE',
+    help='A node to query (can be used multiple times).'
+  )
+  fleet_parser.add_argument('--list', action='append', metavar='NODE',
+    help='A list node to query (can be used multiple times).'
+  )
+  fleet_parser.add_argument('--set', action='append', metavar='NODE=VALUE',
+    help='A value to apply (can be used multiple times).'
+  )
+  fleet_parser.add_argument('-w', '--workers', type=int, default=32,
+    help='The maximum amount of concurrent requests (default 32).'
+  )
+  fleet_parser.add_argument('--per-host', type=int, default=1,
+    help='The maximum amount of concurrent requests per device (default 1).'
+  )
+  fleet_parser.add_argument('-t', '--timeout', type=float, default=5.0,
+    help='The timeout of each request in seconds (default 5).'
+  )
+  fleet_parser.add_argument('--session', action='store_true', default=False,
+    help='Creates a session on each device before the requests are sent.'
+  )
+  fleet_parser.add_argument('-o', '--output', type=str, default=None, metavar='FILE',
+    help='Writes the results as JSON lines into the given file instead of stdout.'
+  )
+  fleet_parser.add_argument('--retry', action='store_true', default=False,
+    help='Retries requests failing with FS_TIMEOUT or a transient network error.'
+  )
+  fleet_parser.add_argument('--retry-budget', type=float, default=60.0, metavar='SECONDS',
+    help='The total time that may be spent waiting for retries (default 60).'
+  )
+  fleet_parser.add_argument('--cache', type=str, default=fsapi.CAPABILITY_CACHE_PATH, metavar='FILE',
+    help="The cache of unsupported nodes per firmware version (default ~/.fsapi/capabilities.json)."
+  )
+  fleet_parser.add_argument('--no-cache', action='store_true', default=False,
+    help="Queries all nodes without reading or updating the capability cache."
+  )
+  fleet_parser.add_argument('--metrics', type=str, default=None, metavar='FILE',
+    help='Saves the request metrics in the Prometheus text format.'
+  )
+  fleet_parser.set_defaults(func=delegate_fleet)
+
   gb_group = parser.add_argument_group('Global options')
   gb_group.add_argument('target', type=str, 
-    help="The host address in IPv4 format."
+    help="The host address in IPv4 format (fleet: address, CIDR range or target file)."
   )
   gb_group.add_argument('-W', '--pin', type=str, required=False,
     help="A PIN used by the device (default 1234).", default='1234'  
@@ -258,7 +459,7 @@ if __name__ == '__main__':
 
   if verbose: print(__BANNER__)
   if not target or not re.match(RE_IPV4, target):
-    if 'file' not in nspace and not nspace['file']:
+    if not nspace.get('file') and not nspace.get('crawl') and nspace.get('func') is not delegate_fleet:
       print("[-] Error: Invalid IPv4 or target host == null!")
       exit(0)
   
@@ -1,3 +1,16 @@
 from .netconfig import *
+from .fileutil import *
+from .isucache import *
 from .isudata import *
-from .netremote import *
\ No newline at end of file
+from .isudownload import *
+from .isustore import *
+from .isuprobe import *
+from .isucrawl import *
+from .netremote import *
+
+def __getattr__(name: str):
+  # The node classes are loaded lazily by fsapi.netremote
+  if name == 'nodes':
+    from .netremote import nodes
+    return nodes
+  raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -36,4 +36,7 @@ releases.
 '''
 
 from .esbin import *
-from .opcode import *
\ No newline at end of file
+from .cache import *
+from .opcode import *
+from .disasm import *
+from .batch import *
\ No newline at end of file
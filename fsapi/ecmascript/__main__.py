@@ -20,12 +20,16 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from ecmascript import *
-from os import walk
+import json
+import os
+import time
+
 from argparse import ArgumentParser
 
-def decompile(dpath: str, fpath: str, opath: str):
-  with Decompiler(dpath, fpath) as decompiler:
+from . import *
+
+def decompile(dpath: str, fpath: str, opath: str, cache: DecompilationCache = None):
+  with Decompiler(dpath, fpath, cache) as decompiler:
     code = str(decompiler)
     if opath:
       with open(opath, 'w') as fp:
@@ -33,12 +37,28 @@ def decompile(dpath: str, fpath: str, opath: str):
     else:
       print(code)
 
-def walk_rec(dpath: str, fpath: str):
-  for dirpath, dirnames, filenames in walk(fpath):
-    for filename in filenames:
-      decompile(dpath, dirpath + '/' + filename, dirpath + '/' + filename.replace('es.bin', 'js'))
-    for dirname in dirnames:
-      walk_rec(dpath, dirpath + '/' + dirname)
+def decompile_all(dpath: str, fpath: str, nspace: dict, cache: DecompilationCache = None):
+  files = find_scripts(fpath)
+  root = fpath if os.path.isdir(fpath) else os.path.dirname(fpath)
+  print('[+] Found %d script files in: %s' % (len(files), fpath))
+
+  start = time.monotonic()
+  results = []
+  for result in decompile_batch(dpath, files, nspace['workers'], nspace['force'],
+                                nspace['out'], root, cache):
+    results.append(result)
+    if result.status == BATCH_FAILED:
+      print('[-] Could not decompile %s: %s' % (result.path, result.error))
+
+  summary = get_summary(results, time.monotonic() - start)
+  print('[+] Decompiled %d (%d cached), skipped %d (up to date), failed %d of %d files in %.1fs' % (
+    summary['done'], summary['cached'], summary['skipped'], summary['failed'],
+    summary['total'], summary['elapsed']
+  ))
+  if nspace['report']:
+    with open(nspace['report'], 'w') as fp:
+      json.dump(summary, fp, indent=1)
+    print('[+] Saved report to:', nspace['report'])
 
 if __name__ == '__main__':
   parser = ArgumentParser()
@@ -50,7 +70,7 @@ if __name__ == '__main__':
     help="The target file that will be used to operate on."
   )
   parser.add_argument('-o', '--out', type=str, default=None,
-    help="The path were the decompiled output should be saved."
+    help="The path were the decompiled output should be saved. Together with -r, this is the output directory."
   )
 
   group1 = parser.add_argument_group()
@@ -60,18 +80,31 @@ if __name__ == '__main__':
   group1.add_argument('-r', '--recurse', action='store_true',
     help="Indicates that all files in the given directory should be decompiled"
   )
+  group1.add_argument('-w', '--workers', type=int, default=None,
+    help="The amount of concurrent decompilations (default: amount of CPUs)."
+  )
+  group1.add_argument('-f', '--force', action='store_true',
+    help="Decompile files again even if their output is up to date."
+  )
+  group1.add_argument('--report', type=str, default=None, metavar='FILE',
+    help="Saves a summary of the decompilation as JSON."
+  )
+  group1.add_argument('--cache', type=str, default=DECOMPILATION_CACHE_PATH, metavar='DIR',
+    help="The cache of decompiled scripts (default ~/.fsapi/decompiled)."
+  )
+  group1.add_argument('--no-cache', action='store_true', default=False,
+    help="Always run the decompiler without reading or updating the cache."
+  )
   
   nspace = parser.parse_args().__dict__
-  print(nspace)
 
   if nspace['decompile']:
     fpath = nspace['path']
     dpath = nspace['use_decompiler']
     opath = nspace['out']
+    cache = DecompilationCache(nspace['cache']) if not nspace['no_cache'] else None
 
     if nspace['recurse']:
-      walk_rec(dpath, fpath)
+      decompile_all(dpath, fpath, nspace, cache)
     else:
-      decompile(dpath, fpath, opath)
-        
-  
\ No newline at end of file
+      decompile(dpath, fpath, opath, cache)
@@ -0,0 +1,197 @@
+# MIT License
+
+# Copyright (c) 2022 MatrixEditor
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+__doc__ = '''
+Directory archives of `Venice 8` products contain hundreds of scripts. The batch
+functions decompile all of them with a bounded number of decompiler processes
+running at the same time:
+
+>>> files = find_scripts('_firmware.extracted/')
+>>> for result in decompile_batch('decompiler/ecma-decompiler', files, workers=8):
+...   if result.status == BATCH_FAILED: print(result.path, result.error)
+
+The source code of ``<name>.es.bin`` is written to ``<name>.js`` next to it (or
+below ``out_dir``). Outputs that are newer than their script are skipped unless
+``force`` is set. With a ``DecompilationCache``, scripts that have been decompiled
+before (e.g. as part of another firmware image) are taken from the cache.
+'''
+
+import os
+import re
+import time
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import NamedTuple
+
+from ..fileutil import atomic_write
+from .esbin import Decompiler, is_valid_ext, ES_BIN_SUFFIX
+from .cache import DecompilationCache
+
+__all__ = [
+  'BatchResult', 'find_scripts', 'get_output_path', 'is_up_to_date', 'decompile_batch',
+  'get_summary', 'BATCH_DONE', 'BATCH_SKIPPED', 'BATCH_FAILED'
+]
+
+BATCH_DONE = 'done'
+BATCH_SKIPPED = 'skipped'
+BATCH_FAILED = 'failed'
+
+_RE_ES_BIN_SUFFIX = re.compile(ES_BIN_SUFFIX + '$')
+
+class BatchResult(NamedTuple):
+  '''The result of decompiling a single script.
+
+  :param path: the script file
+  :param output: the output file
+  :param status: ``BATCH_DONE``, ``BATCH_SKIPPED`` or ``BATCH_FAILED``
+  :param error: the error message if the decompilation failed
+  :param elapsed: the time spent on this script in seconds
+  :param cached: whether the source code was taken from a ``DecompilationCache``
+  '''
+  path: str
+  output: str
+  status: str
+  error: str = None
+  elapsed: float = 0.0
+  cached: bool = False
+
+def find_scripts(path: str) -> list:
+  '''Returns all script files in the given directory and its subdirectories.
+
+  Each file is returned once, even if it can be reached through several paths
+  (e.g. symbolic links).
+
+  :param path: a directory or a single script file
+  :returns: the sorted list of script paths
+  '''
+  if os.path.isfile(path):
+    return [path] if is_valid_ext(path) else []
+
+  files, seen = [], set()
+  for dirpath, _, filenames in os.walk(path):
+    for filename in filenames:
+      if not is_valid_ext(filename):
+        continue
+      file_path = os.path.join(dirpath, filename)
+      real_path = os.path.realpath(file_path)
+      if real_path not in seen:
+        seen.add(real_path)
+        files.append(file_path)
+  return sorted(files)
+
+def get_output_path(path: str, out_dir: str = None, root: str = None) -> str:
+  '''Returns the path of the decompiled source code of a script.
+
+  >>> get_output_path('web/main.es.bin')
+  'web/main.js'
+  >>> get_output_path('fsh1/web/main.es.bin', 'out', 'fsh1')
+  'out/web/main.js'
+
+  :param path: the script file
+  :param out_dir: the output directory (defaults to the directory of the script)
+  :param root: the directory the script paths are relative to in ``out_dir``
+  '''
+  name = _RE_ES_BIN_SUFFIX.sub('.js', path)
+  if name == path:
+    name = path + '.js'
+  if out_dir:
+    name = os.path.join(out_dir, os.path.relpath(name, root) if root else os.path.basename(name))
+  return name
+
+def is_up_to_date(path: str, output: str) -> bool:
+  '''Returns whether the output exists and is not older than the script.'''
+  try:
+    stat = os.stat(output)
+  except OSError:
+    return False
+  return stat.st_size > 0 and stat.st_mtime >= os.path.getmtime(path)
+
+def _decompile(decompiler_path: str, path: str, output: str,
+               cache: DecompilationCache = None) -> BatchResult:
+  start = time.monotonic()
+  try:
+    decompiler = Decompiler(decompiler_path, path, cache)
+    code = decompiler.do_final()
+    # An aborted run must not leave an output that looks up to date
+    with atomic_write(output) as fp:
+      fp.write(code)
+  except Exception as error:
+    return BatchResult(path, output, BATCH_FAILED, str(error) or type(error).__name__,
+                       time.monotonic() - start)
+  return BatchResult(path, output, BATCH_DONE, elapsed=time.monotonic() - start,
+                     cached=decompiler.cached)
+
+def decompile_batch(decompiler_path: str, files: list, workers: int = None,
+                    force: bool = False, out_dir: str = None, root: str = None,
+                    cache: DecompilationCache = None):
+  '''Decompiles all given scripts concurrently.
+
+  Each worker runs one decompiler process at a time, so there are never more than
+  ``workers`` processes running. The workers are threads rather than processes:
+  they only wait for their decompiler process, which runs outside the GIL.
+
+  :param decompiler_path: the path to the decompiler
+  :param files: the script files (see ``find_scripts()``)
+  :param workers: the amount of concurrent decompilations (defaults to the amount
+                  of CPUs)
+  :param force: whether outputs that are up to date should be written again
+  :param out_dir: the output directory (see ``get_output_path()``)
+  :param root: the directory the script paths are relative to in ``out_dir``
+  :param cache: a ``DecompilationCache`` for the decompiled source code
+  :returns: a generator of ``BatchResult`` objects in the order they finish
+  '''
+  pending = []
+  for path in files:
+    output = get_output_path(path, out_dir, root)
+    if not force and is_up_to_date(path, output):
+      yield BatchResult(path, output, BATCH_SKIPPED)
+    else:
+      pending.append((path, output))
+  if not pending:
+    return
+
+  workers = max(1, min(workers or os.cpu_count() or 1, len(pending)))
+  with ThreadPoolExecutor(max_workers=workers) as executor:
+    futures = [executor.submit(_decompile, decompiler_path, path, output, cache)
+               for path, output in pending]
+    try:
+      for future in as_completed(futures):
+        yield future.result()
+    finally:
+      for future in futures: future.cancel()
+
+def get_summary(results: list, elapsed: float = 0.0) -> dict:
+  '''Returns a summary of the given results, which can be saved as JSON.'''
+  counts = {BATCH_DONE: 0, BATCH_SKIPPED: 0, BATCH_FAILED: 0}
+  cached = 0
+  for result in results:
+    counts[result.status] += 1
+    if result.cached: cached += 1
+  return {
+    'total': len(results),
+    'done': counts[BATCH_DONE],
+    'cached': cached,
+    'skipped': counts[BATCH_SKIPPED],
+    'failed': counts[BATCH_FAILED],
+    'elapsed': round(elapsed, 3),
+    'failures': [{'path': result.path, 'error': result.error}
+                 for result in results if result.status == BATCH_FAILED]
+  }
@@ -0,0 +1,119 @@
+# MIT License
+
+# Copyright (c) 2022 MatrixEditor
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+__doc__ = '''
+Many firmware images share the same scripts. The ``DecompilationCache`` stores the
+decompiled source code of each script under the SHA-256 hash of its bytecode, so
+every distinct script is only decompiled once:
+
+>>> cache = DecompilationCache()
+>>> with Decompiler('decompiler/ecma-decompiler', 'main.es.bin', cache=cache) as dc:
+...   code = dc.code
+
+The cached sources are kept apart per decompiler, which is identified by the hash
+of its binary. A rebuilt decompiler therefore starts with an empty cache.
+'''
+
+import hashlib
+import os
+import shutil
+import threading
+
+from ..fileutil import atomic_write
+
+__all__ = [
+  'DecompilationCache', 'DECOMPILATION_CACHE_PATH', 'get_decompiler_identity',
+  'get_script_hash'
+]
+
+DECOMPILATION_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.fsapi', 'decompiled')
+
+# (path, size, mtime) -> identity, so that the decompiler is hashed only once
+_identities = {}
+_identities_lock = threading.Lock()
+
+def get_script_hash(data: bytes) -> str:
+  '''Returns the SHA-256 hash of the given bytecode.'''
+  return hashlib.sha256(data).hexdigest()
+
+def get_decompiler_identity(decompiler_path: str) -> str:
+  '''Returns the SHA-256 hash of the given decompiler binary.
+
+  If the binary can't be read, the hash of its path is returned instead.
+  '''
+  path = shutil.which(decompiler_path) or decompiler_path
+  try:
+    stat = os.stat(path)
+  except OSError:
+    return hashlib.sha256(decompiler_path.encode('utf-8')).hexdigest()
+
+  key = (os.path.realpath(path), stat.st_size, stat.st_mtime_ns)
+  with _identities_lock:
+    identity = _identities.get(key)
+  if identity is None:
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as fp:
+      for chunk in iter(lambda: fp.read(0x100000), b''):
+        sha256.update(chunk)
+    identity = sha256.hexdigest()
+    with _identities_lock:
+      _identities[key] = identity
+  return identity
+
+class DecompilationCache:
+  '''Stores decompiled source code by the hash of the bytecode.
+
+  Each source is a file named ``<decompiler>/<sha[:2]>/<sha256>.js`` below the root
+  directory, where ``<decompiler>`` is the start of the decompiler identity. The
+  cache can be shared by concurrent processes.
+
+  :param root: the directory of the cache (created if needed)
+  '''
+
+  def __init__(self, root: str = DECOMPILATION_CACHE_PATH) -> None:
+    self.root = root
+    self.hits = 0
+    self.misses = 0
+    self.lock = threading.Lock()
+    os.makedirs(root, exist_ok=True)
+
+  def get_path(self, script_hash: str, identity: str) -> str:
+    '''Returns the path of the cached source code.'''
+    return os.path.join(self.root, identity[:16], script_hash[:2], script_hash + '.js')
+
+  def get(self, script_hash: str, identity: str) -> str:
+    '''Returns the cached source code or ``None`` if the script is not cached.'''
+    try:
+      with open(self.get_path(script_hash, identity), 'r', encoding='utf-8') as fp:
+        source = fp.read()
+    except OSError:
+      source = None
+
+    with self.lock:
+      if source is None: self.misses += 1
+      else: self.hits += 1
+    return source
+
+  def put(self, script_hash: str, identity: str, source: str) -> None:
+    '''Stores the source code of a script.'''
+    # Readers never see a partial source
+    with atomic_write(self.get_path(script_hash, identity), encoding='utf-8') as fp:
+      fp.write(source)
@@ -0,0 +1,277 @@
+# MIT License
+
+# Copyright (c) 2022 MatrixEditor
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+__doc__ = '''
+The bytecode of `.es.bin` files can be listed without the external decompiler.
+Each file starts with a header of ``ECMASCRIPT_HDR_LEN`` bytes, which is followed
+by the bytecode of the script:
+
+>>> header, instructions = disassemble('main.es.bin')
+>>> header.length
+1337
+>>> print(get_listing(instructions))
+00000:  name         #0
+00003:  pushobj
+00004:  call         1
+...
+
+Operands referring to the atom map of the script (names and constants) are listed
+with their index (e.g. ``#0``), because the atoms are stored after the bytecode.
+Jump offsets are listed together with their target.
+'''
+
+import struct
+
+from typing import NamedTuple
+
+from .opcode import *
+
+__all__ = [
+  'ESHeader', 'ESInstruction', 'parse_header', 'iter_instructions', 'disassemble',
+  'format_instruction', 'get_listing'
+]
+
+################################################################################
+# disasm::globals
+################################################################################
+_HEADER = struct.Struct('<9I')
+
+_U16 = struct.Struct('>H').unpack_from
+_S16 = struct.Struct('>h').unpack_from
+_S32 = struct.Struct('>i').unpack_from
+_U16_U16 = struct.Struct('>HH').unpack_from
+
+def _uint24(code: bytes, pc: int) -> tuple:
+  return (code[pc] << 16 | code[pc + 1] << 8 | code[pc + 2],)
+
+def _litopx(code: bytes, pc: int) -> tuple:
+  return (code[pc] << 16 | code[pc + 1] << 8 | code[pc + 2], code[pc + 3])
+
+# Functions reading the operands of all formats with a fixed length
+_OPERANDS = {
+  JOF_JUMP: _S16, JOF_ATOM: _U16, JOF_UINT16: _U16, JOF_QARG: _U16, JOF_QVAR: _U16,
+  JOF_LOCAL: _U16, JOF_SLOTATOM: _U16_U16, JOF_JUMPX: _S32, JOF_UINT24: _uint24,
+  JOF_LITOPX: _litopx
+}
+
+# The jump offset readers of the switch formats: (reader, offset size)
+_SWITCHES = {
+  JOF_TABLESWITCH: (_S16, 2), JOF_LOOKUPSWITCH: (_S16, 2),
+  JOF_TABLESWITCHX: (_S32, 4), JOF_LOOKUPSWITCHX: (_S32, 4)
+}
+
+# (name, format, length, operand reader) of each opcode
+_TABLE = [None] * 256
+for _op, _name in ESOP.items():
+  _format = ESOP_FORMAT.get(_op, JOF_BYTE)
+  _TABLE[_op] = (_name, _format, ESOP_LENGTH[_op], _OPERANDS.get(_format))
+del _op, _name, _format
+
+################################################################################
+# disasm::classes
+################################################################################
+class ESHeader(NamedTuple):
+  '''The header of a compiled script. The names follow the fields written by
+  SpiderMonkey's ``js_XDRScript()``.
+
+  :param magic: the file signature (``ECMASCRIPT_MAGIC_BYTES``)
+  :param length: the length of the bytecode in bytes
+  :param prolog_length: the length of the prolog at the start of the bytecode
+  :param version: the JavaScript version the script was compiled for
+  :param natoms: the amount of atoms (names and constants)
+  :param nsrcnotes: the amount of source notes
+  :param ntrynotes: the amount of try notes
+  :param nobjects: the amount of objects (e.g. functions)
+  :param nregexps: the amount of regular expressions
+  '''
+  magic: int
+  length: int
+  prolog_length: int
+  version: int
+  natoms: int
+  nsrcnotes: int
+  ntrynotes: int
+  nobjects: int
+  nregexps: int
+
+class ESInstruction(NamedTuple):
+  '''A single decoded instruction.
+
+  The operands depend on the format of the opcode (see ``ESOP_FORMAT``). Table
+  switches store ``(default, low, high, offsets)`` and lookup switches store
+  ``(default, ((atom, offset), ...))``.
+
+  :param offset: the offset of the opcode relative to the start of the bytecode
+  :param opcode: the opcode
+  :param name: the mnemonic of the opcode
+  :param operands: a tuple of the decoded operands
+  :param length: the length of the instruction in bytes
+  '''
+  offset: int
+  opcode: int
+  name: str
+  operands: tuple
+  length: int
+
+  @property
+  def format(self) -> int:
+    return ESOP_FORMAT.get(self.opcode, JOF_BYTE)
+
+################################################################################
+# disasm::functions
+################################################################################
+def parse_header(buffer: bytes) -> ESHeader:
+  '''Reads the header of a compiled script.
+
+  :param buffer: the content of the ``.es.bin`` file
+  :raises ValueError: if the buffer is too small or the signature is invalid
+  :returns: the ``ESHeader`` of the script
+  '''
+  if len(buffer) < ECMASCRIPT_HDR_LEN:
+    raise ValueError('Invalid script file: missing header')
+
+  header = ESHeader(*_HEADER.unpack_from(buffer))
+  if header.magic != ECMASCRIPT_MAGIC_BYTES:
+    raise ValueError('Invalid script file: unexpected magic %#x' % header.magic)
+  return header
+
+def _decode_switch(code: bytes, pc: int, fmt: int) -> tuple:
+  # Returns the operands and the length of a switch instruction
+  read, size = _SWITCHES[fmt]
+  index = pc + 1
+  default = read(code, index)[0]
+  index += size
+  if fmt in (JOF_TABLESWITCH, JOF_TABLESWITCHX):
+    low, high = _S16(code, index)[0], _S16(code, index + 2)[0]
+    index += 4
+    offsets = []
+    for _ in range(high - low + 1):
+      offsets.append(read(code, index)[0])
+      index += size
+    return (default, low, high, tuple(offsets)), index - pc
+
+  npairs = _U16(code, index)[0]
+  index += 2
+  pairs = []
+  for _ in range(npairs):
+    pairs.append((_U16(code, index)[0], read(code, index + 2)[0]))
+    index += 2 + size
+  return (default, tuple(pairs)), index - pc
+
+def iter_instructions(code: bytes, start: int = 0, end: int = None):
+  '''Decodes the given bytecode.
+
+  :param code: a buffer containing the bytecode
+  :param start: the offset of the first instruction
+  :param end: the end of the bytecode (defaults to the end of the buffer)
+  :raises ValueError: on unknown opcodes or truncated instructions
+  :returns: a generator of ``ESInstruction`` objects. The offsets are relative to
+            ``start``.
+  '''
+  end = len(code) if end is None else end
+  table = _TABLE
+  pc = start
+  while pc < end:
+    op = code[pc]
+    entry = table[op]
+    if entry is None:
+      raise ValueError('Unknown opcode %d at offset %d' % (op, pc - start))
+
+    name, fmt, length, read = entry
+    try:
+      if length < 0:
+        operands, length = _decode_switch(code, pc, fmt)
+      else:
+        operands = read(code, pc + 1) if read else ()
+    except (struct.error, IndexError):
+      length = end - pc + 1
+
+    if pc + length > end:
+      raise ValueError('Truncated instruction %s at offset %d' % (name, pc - start))
+    yield ESInstruction(pc - start, op, name, operands, length)
+    pc += length
+
+def disassemble(res) -> tuple:
+  '''Disassembles a compiled script.
+
+  :param res: the path to the ``.es.bin`` file or its content
+  :raises ValueError: if the file is not a valid script
+  :returns: a tuple of the ``ESHeader`` and the list of ``ESInstruction`` objects
+  '''
+  if isinstance(res, str):
+    with open(res, 'rb') as fp:
+      res = fp.read()
+
+  header = parse_header(res)
+  end = ECMASCRIPT_HDR_LEN + header.length
+  if end > len(res):
+    raise ValueError('Invalid script file: %d bytes of bytecode expected, got %d' % (
+      header.length, len(res) - ECMASCRIPT_HDR_LEN))
+  return header, list(iter_instructions(res, ECMASCRIPT_HDR_LEN, end))
+
+def _target(instruction: ESInstruction, offset: int) -> str:
+  return '%d (-> %05d)' % (offset, instruction.offset + offset)
+
+def format_instruction(instruction: ESInstruction) -> str:
+  '''Returns a single line of the listing for the given instruction.'''
+  fmt = instruction.format
+  operands = instruction.operands
+  if fmt == JOF_BYTE:
+    text = ''
+  elif fmt in (JOF_JUMP, JOF_JUMPX):
+    text = _target(instruction, operands[0])
+  elif fmt in (JOF_ATOM, JOF_UINT24) and instruction.name != 'uint24':
+    text = '#%d' % operands[0]
+  elif fmt == JOF_QARG:
+    text = 'arg%d' % operands[0]
+  elif fmt == JOF_QVAR:
+    text = 'var%d' % operands[0]
+  elif fmt == JOF_LOCAL:
+    text = 'local%d' % operands[0]
+  elif fmt == JOF_SLOTATOM:
+    text = 'local%d, #%d' % operands
+  elif fmt == JOF_LITOPX:
+    text = '#%d, %s' % (operands[0], ESOP.get(operands[1], operands[1]))
+  elif fmt in (JOF_TABLESWITCH, JOF_TABLESWITCHX):
+    default, low, high, offsets = operands
+    cases = ', '.join('%d: %s' % (low + i, _target(instruction, offset))
+                      for i, offset in enumerate(offsets))
+    text = 'default %s, low %d, high %d {%s}' % (_target(instruction, default), low, high, cases)
+  elif fmt in (JOF_LOOKUPSWITCH, JOF_LOOKUPSWITCHX):
+    default, pairs = operands
+    cases = ', '.join('#%d: %s' % (atom, _target(instruction, offset)) for atom, offset in pairs)
+    text = 'default %s {%s}' % (_target(instruction, default), cases)
+  else:
+    text = ' '.join(map(str, operands))
+  return ('%05d:  %-12s %s' % (instruction.offset, instruction.name, text)).rstrip()
+
+def get_listing(instructions: list, header: ESHeader = None) -> str:
+  '''Returns the listing of the given instructions.
+
+  :param instructions: the decoded instructions
+  :param header: the header to list as a comment before the instructions (optional)
+  '''
+  lines = []
+  if header is not None:
+    lines.append('; %s' % ', '.join(('%s=%#x' if name == 'magic' else '%s=%d') % (name, value)
+                                    for name, value in header._asdict().items()))
+  lines.extend(format_instruction(instruction) for instruction in instructions)
+  return '\n'.join(lines)
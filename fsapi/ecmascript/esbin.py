@@ -38,6 +38,8 @@ import re
 import subprocess
 import sys
 
+from .cache import DecompilationCache, get_decompiler_identity, get_script_hash
+
 ################################################################################
 # esbin::globals
 ################################################################################
@@ -81,9 +83,19 @@ def is_valid_ext(name: str) -> bool:
     return re.search(ES_BIN_SUFFIX, name) is not None
 
 class Decompiler:
-  def __init__(self, decompiler_path: str, file_path: str) -> None:
+  '''Runs the external decompiler on a script file.
+
+  :param decompiler_path: the path to the decompiler
+  :param file_path: the script file
+  :param cache: a ``DecompilationCache`` that is checked before the decompiler is
+                started and that receives the decompiled source code
+  '''
+  def __init__(self, decompiler_path: str, file_path: str,
+               cache: DecompilationCache = None) -> None:
     self.dpath = decompiler_path
     self.fpath = file_path
+    self.cache = cache
+    self.cached = False
     self.done = False
     self.sourcecode = None
 
@@ -103,11 +115,22 @@ class Decompiler:
 
     if not is_valid_ext(self.fpath):
       raise ValueError('Invalid script file')
+
+    if self.cache:
+      with open(self.fpath, 'rb') as fp:
+        script_hash = get_script_hash(fp.read())
+      identity = get_decompiler_identity(self.dpath)
+      self.sourcecode = self.cache.get(script_hash, identity)
+      if self.sourcecode is not None:
+        self.cached = self.done = True
+        return self.sourcecode
   
-    result = subprocess.run(args=[self.dpath, self.fpath], shell=True, capture_output=True)
+    result = subprocess.run(args=[self.dpath, self.fpath], capture_output=True)
     result.check_returncode()
 
     self.sourcecode = result.stdout.decode('utf-8')
+    if self.cache:
+      self.cache.put(script_hash, identity, self.sourcecode)
     self.done = True
     return self.sourcecode
   
@@ -23,7 +23,10 @@ __doc__ = '''
 '''
 
 __all__ = [
-  'ECMASCRIPT_MAGIC_BYTES', 'ECMASCRIPT_HDR_LEN', 'ESOP'
+  'ECMASCRIPT_MAGIC_BYTES', 'ECMASCRIPT_HDR_LEN', 'ESOP', 'ESOP_FORMAT', 'ESOP_LENGTH',
+  'JOF_BYTE', 'JOF_JUMP', 'JOF_ATOM', 'JOF_UINT16', 'JOF_TABLESWITCH',
+  'JOF_LOOKUPSWITCH', 'JOF_QARG', 'JOF_QVAR', 'JOF_LOCAL', 'JOF_SLOTATOM', 'JOF_JUMPX',
+  'JOF_TABLESWITCHX', 'JOF_LOOKUPSWITCHX', 'JOF_UINT24', 'JOF_LITOPX'
 ]
 
 # ECMAScripts' magic bytes defined in little-endian encoding.
@@ -194,7 +197,7 @@ ESOP = {
 
   # 'in' and 'instanceof' ops.
   111: "in", 
-  712: "instanceof",
+  112: "instanceof",
 
   # debugger op
   113: "debugger",
@@ -365,4 +368,84 @@ ESOP = {
   # Variant of 'enumelem' (122) for destructuring const (const [a, b] = ...).
   214: "enumconstelem",
   215: "leaveblockexpr"
-}
\ No newline at end of file
+}
+
+# Operand formats of the bytecodes. All operands are stored in big-endian byte
+# order directly after the opcode.
+JOF_BYTE          = 0  # no operands
+JOF_JUMP          = 1  # signed 16-bit jump offset
+JOF_ATOM          = 2  # unsigned 16-bit atom index
+JOF_UINT16        = 3  # unsigned 16-bit immediate operand
+JOF_TABLESWITCH   = 4  # table switch with 16-bit jump offsets
+JOF_LOOKUPSWITCH  = 5  # lookup switch with 16-bit jump offsets
+JOF_QARG          = 6  # unsigned 16-bit argument slot
+JOF_QVAR          = 7  # unsigned 16-bit variable slot
+JOF_LOCAL         = 8  # unsigned 16-bit block-local slot
+JOF_SLOTATOM      = 9  # unsigned 16-bit slot followed by an atom index
+JOF_JUMPX         = 10 # signed 32-bit jump offset
+JOF_TABLESWITCHX  = 11 # table switch with 32-bit jump offsets
+JOF_LOOKUPSWITCHX = 12 # lookup switch with 32-bit jump offsets
+JOF_UINT24        = 13 # unsigned 24-bit immediate operand or atom index
+JOF_LITOPX        = 14 # unsigned 24-bit atom index followed by an opcode
+
+# Defines the operand format of each bytecode. Opcodes not present here
+# have no operands (JOF_BYTE). Taken from the jsopcode.tbl of the SpiderMonkey
+# release the scripts were compiled with.
+ESOP_FORMAT = {
+  6: JOF_JUMP, 7: JOF_JUMP, 8: JOF_JUMP,
+  10: JOF_QARG, 11: JOF_QVAR,
+  14: JOF_ATOM,
+  35: JOF_UINT16,
+  36: JOF_ATOM, 37: JOF_ATOM,
+  41: JOF_ATOM, 42: JOF_ATOM, 44: JOF_ATOM, 45: JOF_ATOM,
+  47: JOF_ATOM, 48: JOF_ATOM, 50: JOF_ATOM, 51: JOF_ATOM,
+  53: JOF_ATOM, 54: JOF_ATOM,
+  58: JOF_UINT16,
+  59: JOF_ATOM, 60: JOF_ATOM, 61: JOF_ATOM,
+  68: JOF_JUMP, 69: JOF_JUMP,
+  70: JOF_TABLESWITCH, 71: JOF_LOOKUPSWITCH,
+  74: JOF_ATOM, 76: JOF_ATOM, 78: JOF_ATOM, 80: JOF_ATOM,
+  84: JOF_QARG, 85: JOF_QARG, 86: JOF_QVAR, 87: JOF_QVAR,
+  88: JOF_UINT16,
+  91: JOF_ATOM, 93: JOF_UINT16, 94: JOF_UINT16,
+  95: JOF_QARG, 96: JOF_QVAR, 97: JOF_QARG, 98: JOF_QVAR,
+  99: JOF_QARG, 100: JOF_QVAR, 101: JOF_QARG, 102: JOF_QVAR,
+  104: JOF_ATOM, 105: JOF_ATOM,
+  108: JOF_ATOM, 109: JOF_ATOM,
+  114: JOF_JUMP, 117: JOF_UINT16,
+  119: JOF_JUMP, 120: JOF_JUMP,
+  121: JOF_UINT16,
+  125: JOF_ATOM, 126: JOF_ATOM, 127: JOF_ATOM, 128: JOF_ATOM, 129: JOF_ATOM,
+  130: JOF_LOCAL, 132: JOF_UINT16,
+  136: JOF_QARG, 138: JOF_SLOTATOM,
+  139: JOF_JUMPX, 140: JOF_JUMPX, 141: JOF_JUMPX, 142: JOF_JUMPX,
+  143: JOF_JUMPX, 144: JOF_JUMPX, 145: JOF_JUMPX, 146: JOF_JUMPX,
+  147: JOF_TABLESWITCHX, 148: JOF_LOOKUPSWITCHX,
+  149: JOF_JUMP, 150: JOF_JUMP,
+  154: JOF_ATOM, 155: JOF_ATOM, 156: JOF_ATOM, 157: JOF_ATOM, 158: JOF_ATOM, 159: JOF_ATOM,
+  160: JOF_ATOM,
+  163: JOF_ATOM, 164: JOF_ATOM, 174: JOF_JUMP,
+  180: JOF_ATOM, 181: JOF_ATOM, 182: JOF_ATOM, 183: JOF_ATOM, 184: JOF_ATOM,
+  188: JOF_UINT24, 189: JOF_UINT24, 190: JOF_UINT24, 191: JOF_LITOPX,
+  194: JOF_ATOM, 196: JOF_ATOM,
+  199: JOF_ATOM, 200: JOF_UINT16,
+  201: JOF_LOCAL, 202: JOF_LOCAL, 203: JOF_LOCAL, 204: JOF_LOCAL,
+  205: JOF_LOCAL, 206: JOF_LOCAL, 207: JOF_LOCAL,
+  212: JOF_LOCAL, 215: JOF_UINT16
+}
+
+# The length of the operands of each format. Switches have a variable length,
+# which is marked with -1.
+_FORMAT_LENGTH = {
+  JOF_BYTE: 0, JOF_JUMP: 2, JOF_ATOM: 2, JOF_UINT16: 2, JOF_TABLESWITCH: -1,
+  JOF_LOOKUPSWITCH: -1, JOF_QARG: 2, JOF_QVAR: 2, JOF_LOCAL: 2, JOF_SLOTATOM: 4,
+  JOF_JUMPX: 4, JOF_TABLESWITCHX: -1, JOF_LOOKUPSWITCHX: -1, JOF_UINT24: 3,
+  JOF_LITOPX: 4
+}
+
+# Defines the full length (opcode and operands) of all bytecodes.
+def _get_length(op: int) -> int:
+  length = _FORMAT_LENGTH[ESOP_FORMAT.get(op, JOF_BYTE)]
+  return length + 1 if length >= 0 else -1
+
+ESOP_LENGTH = {op: _get_length(op) for op in ESOP}
@@ -0,0 +1,61 @@
+# MIT License
+
+# Copyright (c) 2022 MatrixEditor
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+__doc__ = '''
+Caches, indexes and generated files are written with ``atomic_write()``. The content
+goes to a temporary file next to the target, which replaces the target once it was
+written completely. An interrupted write therefore never leaves a truncated file:
+
+>>> with atomic_write('cache.json') as fp:
+...   json.dump(values, fp)
+'''
+
+import contextlib
+import os
+import threading
+
+__all__ = ["atomic_write"]
+
+@contextlib.contextmanager
+def atomic_write(path: str, mode: str = 'w', encoding: str = None):
+  '''Opens a temporary file that replaces the given path when the block is left.
+
+  Missing directories are created. If the block raises an exception, the temporary
+  file is removed and the target stays untouched.
+
+  :param path: the target file
+  :param mode: the mode to open the temporary file with (``'w'`` or ``'wb'``)
+  :param encoding: the encoding in text mode
+  '''
+  directory = os.path.dirname(os.path.abspath(path))
+  os.makedirs(directory, exist_ok=True)
+  # Unique per process and thread, so concurrent writers don't share a file
+  temp_path = '%s.%d.%d.tmp' % (path, os.getpid(), threading.get_ident())
+  try:
+    with open(temp_path, mode, encoding=encoding) as fp:
+      yield fp
+    os.replace(temp_path, path)
+  except BaseException:
+    try:
+      os.remove(temp_path)
+    except OSError:
+      pass
+    raise
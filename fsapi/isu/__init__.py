@@ -69,4 +69,5 @@ from .fsfs import *
 from .product import *
 from .walk import *
 from .inspectors import *
+from .stream import *
 
@@ -110,6 +110,7 @@ class MMIInspector(ISUInspector):
     verbose = 'verbose' in kwgs and kwgs['verbose']
     root = kwgs['root'] if 'root' in kwgs else None
 
+    index = None
     for match in re.finditer(b'FSH1', buffer._file):
       index = match.end()
 
@@ -117,7 +118,14 @@ class MMIInspector(ISUInspector):
       if verbose: print("[-] Directory archive not found")
       return None
 
-    pos = index + 6
+    return self.get_fs_index(buffer, index, root=root, verbose=verbose)
+
+  def get_fs_index(self, buffer: ISUFile, index: int, base: int = 0, **kwgs) -> FSFSTree:
+    verbose = 'verbose' in kwgs and kwgs['verbose']
+    root = kwgs['root'] if 'root' in kwgs else None
+
+    # base: the position of the buffer within the file
+    pos = base + index + 6
     size = to_ui32(buffer, index)
     if verbose: 
       print("[+] Found a directory archive(size=%d bytes, name='FSH1')" % size)
@@ -326,7 +334,7 @@ class MMIInspector(ISUInspector):
       current += 1
       if len(crc) == 0:
         break
-    print()
+    if verbose: print()
     return partitions
 
 @set_inspector('ir/mmi.16m/fs2026')
@@ -337,6 +345,9 @@ class MMI16mInspector(MMIInspector):
 class SERInspector(MMIInspector):
   def get_fs_tree(self, buffer: ISUFile, offset: int = 0, **kwgs) -> FSFSTree:
     raise NotImplementedError('ir/ser -> firmware stores compressed filesystem')
+
+  def get_fs_index(self, buffer: ISUFile, index: int, base: int = 0, **kwgs) -> FSFSTree:
+    raise NotImplementedError('ir/ser -> firmware stores compressed filesystem')
   
 @set_inspector('ir/fsccp.scb/fs2026')
 class FS2026FsccpScbInspector(MMIInspector):
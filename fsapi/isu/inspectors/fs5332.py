@@ -52,6 +52,9 @@ class OtaIspector(MMIInspector):
     
   def get_fs_tree(self, buffer: ISUFile, offset: int = 0, **kwgs) -> FSFSTree:
     raise UnsupportedOperation()
+
+  def get_fs_index(self, buffer: ISUFile, index: int, base: int = 0, **kwgs) -> FSFSTree:
+    raise UnsupportedOperation()
   
   def get_partitions(self, buffer: ISUFile, **kwgs) -> list:
     raise UnsupportedOperation()
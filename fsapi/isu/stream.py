@@ -0,0 +1,249 @@
+# MIT License
+
+# Copyright (c) 2022 MatrixEditor
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+__doc__ = '''
+The inspectors work on complete files, so a firmware binary usually has to be
+downloaded before it can be inspected. An ``ISUStream`` is fed with the chunks of a
+download instead and parses the header, the partitions and the index of the `FSH1`
+directory archive as soon as the needed bytes have arrived:
+
+>>> def on_stage(stream: ISUStream, stage: str) -> bool:
+...   if stage == STREAM_HEADER: print(stream.header.customisation)
+...   return True # False stops the stream
+>>> stream = ISUStream(callback=on_stage)
+>>> for chunk in response.stream(0x10000):
+...   if not stream.feed(chunk): break
+>>> stream.close()
+
+If no inspector is given, it is selected by the customisation stored in the header.
+Because some binaries contain the string ``FSH1`` more than once, each valid
+archive index found is reported and ``archive`` is the last one - just like
+``ISUInspector.get_fs_tree()`` would return it for the complete file. Candidates
+whose index is bigger than ``max_index`` or whose archive would not fit into the
+file are skipped without being buffered.
+'''
+
+from io import UnsupportedOperation
+
+from .walk import ISUFile, ISUInspector, ISUHeader
+from .fsfs import FSFSTree
+from .ioutils import to_ui32
+from .inspectors import MMIInspector, MMI_HEADER_LENGTH
+
+__all__ = [
+  "ISUStream", "STREAM_HEADER", "STREAM_PARTITIONS", "STREAM_ARCHIVE",
+  "get_inspector_name"
+]
+
+STREAM_HEADER = 'header'
+STREAM_PARTITIONS = 'partitions'
+STREAM_ARCHIVE = 'archive'
+
+ARCHIVE_MAGIC = b'FSH1'
+
+# magic, archive size (4 bytes), unknown (2 bytes), index size (4 bytes)
+ARCHIVE_HEADER_LENGTH = len(ARCHIVE_MAGIC) + 10
+
+def get_inspector_name(customisation) -> str:
+  '''Returns the name of the inspector for the given ``FSCustomisation``.
+
+  >>> get_inspector_name(header.customisation)
+  'ir/mmi.16m/fs2026'
+  '''
+  interface = '.'.join([customisation.interface] + customisation.interface_sub_types)
+  return '%s/%s/%s' % (customisation.type_spec, interface, customisation.module_type.lower())
+
+class ISUStream(ISUFile):
+  '''Inspects a firmware binary while it is being received.
+
+  The callback is invoked with this stream and the stage that has been parsed
+  (``STREAM_HEADER``, ``STREAM_PARTITIONS`` or ``STREAM_ARCHIVE``). If it returns
+  ``False``, the stream is aborted. The header stage is reported even if the
+  header could not be read (``header`` is ``None`` then).
+
+  Only the start of the file is buffered until the header and partitions have been
+  parsed. Afterwards, the stream keeps just the bytes of the archive candidate it is
+  currently reading, so the memory used does not grow with the size of the file.
+
+  :param inspector: the inspector to use (optional)
+  :param callback: a callable receiving the stream and the parsed stage
+  :param total: the expected size of the file (if known), which is used to skip
+                invalid archive candidates
+  :param max_head: the amount of bytes buffered at most to read the header and
+                   partitions
+  :param max_index: the maximum size of an archive index. Candidates with a bigger
+                    index are skipped.
+  '''
+
+  def __init__(self, inspector: ISUInspector = None, callback = None, total: int = 0,
+               max_head: int = 0x10000, max_index: int = 0x100000) -> None:
+    super().__init__(b'')
+    self._file = bytearray()
+    self.inspector = inspector
+    self.callback = callback
+    self.total = total
+    self.max_head = max_head
+    self.max_index = max_index
+    self.header: ISUHeader = None
+    self.partitions: list = None
+    self.archive: FSFSTree = None
+    self.stages = []
+    self.aborted = False
+    self.complete = False
+    self.received = 0
+    self._head = True
+    # The bytes searched for archive candidates and their position in the file
+    self._window = bytearray()
+    self._window_base = 0
+    self._scan = 0
+
+  @property
+  def size(self) -> int:
+    '''The amount of bytes received so far.'''
+    return self.received
+
+  def feed(self, chunk: bytes) -> bool:
+    '''Passes the next chunk to the stream and parses everything available now.
+
+    :returns: ``False`` if the stream has been aborted by the callback or closed
+    '''
+    if self.aborted or self.complete:
+      return False
+    self.received += len(chunk)
+    if self._scan >= 0:
+      self._window += chunk
+
+    if self._head:
+      self._file += chunk
+      if not self._parse_head():
+        return not self.aborted
+
+    if self.inspector is not None and self._scan >= 0:
+      self._parse_archives()
+    return not self.aborted
+
+  def close(self) -> None:
+    '''Marks the stream as complete and releases its buffers.'''
+    self.complete = True
+    self._release()
+
+  def _release(self) -> None:
+    self._head = False
+    self._file = bytearray()
+    self._window = bytearray()
+    self._scan = -1
+
+  def _report(self, stage: str) -> bool:
+    self.stages.append(stage)
+    if self.callback and self.callback(self, stage) is False:
+      self.aborted = True
+      self._release()
+    return not self.aborted
+
+  def _parse_head(self) -> bool:
+    # Returns True if the header and partitions are done
+    if STREAM_HEADER not in self.stages:
+      if len(self._file) < MMI_HEADER_LENGTH or not self._parse_header():
+        return False
+      if self.inspector is None:
+        self._release()
+        return False
+
+    try:
+      self.partitions = self.inspector.get_partitions(self)
+    except IndexError:
+      # The entries are not complete yet
+      if len(self._file) < self.max_head:
+        return False
+      self.partitions = None
+    except (UnsupportedOperation, NotImplementedError):
+      self.partitions = None
+
+    self._head = False
+    self._file = bytearray()
+    return self._report(STREAM_PARTITIONS)
+
+  def _parse_header(self) -> bool:
+    inspector = self.inspector or MMIInspector()
+    try:
+      self.header = inspector.get_header(self)
+    except (ValueError, IndexError, KeyError, UnsupportedOperation, NotImplementedError):
+      self.header = None
+
+    if self.inspector is None and self.header and self.header.customisation:
+      try:
+        self.inspector = ISUInspector.getInstance(get_inspector_name(self.header.customisation))
+      except (KeyError, IndexError):
+        pass
+    return self._report(STREAM_HEADER)
+
+  def _is_candidate(self, position: int, archive_size: int, index_size: int) -> bool:
+    if not archive_size or index_size > archive_size or index_size > self.max_index:
+      return False
+    return not self.total or position + ARCHIVE_HEADER_LENGTH - 4 + archive_size <= self.total
+
+  def _parse_archives(self) -> None:
+    window = self._window
+    while not self.aborted:
+      index = window.find(ARCHIVE_MAGIC, self._scan)
+      if index < 0:
+        # Keep the end, because the magic may be split between two chunks
+        drop = max(0, len(window) - len(ARCHIVE_MAGIC) + 1)
+        del window[:drop]
+        self._window_base += drop
+        self._scan = 0
+        return
+
+      # Everything before the candidate won't be needed anymore
+      del window[:index]
+      self._window_base += index
+      self._scan = 0
+      if len(window) < ARCHIVE_HEADER_LENGTH:
+        return
+
+      archive_size = to_ui32(window, 4)
+      index_size = to_ui32(window, 10)
+      if not self._is_candidate(self._window_base, archive_size, index_size):
+        self._scan = 1
+        continue
+
+      end = ARCHIVE_HEADER_LENGTH + index_size
+      if len(window) < end:
+        return
+
+      try:
+        tree = self.inspector.get_fs_index(ISUFile(bytes(window[:end])), len(ARCHIVE_MAGIC),
+                                           self._window_base)
+      except (UnsupportedOperation, NotImplementedError):
+        self._window = bytearray()
+        self._scan = -1
+        return
+      except Exception:
+        tree = None
+
+      if tree is None:
+        self._scan = 1
+        continue
+      # A valid index can't contain another archive
+      del window[:end]
+      self._window_base += end
+      self.archive = tree
+      self._report(STREAM_ARCHIVE)
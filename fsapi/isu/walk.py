@@ -157,6 +157,14 @@ class ISUInspector:
   def get_fs_tree(self, buffer: ISUFile, offset: int = 0, **kwgs) -> FSFSTree:
     pass
 
+  def get_fs_index(self, buffer: ISUFile, index: int, base: int = 0, **kwgs) -> FSFSTree:
+    """Reads the archive index following the ``FSH1`` magic that ends at ``index``.
+
+    ``base`` is the position of the buffer within the file, so that the offsets
+    of the returned tree are absolute.
+    """
+    raise NotImplementedError()
+
   def get_header(self, buffer: ISUFile, offset: int = 0, **kwgs) -> ISUHeader:
     pass
 
@@ -0,0 +1,194 @@
+# MIT License
+
+# Copyright (c) 2022 MatrixEditor
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+__doc__ = '''
+The answers of ``FindUpdate.aspx`` rarely change. The ``UpdateCache`` stores them
+per customisation and version, so that polling for updates costs little:
+
+* while a response is fresh (``Cache-Control: max-age`` or ``Expires``), no request
+  is sent at all
+* afterwards, the request is sent with ``If-None-Match``/``If-Modified-Since`` and a
+  `304` answer reuses the stored response
+
+>>> cache = UpdateCache('updates.json')
+>>> result = isu_find_update(mac, customisation, version, cache=cache)
+>>> cache.save()
+
+Note that the update server also answers `304` if there is no update. Both cases are
+handled the same way: without a stored response, a `304` stands for "no update",
+otherwise the stored response is still valid.
+'''
+
+import base64
+import email.utils
+import json
+import os
+import threading
+import time
+
+from typing import NamedTuple
+from urllib3 import HTTPHeaderDict
+
+from .fileutil import atomic_write
+
+__all__ = [
+  "UpdateCache", "CachedResponse", "UPDATE_CACHE_PATH"
+]
+
+UPDATE_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.fsapi', 'updates.json')
+
+class CachedResponse(NamedTuple):
+  '''A stored answer of the update server.
+
+  :param status: the HTTP status code
+  :param headers: the response headers (a case-insensitive ``HTTPHeaderDict``)
+  :param data: the response body
+  :param expires: the time (seconds since the epoch) until the response is fresh
+  '''
+  status: int
+  headers: dict
+  data: bytes
+  expires: float = 0.0
+
+def _get_max_age(headers: dict, default: float) -> float:
+  # Returns the freshness lifetime in seconds or None if the response must not be stored
+  directives = {}
+  for directive in headers.get('Cache-Control', '').lower().split(','):
+    name, _, value = directive.partition('=')
+    directives[name.strip()] = value.strip().strip('"')
+
+  if 'no-store' in directives:
+    return None
+  if 'no-cache' in directives:
+    return 0.0
+  if directives.get('max-age', '').isdigit():
+    return float(directives['max-age'])
+
+  expires = headers.get('Expires')
+  if expires:
+    try:
+      expires = email.utils.parsedate_to_datetime(expires).timestamp()
+      date = headers.get('Date')
+      date = email.utils.parsedate_to_datetime(date).timestamp() if date else time.time()
+      return max(0.0, expires - date)
+    except (TypeError, ValueError):
+      # An invalid date means the response is already expired
+      return 0.0
+  return default
+
+class UpdateCache:
+  '''A persistent HTTP cache for the answers of ``FindUpdate.aspx``.
+
+  :param path: the JSON file to load the cache from and to save it to
+  :param default_max_age: the freshness lifetime in seconds of responses without
+                          ``Cache-Control`` or ``Expires`` header
+  '''
+
+  def __init__(self, path: str = None, default_max_age: float = 0.0) -> None:
+    self.path = path
+    self.default_max_age = default_max_age
+    self.responses = {}
+    self.modified = False
+    self.lock = threading.Lock()
+    if path and os.path.isfile(path):
+      self.load(path)
+
+  def get(self, customisation: str, version: str, fresh: bool = True) -> CachedResponse:
+    '''Returns the stored response (only if it is still fresh by default).'''
+    response = self.responses.get((customisation, version))
+    if response is None or (fresh and response.expires <= time.time()):
+      return None
+    return response
+
+  def get_validators(self, customisation: str, version: str) -> dict:
+    '''Returns the headers of a conditional request for the stored response.'''
+    response = self.responses.get((customisation, version))
+    headers = {}
+    if response is not None:
+      if response.headers.get('ETag'):
+        headers['If-None-Match'] = response.headers['ETag']
+      if response.headers.get('Last-Modified'):
+        headers['If-Modified-Since'] = response.headers['Last-Modified']
+    return headers
+
+  def update(self, customisation: str, version: str, response) -> CachedResponse:
+    '''Stores a response of the update server.
+
+    :param response: the ``HTTPResponse`` of a (conditional) request
+    :returns: the response that should be used, i.e. the stored response if the
+              server answered with `304`
+    '''
+    key = (customisation, version)
+    headers = HTTPHeaderDict(response.headers)
+    max_age = _get_max_age(headers, self.default_max_age)
+    with self.lock:
+      stored = self.responses.get(key)
+      if response.status == 304 and stored is not None:
+        # Not modified: the new headers only refresh the stored response
+        merged = HTTPHeaderDict(stored.headers)
+        for name in ('Date', 'Expires', 'Cache-Control', 'ETag'):
+          if name in headers: merged[name] = headers[name]
+        result = stored._replace(headers=merged, expires=time.time() + (max_age or 0.0))
+      else:
+        result = CachedResponse(response.status, headers, response.data or b'',
+                                time.time() + (max_age or 0.0))
+        if response.status not in (200, 304, 404):
+          # Errors are never stored
+          return result
+
+      if max_age is None:
+        self.responses.pop(key, None)
+      else:
+        self.responses[key] = result
+      self.modified = True
+    return result
+
+  def load(self, path: str = None) -> None:
+    with open(path or self.path, 'r') as fp:
+      values = json.load(fp)
+    with self.lock:
+      for value in values.get('responses', []):
+        if 'body' in value:
+          data = base64.b64decode(value['body'])
+        else:
+          # Caches written by older versions stored the body as text
+          data = value['data'].encode('utf-8')
+        self.responses[(value['customisation'], value['version'])] = CachedResponse(
+          value['status'], HTTPHeaderDict(value['headers']), data, value['expires']
+        )
+
+  def save(self, path: str = None) -> None:
+    '''Writes the cache to the given path (or the path it was loaded from).'''
+    path = path or self.path
+    if not path:
+      raise ValueError('No path to save the update cache')
+
+    with self.lock:
+      values = {'responses': [
+        {'customisation': customisation, 'version': version, 'status': response.status,
+         'headers': dict(response.headers), 'body': base64.b64encode(response.data).decode('ascii'),
+         'expires': response.expires}
+        for (customisation, version), response in self.responses.items()
+      ]}
+      self.modified = False
+
+    with atomic_write(path) as fp:
+      json.dump(values, fp, indent=1)
@@ -0,0 +1,234 @@
+# MIT License
+
+# Copyright (c) 2022 MatrixEditor
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+__doc__ = '''
+Firmware versions follow the structure described by ``RE_FS_VERSION``::
+
+  <release> '.' <feature> '.' <patch> '.' [ 'EX' ] <revision> '-' <branch>
+  e.g.  2  .  12  .  25c  .  EX72088  -  1A12
+
+The ``ISUCrawler`` enumerates versions of a customisation from a template and checks
+which of them can be downloaded. Templates use brace expressions for the variable
+parts: ``{a,b,c}`` for alternatives and ``{1..40}`` for numeric ranges (``{01..40}``
+keeps the leading zeros):
+
+>>> crawler = ISUCrawler(workers=16, rate=20)
+>>> for name, url in crawler.crawl('ir-mmi-FS2026-0500-0549', '2.12.25{,c}.EX72088-1A{1..40}'):
+...   print(name)
+ir-mmi-FS2026-0500-0549_V2.12.25c.EX72088-1A12
+
+All expanded versions are checked against ``RE_FS_VERSION`` before a request is sent,
+malformed ones are skipped. ``version_template()`` creates a template from a known
+version by varying the build number of its branch. Hits can be appended to a catalogue file with one firmware
+name per line (like ``bin/known-versions.txt``).
+'''
+
+import itertools
+import os
+import re
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from .netconfig import FSNetConfiguration
+from .isudata import ISU_FILE_PROVIDER_HOST, ISU_EDGE_PROVIDER_HOST, RE_FS_VERSION
+from .isuprobe import ISUProber
+
+__all__ = [
+  "ISUCrawler", "RateLimiter", "expand_template", "version_template",
+  "load_catalogue", "save_catalogue"
+]
+
+RE_TEMPLATE_RANGE = re.compile(r"^(\d+)\.\.(\d+)$")
+
+_RE_FS_VERSION = re.compile(RE_FS_VERSION)
+
+# The build number at the end of a branch, e.g. 1A12 -> (1A, 12)
+RE_BRANCH_BUILD = re.compile(r"^(.*-(?:\d+[A-Za-z]+)?)(\d+)$")
+
+def _expand_group(group: str) -> list:
+  match = RE_TEMPLATE_RANGE.match(group)
+  if match:
+    first, last = match.groups()
+    width = len(first) if first.startswith('0') and len(first) > 1 else 0
+    step = 1 if int(last) >= int(first) else -1
+    return [str(value).zfill(width) for value in range(int(first), int(last) + step, step)]
+  return group.split(',')
+
+def expand_template(template: str):
+  '''Returns a generator of all strings described by the given template.
+
+  >>> list(expand_template('1A{1..3}'))
+  ['1A1', '1A2', '1A3']
+  '''
+  parts = re.split(r"\{([^{}]*)\}", template)
+  # Even indices are literal text, odd indices brace expressions
+  choices = [[part] if index % 2 == 0 else _expand_group(part)
+             for index, part in enumerate(parts)]
+  return (''.join(values) for values in itertools.product(*choices))
+
+def version_template(version: str, builds: int = 50) -> str:
+  '''Creates a template from a version by varying the build number of its branch.
+
+  >>> version_template('2.12.25c.EX72088-1A12')
+  '2.12.25c.EX72088-1A{1..50}'
+
+  :raises ValueError: if the version does not match ``RE_FS_VERSION``
+  '''
+  if not _RE_FS_VERSION.fullmatch(version):
+    raise ValueError('Malformed version string: %s' % version)
+  match = RE_BRANCH_BUILD.match(version)
+  if not match:
+    return version
+  return '%s{1..%d}' % (match.group(1), builds)
+
+def load_catalogue(path: str) -> list:
+  '''Returns the firmware names of a catalogue file.'''
+  if not os.path.isfile(path):
+    return []
+  with open(path, 'r') as fp:
+    return [line.strip() for line in fp if line.strip()]
+
+def save_catalogue(path: str, names: list) -> int:
+  '''Appends the names not yet present to a catalogue file.
+
+  :returns: the amount of added names
+  '''
+  known = set(load_catalogue(path))
+  names = [name for name in dict.fromkeys(names) if name not in known]
+  if names:
+    newline = False
+    if known:
+      with open(path, 'rb') as fp:
+        fp.seek(-1, os.SEEK_END)
+        newline = fp.read(1) != b'\n'
+    with open(path, 'a') as fp:
+      if newline: fp.write('\n')
+      fp.write(''.join(name + '\n' for name in names))
+  return len(names)
+
+class RateLimiter:
+  '''Limits the amount of calls per second across all threads.
+
+  :param rate: the maximum amount of calls per second (``0`` for no limit)
+  '''
+
+  def __init__(self, rate: float) -> None:
+    self.interval = 1.0 / rate if rate else 0.0
+    self.next_time = time.monotonic()
+    self.lock = threading.Lock()
+
+  def acquire(self) -> None:
+    '''Blocks until the next call is allowed.'''
+    if not self.interval:
+      return
+    with self.lock:
+      now = time.monotonic()
+      wait = self.next_time - now
+      self.next_time = max(now, self.next_time) + self.interval
+    if wait > 0:
+      time.sleep(wait)
+
+class ISUCrawler:
+  '''Searches downloadable firmware versions with `HEAD` requests.
+
+  The URLs are created and checked by an ``ISUProber``, the crawler adds the rate
+  limit and the enumeration of versions.
+
+  :param workers: the amount of concurrent requests
+  :param rate: the maximum amount of requests per second (``0`` for no limit)
+  :param netconfig: a custom network configuration (passed to the prober)
+  :param timeout: the connect and read timeout in seconds
+  :param file_url: the base URL of the update server
+  :param edge_url: the base URL of the edge server
+  :param prober: the prober used to check the URLs. If none is given, a new one is 
+                 created with the parameters above.
+  '''
+
+  def __init__(self, workers: int = 16, rate: float = 20.0,
+               netconfig: FSNetConfiguration = None, timeout: float = 10.0,
+               file_url: str = 'https://' + ISU_FILE_PROVIDER_HOST,
+               edge_url: str = 'https://' + ISU_EDGE_PROVIDER_HOST,
+               prober: ISUProber = None) -> None:
+    self.workers = max(1, workers)
+    self.limiter = RateLimiter(rate)
+    self.prober = prober or ISUProber(self.workers, netconfig, timeout,
+                                      file_url=file_url, edge_url=edge_url)
+    self.checked = 0
+    self.skipped = 0
+    self.lock = threading.Lock()
+
+  def get_url(self, name: str) -> str:
+    '''Returns the URL checked for the given firmware name.'''
+    return self.prober.get_url(name)
+
+  def check(self, url: str) -> bool:
+    '''Returns whether a file is located at the given URL.'''
+    self.limiter.acquire()
+    return self.prober.check(url)
+
+  def crawl(self, customisation: str, template: str, known: list = None) -> list:
+    '''Checks all versions of the given template.
+
+    Versions that don't match ``RE_FS_VERSION`` are skipped (see ``skipped``).
+
+    :param customisation: the customisation string
+    :param template: the version template (see ``expand_template()``)
+    :param known: firmware names that should not be checked again
+    :returns: a list of ``(name, url)`` tuples of all found versions
+    '''
+    known = set(known or ())
+    names = ('%s_V%s' % (customisation, version) for version in self._versions(template))
+    names = (name for name in names if name not in known)
+    return self.crawl_names(names)
+
+  def _versions(self, template: str):
+    for version in expand_template(template):
+      if _RE_FS_VERSION.fullmatch(version):
+        yield version
+      else:
+        with self.lock: self.skipped += 1
+
+  def crawl_names(self, names) -> list:
+    '''Checks the given firmware names (any iterable, consumed lazily).'''
+    hits = []
+
+    def check(name: str) -> tuple:
+      url = self.get_url(name)
+      found = bool(url) and self.check(url)
+      with self.lock: self.checked += 1
+      return (name, url) if found else None
+
+    def collect(futures) -> None:
+      hits.extend(filter(None, (future.result() for future in futures)))
+
+    # Only a few names per worker are submitted at once, so large templates are
+    # not expanded up front.
+    with ThreadPoolExecutor(max_workers=self.workers) as executor:
+      pending = set()
+      for name in names:
+        if len(pending) >= self.workers * 2:
+          done, pending = wait(pending, return_when=FIRST_COMPLETED)
+          collect(done)
+        pending.add(executor.submit(check, name))
+      collect(wait(pending).done)
+    return sorted(hits)
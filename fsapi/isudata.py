@@ -27,17 +27,29 @@ To interact with the underlaying API, the isudata-module comes with two main-met
 * ``isu_find_update`` and
 * ``isu_get_update``.
 
+Answers of the update server can be cached with an ``UpdateCache``.
+
+To check many devices at once, ``isu_find_updates`` sends one query per distinct
+customisation and version concurrently over pooled connections:
+
+>>> devices = [ISUDevice('002261xxxxxx', 'ir-mmi-FS2026-0500-0549', '2.12.25c.EX72088-1A12'), ...]
+>>> for device, result in isu_find_updates(devices, workers=8).items():
+...   if result['update_present']: print(device.mac, result['updates'])
 '''
 
 import urllib3
 import re
 import xml.etree.ElementTree as xmltree
 
-from .netconfig import FSNetConfiguration
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+from .netconfig import FSNetConfiguration, get_default_netconfig
+from .isucache import UpdateCache, CachedResponse
 
 __all__ = [
   "ISU_FILE_PROVIDER_HOST", "ISUSoftwareElement", "isu_find_update",
-  "isu_get_update", "isu_new_url"
+  "isu_get_update", "isu_new_url", "ISUDevice", "isu_find_updates", "isu_parse_updates"
 ]
 
 ###############################################################################
@@ -47,8 +59,7 @@ __all__ = [
 ISU_FILE_PROVIDER_HOST = 'update.wifiradiofrontier.com'
 ISU_EDGE_PROVIDER_HOST = 'nuv-isu-cdn.azureedge.net'
 ISU_REQUEST_HEADERS = {
-  'User-Agent': "FSL IR/0.1",
-  'Connection': "Close"
+  'User-Agent': "FSL IR/0.1"
 }
 
 # MAC-Address structure for internet radios:
@@ -61,6 +72,10 @@ RE_FS_VERSION = r"\d*[.]\d*[.]\d*\w*\d?[.]EX\d{5}-\d*\w*\d*"
 # Example: ir-mmi-FS2026-0500-0037
 RE_FS_CUSTOMISATION = r"\w*-\w*-FS\d{4}(-\d{4}){2}"
 
+_RE_FSIR_MAC_ADDR = re.compile(RE_FSIR_MAC_ADDR)
+_RE_FS_VERSION = re.compile(RE_FS_VERSION)
+_RE_FS_CUSTOMISATION = re.compile(RE_FS_CUSTOMISATION)
+
 ###############################################################################
 # Classes
 ###############################################################################
@@ -111,6 +126,17 @@ class ISUSoftwareElement:
     self.summary = element.find('summary').text
     self.vendor = element.find('vendor').text
 
+class ISUDevice(NamedTuple):
+  '''A device that should be checked for updates by ``isu_find_updates()``.
+
+  :param mac: the MAC-Address string (``002261xxxxxx``)
+  :param customisation: the customisation string of the device
+  :param version: the version string of the device
+  '''
+  mac: str
+  customisation: str
+  version: str
+
 ###############################################################################
 # Functions
 ###############################################################################
@@ -121,7 +147,8 @@ def _url_find_update_add_parameters(url: str, parameters: dict) -> str:
 
 def isu_find_update(mac: str, customisation: str, version: str, 
                     verbose: bool = False, 
-                    netconfig: FSNetConfiguration = None) -> dict:
+                    netconfig: FSNetConfiguration = None,
+                    cache: UpdateCache = None) -> dict:
   '''Tries to find updates for the given version and customisation.
   
   :param mac: The MAC-Address string of a frontier silicon device in the following 
@@ -132,6 +159,8 @@ def isu_find_update(mac: str, customisation: str, version: str,
   :param verbose: if enabled/True, error messages will be printed to stdout
   :param netconfig: if a custom configuration like a proxy should be used, this 
                     object can be passed as a parameter
+  :param cache: an ``UpdateCache`` that answers the query while the stored response
+                is fresh and is revalidated otherwise
 
   :returns: ``None`` if an error occurred or a dictionary with the following structure 
             if one ore more updates are present::
@@ -143,17 +172,8 @@ def isu_find_update(mac: str, customisation: str, version: str,
               }
   '''
 
-  result = {'update_present': False, 'headers': None, 'updates': []}
-  if not re.match(RE_FSIR_MAC_ADDR, mac):
-    if verbose: print("[-] Failed to find an update: malformed MAC-Address")
-    return result
-  
-  if not re.match(RE_FS_CUSTOMISATION, customisation):
-    if verbose: print("[-] Failed to find an update: malformed customisation string")
-    return result
-
-  if not re.match(RE_FS_VERSION, version):
-    if verbose: print("[-] Failed to find an update: malformed version string")
+  result = _find_update_check(mac, customisation, version, verbose)
+  if result is not None:
     return result
 
   url = _url_find_update_add_parameters('https://' + ISU_FILE_PROVIDER_HOST, {
@@ -162,52 +182,178 @@ def isu_find_update(mac: str, customisation: str, version: str,
     'version': version
   })
 
-  if netconfig:
-    response = netconfig.delegate_request('GET', url, ISU_REQUEST_HEADERS)
-    response.chunked
-  else:
-    pool = urllib3.HTTPSConnectionPool(host=ISU_FILE_PROVIDER_HOST, headers=ISU_REQUEST_HEADERS)
-    response = pool.request('GET', url)
-    pool.close()
+  netconfig = netconfig or get_default_netconfig()
 
-  if response.status == 404:
-    if verbose: print("[-] Update not found: invalid version or customisation")
-    return result
-  elif response.status == 304:
-    if verbose: print("[-] No Update available for: ", customisation)
+  def request(url: str, headers: dict, **kwargs) -> urllib3.HTTPResponse:
+    headers = dict(ISU_REQUEST_HEADERS, **headers) if headers else ISU_REQUEST_HEADERS
+    return netconfig.delegate_request('GET', url, headers, **kwargs)
+
+  response = _find_update_request(request, url, customisation, version, cache)
+  return _find_update_parse(response, customisation, verbose)
+
+def _find_update_request(request, url: str, customisation: str, version: str,
+                         cache: UpdateCache):
+  # Sends the query unless the cache contains a fresh answer
+  if cache is None:
+    return request(url, None, preload_content=False)
+  response = cache.get(customisation, version)
+  if response is None:
+    response = request(url, cache.get_validators(customisation, version))
+    response = cache.update(customisation, version, response)
+  return response
+
+def _find_update_check(mac: str, customisation: str, version: str, verbose: bool) -> dict:
+  # Returns an empty result if the parameters are malformed, None otherwise
+  result = {'update_present': False, 'headers': None, 'updates': []}
+  if not mac or not _RE_FSIR_MAC_ADDR.match(mac):
+    if verbose: print("[-] Failed to find an update: malformed MAC-Address")
     return result
   
-  if response.status != 200:
-    if verbose: print("[-] Unexpected result code:", response.status)
+  if not customisation or not _RE_FS_CUSTOMISATION.match(customisation):
+    if verbose: print("[-] Failed to find an update: malformed customisation string")
     return result
-  else:
-    try:
-      result['headers'] = response.headers
-      content = str(response.data, 'utf-8')
 
-      pos = content.find('<?xml')
-      if pos == -1:
-        if verbose: print("[-] Unexpected result: XML-Content missing")
-        return result
-      else:
-        content = content[pos:pos+content.find('</updates>', pos)+9]
-        root = xmltree.fromstring(content)
-        updates = []
-        for software in root:
-          s = ISUSoftwareElement()
-          s.loadxml(software)
-          updates.append(s)
-
-        result['updates'] = updates
+  if not version or not _RE_FS_VERSION.match(version):
+    if verbose: print("[-] Failed to find an update: malformed version string")
+    return result
+  return None
+
+def _find_update_parse(response: urllib3.HTTPResponse, customisation: str,
+                       verbose: bool) -> dict:
+  result = {'update_present': False, 'headers': None, 'updates': []}
+  try:
+    if response.status == 404:
+      if verbose: print("[-] Update not found: invalid version or customisation")
+      return result
+    elif response.status == 304:
+      if verbose: print("[-] No Update available for: ", customisation)
+      return result
+    
+    if response.status != 200:
+      if verbose: print("[-] Unexpected result code:", response.status)
+      return result
+    else:
+      try:
+        result['headers'] = response.headers
+        if isinstance(response, CachedResponse):
+          chunks = [response.data]
+        else:
+          chunks = response.stream(0x4000)
+
+        result['updates'] = list(isu_parse_updates(chunks))
         result['update_present'] = True
         return result
-    except Exception as e:
-      if verbose: print("[-] Error while parsing response: %s" % e)
-      return result
+      except Exception as e:
+        if verbose: print("[-] Error while parsing response: %s" % e)
+        return result
+  finally:
+    if not isinstance(response, CachedResponse):
+      response.drain_conn()
+      response.release_conn()
+
+def isu_parse_updates(chunks):
+  '''Parses the XML answer of ``FindUpdate.aspx`` while it is received.
+
+  Everything in front of the XML declaration and after the root element is ignored.
+  Parsed elements are removed from the document, so the memory needed does not grow
+  with the size of the answer.
+
+  :param chunks: an iterable of ``bytes`` (e.g. ``response.stream()``)
+  :raises ValueError: if the answer contains no XML content
+  :raises xml.etree.ElementTree.ParseError: if the XML content is malformed
+  :returns: a generator of ``ISUSoftwareElement`` objects
+  '''
+  parser = xmltree.XMLPullParser(events=('start', 'end'))
+  prefix, started, depth, root = b'', False, 0, None
+  for chunk in chunks:
+    if not started:
+      # The declaration may be split between two chunks
+      prefix += chunk
+      pos = prefix.find(b'<?xml')
+      if pos == -1:
+        prefix = prefix[-4:]
+        continue
+      chunk, started = prefix[pos:], True
+
+    parser.feed(chunk)
+    for event, element in parser.read_events():
+      if event == 'start':
+        if root is None: root = element
+        depth += 1
+        continue
+
+      depth -= 1
+      if depth == 1:
+        software = ISUSoftwareElement()
+        software.loadxml(element)
+        root.remove(element)
+        yield software
+      elif depth == 0:
+        return
+
+  if not started:
+    raise ValueError('XML-Content missing')
+  parser.close()
+
+def isu_find_updates(devices: list, workers: int = 8, verbose: bool = False,
+                     netconfig: FSNetConfiguration = None,
+                     base_url: str = 'https://' + ISU_FILE_PROVIDER_HOST,
+                     cache: UpdateCache = None) -> dict:
+  '''Checks many devices for updates.
+
+  Devices with the same customisation and version share one query (sent with the
+  MAC-Address of the first of them). All queries are sent concurrently and reuse
+  their connections to the update server.
+
+  :param devices: a list of ``ISUDevice`` objects (or ``(mac, customisation, version)``
+                  tuples)
+  :param workers: the amount of concurrent queries
+  :param verbose: if enabled/True, error messages will be printed to stdout
+  :param netconfig: if a custom configuration like a proxy should be used, this 
+                    object can be passed as a parameter
+  :param base_url: the URL of the update server
+  :param cache: an ``UpdateCache`` (see ``isu_find_update()``)
+
+  :returns: a dictionary mapping each device to the result of its query as returned
+            by ``isu_find_update()``. Devices sharing a query share the result object.
+  '''
+  if netconfig is None:
+    netconfig = FSNetConfiguration(maxsize=workers, timeout=10.0)
+  request = lambda url, extra, **kwargs: netconfig.delegate_request(
+    'GET', url, dict(ISU_REQUEST_HEADERS, **extra) if extra else ISU_REQUEST_HEADERS, **kwargs)
+
+  results, queries = {}, {}
+  for device in map(lambda x: ISUDevice(*x), devices):
+    result = _find_update_check(device.mac, device.customisation, device.version, verbose)
+    if result is not None:
+      results[device] = result
+    else:
+      queries.setdefault((device.customisation, device.version), []).append(device)
+
+  def find(key: tuple) -> dict:
+    customisation, version = key
+    url = _url_find_update_add_parameters(base_url, {
+      'mac': queries[key][0].mac,
+      'customisation': customisation,
+      'version': version
+    })
+    try:
+      response = _find_update_request(request, url, customisation, version, cache)
+      return _find_update_parse(response, customisation, verbose)
+    except urllib3.exceptions.HTTPError as error:
+      if verbose: print("[-] Failed to find an update for %s: %s" % (customisation, error))
+      return {'update_present': False, 'headers': None, 'updates': []}
+
+  with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+    for key, result in zip(queries, executor.map(find, queries)):
+      for device in queries[key]:
+        results[device] = result
+  return results
 
 def isu_get_update(path: str, url: str = None, software: ISUSoftwareElement = None,
                    verbose: bool = False,
-                   netconfig: FSNetConfiguration = None):
+                   netconfig: FSNetConfiguration = None,
+                   store = None, inspect = None):
   '''Tries to download and save the firmware binary located at the given URL.
 
   :param path: an absolute or relative path to the output file
@@ -218,32 +364,39 @@ def isu_get_update(path: str, url: str = None, software: ISUSoftwareElement = No
   :param verbose: if enabled/True, error messages will be printed to stdout
   :param netconfig: if a custom configuration like a proxy should be used, this object
                     can be passed as a parameter
+  :param store: a ``FirmwareStore`` that is searched before downloading the file and
+                that receives the downloaded file
+  :param inspect: a callback receiving the ``DownloadTask``, the ``ISUStream`` and the
+                  parsed stage while the file is downloaded. Returning ``False``
+                  aborts the download.
+
+  The file is downloaded to ``<path>.part`` first, so an interrupted download is
+  continued by the next call. If ``software`` is given, the size and MD5 hash of the
+  file are verified.
+
+  :returns: the ``DownloadResult`` or ``None`` if no URL was given
   '''
 
   if not url and (not software or not software.download_url):
     if verbose: print("[-] Invalid choice of parameters: either url or software has to be nonnull")
     return
   
+  # Imported here, because the isudownload module depends on this one
+  from .isudownload import ISUDownloader, DownloadTask
+
   url = url if url else software.download_url
-  if netconfig:
-    response = netconfig.delegate_request('GET', url, ISU_REQUEST_HEADERS, preload_content=False)
-    response.chunked
-  else:
-    if 'https' not in url: url = url.replace('http', 'https')
-    pool = urllib3.HTTPSConnectionPool(host=url.split("/")[2], headers=ISU_REQUEST_HEADERS, timeout=5)
-    response = pool.request('GET', url, preload_content=False)
-    
-  if response.status != 200:
-    if verbose: print("[-] Unexpected result code:", response.status)
-    response.release_conn()
-    return
-  try:
-    with open(path, 'wb') as _res:
-      for chunk in response.stream(4096*16):
-        if chunk: _res.write(chunk)
-  except TimeoutError:
-    print('[-] Timeout Error...')
-  response.release_conn()
+  if not netconfig and url.startswith('http://'):
+    url = 'https://' + url[len('http://'):]
+
+  downloader = ISUDownloader(workers=1, netconfig=netconfig, store=store, inspect=inspect)
+  result = downloader.fetch(DownloadTask(url, path, software))
+  if result.error and verbose:
+    print("[-] Download failed:", result.error)
+  elif result.cached and verbose:
+    print("[+] Found in firmware store:", path)
+  if store and not result.cached and not result.error:
+    store.save()
+  return result
 
 def isu_new_url(name: str) -> str:
   '''An URL generator for the given product descriptor.
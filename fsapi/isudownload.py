@@ -0,0 +1,514 @@
+# MIT License
+
+# Copyright (c) 2022 MatrixEditor
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+__doc__ = '''
+Downloading a whole firmware catalogue one file after another is limited by the
+latency of each request. The ``ISUDownloader`` fetches many firmware binaries
+concurrently and reuses the connections to each host:
+
+>>> downloader = ISUDownloader(workers=8, progress=print)
+>>> tasks = [DownloadTask(isu_new_url(name), 'isu-download/%s.isu.bin' % name)
+...          for name in names]
+>>> for result in downloader.download(tasks):
+...   if result.error: print(result.path, result.error)
+
+The progress callback receives a ``DownloadProgress`` object with the aggregate
+state of all downloads.
+
+Each file is written to ``<path>.part`` first and renamed to ``<path>`` once it is
+complete, so the output path never contains a truncated file. If a download is
+interrupted, the next attempt continues the ``.part`` file with a HTTP `Range`
+request. When the task contains an ``ISUSoftwareElement``, its ``size`` and
+``md5hash`` are verified while the file is written.
+
+Large images (``.ota.bin`` files or files bigger than ``segment_threshold``) are
+split into ``segments`` ranges that are downloaded in parallel, if the server
+supports range requests.
+
+With a ``FirmwareStore``, files that are already stored are exported from there
+instead of being downloaded again.
+
+An ``inspect`` callback receives the header, partitions and `FSH1` index of each
+file while it is being downloaded (see ``ISUStream``). Returning ``False`` aborts
+the download and removes the partial file:
+
+>>> def inspect(task: DownloadTask, stream: ISUStream, stage: str) -> bool:
+...   return stage != STREAM_HEADER or stream.header.meos_version == 2
+>>> downloader = ISUDownloader(workers=8, inspect=inspect)
+
+Segmented downloads are inspected while their segments are joined, so they can't
+be aborted early.
+'''
+
+import hashlib
+import os
+import re
+import threading
+import time
+import urllib3
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import NamedTuple
+
+from .netconfig import FSNetConfiguration
+from .isudata import ISUSoftwareElement, ISU_REQUEST_HEADERS
+from .isustore import FirmwareStore, get_firmware_name
+from .isu.stream import ISUStream
+from .isu.walk import ISUHeader
+from .isu.fsfs import FSFSTree
+
+__all__ = [
+  "ISU_DOWNLOAD_HEADERS", "DownloadTask", "DownloadResult", "DownloadProgress",
+  "ISUDownloader", "DownloadError", "PART_SUFFIX"
+]
+
+ISU_DOWNLOAD_HEADERS = dict(ISU_REQUEST_HEADERS)
+
+# The suffix of incomplete downloads
+PART_SUFFIX = '.part'
+
+# Example: bytes 100-199/1000
+RE_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+class DownloadError(IOError):
+  """Raised if a download failed.
+
+  :param message: the error message
+  :param status: the HTTP status code (if any)
+  :param corrupt: whether the downloaded data is invalid and can't be resumed
+  """
+  def __init__(self, message: str, status: int = None, corrupt: bool = False) -> None:
+    super().__init__(message)
+    self.status = status
+    self.corrupt = corrupt
+
+class DownloadTask(NamedTuple):
+  '''A single file to download.
+
+  :param url: the download URL
+  :param path: the output file
+  :param software: the software element describing the file (optional)
+  '''
+  url: str
+  path: str
+  software: ISUSoftwareElement = None
+
+class DownloadResult(NamedTuple):
+  '''The result of a ``DownloadTask``.
+
+  :param url: the download URL
+  :param path: the output file
+  :param size: the amount of bytes written (for failed downloads the amount of bytes
+               received so far, including the resumed part)
+  :param status: the HTTP status code (``None`` if no response was received)
+  :param error: the error message if the download failed
+  :param elapsed: the time spent on this download in seconds
+  :param cached: whether the file was taken from a ``FirmwareStore``
+  :param expected: the expected file size (``0`` if unknown)
+  :param header: the ``ISUHeader`` read by the inspect callback's stream (if any)
+  :param partitions: the partitions read by the inspect callback's stream (if any)
+  :param archive: the last `FSH1` index read by the inspect callback's stream (if any)
+  '''
+  url: str
+  path: str
+  size: int = 0
+  status: int = None
+  error: str = None
+  elapsed: float = 0.0
+  cached: bool = False
+  expected: int = 0
+  header: ISUHeader = None
+  partitions: list = None
+  archive: FSFSTree = None
+
+class _Transfer:
+  # The state of a single download, which is reported even if it fails
+  __slots__ = ('received', 'expected', 'status')
+
+  def __init__(self, expected: int = 0) -> None:
+    self.received = 0
+    self.expected = expected
+    self.status = None
+
+class DownloadProgress:
+  '''The aggregate progress of all downloads of an ``ISUDownloader``.
+
+  ``bytes_total`` only contains the sizes that are known, i.e. the sizes of the
+  downloads that have been started.
+  '''
+
+  def __init__(self, files_total: int = 0) -> None:
+    self.files_total = files_total
+    self.files_done = 0
+    self.files_failed = 0
+    self.bytes_total = 0
+    self.bytes_done = 0
+    self.started = time.monotonic()
+    self.lock = threading.Lock()
+
+  def get_rate(self) -> float:
+    '''Returns the average download rate in bytes per second.'''
+    elapsed = time.monotonic() - self.started
+    return self.bytes_done / elapsed if elapsed > 0 else 0.0
+
+  def __str__(self) -> str:
+    return '%d/%d files (%d failed), %.1f/%.1f MiB, %.2f MiB/s' % (
+      self.files_done, self.files_total, self.files_failed, self.bytes_done / 0x100000,
+      self.bytes_total / 0x100000, self.get_rate() / 0x100000
+    )
+
+class ISUDownloader:
+  '''Downloads firmware binaries concurrently.
+
+  :param workers: the amount of concurrent downloads
+  :param netconfig: a custom network configuration. If none is given, a connection pool
+                    that keeps up to ``workers * segments`` connections per host is used.
+  :param timeout: the connect and read timeout in seconds
+  :param chunk_size: the size of each chunk read from a response
+  :param progress: a callback receiving the ``DownloadProgress``
+  :param progress_interval: the minimum time in seconds between two progress callbacks
+  :param resume: whether existing ``.part`` files should be continued
+  :param segments: the amount of parallel ranges per large file (``1`` to disable)
+  :param segment_threshold: the minimum size in bytes of a file split into segments
+  :param store: a ``FirmwareStore`` that is checked before each download and receives
+                all downloaded files
+  :param inspect: a callback receiving the ``DownloadTask``, its ``ISUStream`` and the
+                  stage that has been parsed. If it returns ``False``, the download
+                  is aborted.
+  '''
+
+  def __init__(self, workers: int = 4, netconfig: FSNetConfiguration = None,
+               timeout: float = 30.0, chunk_size: int = 0x10000, progress = None,
+               progress_interval: float = 0.5, resume: bool = True, segments: int = 4,
+               segment_threshold: int = 0x1000000, store: FirmwareStore = None,
+               inspect = None) -> None:
+    self.workers = max(1, workers)
+    self.chunk_size = chunk_size
+    self.progress_callback = progress
+    self.progress_interval = progress_interval
+    self.resume = resume
+    self.segments = max(1, segments)
+    self.segment_threshold = segment_threshold
+    self.store = store
+    self.inspect = inspect
+    self.progress = None
+    self._last_progress = 0.0
+    if netconfig is None:
+      netconfig = FSNetConfiguration(
+        maxsize=self.workers * self.segments,
+        timeout=urllib3.Timeout(connect=timeout, read=timeout),
+        retries=urllib3.Retry(3, backoff_factor=0.5)
+      )
+    self.netconfig = netconfig
+
+  def download(self, tasks: list):
+    '''Downloads all given files.
+
+    :param tasks: a list of ``DownloadTask`` objects
+    :returns: a generator of ``DownloadResult`` objects in the order the downloads finish
+    '''
+    tasks = list(tasks)
+    self.progress = DownloadProgress(len(tasks))
+    with ThreadPoolExecutor(max_workers=self.workers) as executor:
+      futures = [executor.submit(self.fetch, task) for task in tasks]
+      try:
+        for future in as_completed(futures):
+          yield future.result()
+      finally:
+        for future in futures: future.cancel()
+    self._report(force=True)
+    if self.store: self.store.save()
+
+  def fetch(self, task: DownloadTask) -> DownloadResult:
+    '''Downloads and verifies a single file.
+
+    If the download fails, the ``.part`` file is kept so that it can be resumed,
+    unless the data turned out to be invalid.
+    '''
+    start = time.monotonic()
+    if self.store:
+      entry = self.store.lookup(task.url, task.software)
+      if entry:
+        self.store.export(entry, task.path)
+        self._finish()
+        return DownloadResult(task.url, task.path, entry.size, elapsed=time.monotonic() - start,
+                              cached=True, expected=entry.size)
+
+    part_path = task.path + PART_SUFFIX
+    transfer = _Transfer(task.software.size if task.software and task.software.size else 0)
+    stream = self._new_stream(task)
+    try:
+      if not self.resume:
+        self._remove(part_path)
+
+      length = self._get_segmented_length(task)
+      if length:
+        status, size, md5 = self._fetch_segmented(task, part_path, length, stream, transfer)
+      else:
+        status, size, md5 = self._fetch_single(task, part_path, stream, transfer)
+
+      self._verify(task, size, md5)
+      os.replace(part_path, task.path)
+      if self.store:
+        software = task.software
+        name = None
+        if software and software.customisation and software.version:
+          name = get_firmware_name(software.customisation, software.version)
+        self.store.add(task.path, name, task.url, move=True)
+    except Exception as error:
+      if getattr(error, 'corrupt', False):
+        self._remove(part_path)
+      self._finish(failed=True)
+      return DownloadResult(task.url, task.path, transfer.received,
+                            getattr(error, 'status', None) or transfer.status, str(error),
+                            time.monotonic() - start, expected=transfer.expected,
+                            **self._inspection(stream))
+
+    self._finish()
+    return DownloadResult(task.url, task.path, size, status, elapsed=time.monotonic() - start,
+                          expected=transfer.expected or size, **self._inspection(stream))
+
+  def _request(self, url: str, byte_range: str = None) -> urllib3.HTTPResponse:
+    headers = ISU_DOWNLOAD_HEADERS
+    if byte_range:
+      headers = dict(headers, Range='bytes=%s' % byte_range)
+    return self.netconfig.delegate_request('GET', url, headers, preload_content=False)
+
+  def _new_stream(self, task: DownloadTask) -> ISUStream:
+    if not self.inspect:
+      return None
+    callback = lambda stream, stage: self.inspect(task, stream, stage)
+    return ISUStream(callback=callback, total=task.software.size if task.software else 0)
+
+  def _inspection(self, stream: ISUStream) -> dict:
+    # Only the parsed values are kept, the stream releases its buffers
+    if not stream:
+      return {}
+    stream.close()
+    return {'header': stream.header, 'partitions': stream.partitions,
+            'archive': stream.archive}
+
+  def _feed(self, stream: ISUStream, chunk: bytes, status: int = None) -> None:
+    if stream and not stream.feed(chunk):
+      raise DownloadError('Aborted after inspecting the %s' % stream.stages[-1], status,
+                          corrupt=True)
+
+  def _fetch_single(self, task: DownloadTask, part_path: str, stream: ISUStream = None,
+                    transfer: _Transfer = None) -> tuple:
+    # Returns the status, the file size and the MD5 hash object (if needed)
+    transfer = transfer or _Transfer()
+    offset = os.path.getsize(part_path) if os.path.isfile(part_path) else 0
+    expected = task.software.size if task.software and task.software.size else 0
+    if expected and offset > expected:
+      self._remove(part_path)
+      offset = 0
+    transfer.received = offset
+
+    response = self._request(task.url, '%d-' % offset if offset else None)
+    status = transfer.status = response.status
+    try:
+      if status == 416 and offset:
+        # The part can't be continued, start again from the beginning
+        response.drain_conn()
+        response.release_conn()
+        self._remove(part_path)
+        return self._fetch_single(task, part_path, stream, transfer)
+
+      if status == 206:
+        match = RE_CONTENT_RANGE.match(response.headers.get('Content-Range', ''))
+        if not match or int(match.group(1)) != offset:
+          raise DownloadError('Invalid Content-Range: %s' % response.headers.get('Content-Range'),
+                              status, corrupt=True)
+      elif status == 200:
+        offset = transfer.received = 0
+      else:
+        raise DownloadError('Unexpected result code: %d' % status, status)
+
+      length = response.headers.get('Content-Length')
+      if length:
+        length = int(length)
+        if expected and offset + length != expected:
+          raise DownloadError('Unexpected size: %d (expected %d)' % (offset + length, expected),
+                              status, corrupt=True)
+        self._add_total(length)
+        if stream and not stream.total: stream.total = offset + length
+        if not transfer.expected: transfer.expected = offset + length
+
+      md5 = self._new_md5(task)
+      if offset and (md5 or stream):
+        self._read_part(part_path, md5, stream)
+
+      size = offset
+      with open(part_path, 'ab' if offset else 'wb') as fp:
+        for chunk in response.stream(self.chunk_size):
+          size += len(chunk)
+          if expected and size > expected:
+            raise DownloadError('Received more than %d bytes' % expected, status, corrupt=True)
+          self._feed(stream, chunk, status)
+          fp.write(chunk)
+          transfer.received = size
+          if md5: md5.update(chunk)
+          self._advance(len(chunk))
+
+      if length and size != offset + length:
+        raise DownloadError('Incomplete download: %d of %d bytes' % (size, offset + length), status)
+      return status, size, md5
+    except BaseException:
+      # The rest of the body is still unread, so the connection can't be reused
+      response.close()
+      raise
+    finally:
+      response.release_conn()
+
+  def _get_segmented_length(self, task: DownloadTask) -> int:
+    # Returns the file size if the file should be downloaded in segments
+    if self.segments < 2:
+      return 0
+    size = task.software.size if task.software and task.software.size else 0
+    if size < self.segment_threshold and not task.url.split('?')[0].endswith('.ota.bin'):
+      return 0
+
+    response = self.netconfig.delegate_request('HEAD', task.url, ISU_DOWNLOAD_HEADERS)
+    if response.status != 200 or response.headers.get('Accept-Ranges', '').lower() != 'bytes':
+      return 0
+    length = int(response.headers.get('Content-Length') or 0)
+    return length if length >= self.segment_threshold else 0
+
+  def _fetch_segmented(self, task: DownloadTask, part_path: str, length: int,
+                       stream: ISUStream = None, transfer: _Transfer = None) -> tuple:
+    transfer = transfer or _Transfer(length)
+    if not transfer.expected: transfer.expected = length
+    if task.software and task.software.size and task.software.size != length:
+      raise DownloadError('Unexpected size: %d (expected %d)' % (length, task.software.size),
+                          corrupt=True)
+    self._add_total(length)
+
+    step = -(-length // self.segments)
+    ranges = [(start, min(start + step, length) - 1) for start in range(0, length, step)]
+    paths = ['%s.%d' % (part_path, index) for index in range(len(ranges))]
+    try:
+      with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [executor.submit(self._fetch_segment, task.url, path, first, last)
+                   for path, (first, last) in zip(paths, ranges)]
+        for future in futures:
+          future.result()
+    finally:
+      transfer.received = sum(os.path.getsize(path) for path in paths if os.path.isfile(path))
+
+    # Join the segments and hash the result while doing so
+    md5 = self._new_md5(task)
+    if stream: stream.total = length
+    try:
+      with open(part_path, 'wb') as fp:
+        for path in paths:
+          with open(path, 'rb') as segment:
+            for chunk in iter(lambda: segment.read(self.chunk_size), b''):
+              self._feed(stream, chunk, 206)
+              fp.write(chunk)
+              if md5: md5.update(chunk)
+    except DownloadError:
+      for path in paths: self._remove(path)
+      raise
+    for path in paths:
+      os.remove(path)
+    return 206, length, md5
+
+  def _fetch_segment(self, url: str, path: str, first: int, last: int) -> None:
+    size = last - first + 1
+    offset = os.path.getsize(path) if os.path.isfile(path) else 0
+    if offset > size:
+      self._remove(path)
+      offset = 0
+    self._advance(offset)
+    if offset == size:
+      return
+
+    response = self._request(url, '%d-%d' % (first + offset, last))
+    try:
+      if response.status != 206:
+        raise DownloadError('Range request not supported: %d' % response.status,
+                            response.status)
+      with open(path, 'ab') as fp:
+        for chunk in response.stream(self.chunk_size):
+          offset += len(chunk)
+          if offset > size:
+            raise DownloadError('Received more than the requested range', response.status,
+                                corrupt=True)
+          fp.write(chunk)
+          self._advance(len(chunk))
+    except BaseException:
+      response.close()
+      raise
+    finally:
+      response.release_conn()
+    if offset != size:
+      raise DownloadError('Incomplete segment: %d of %d bytes' % (offset, size))
+
+  def _new_md5(self, task: DownloadTask):
+    if task.software and task.software.md5hash:
+      return hashlib.md5()
+    return None
+
+  def _read_part(self, path: str, md5, stream: ISUStream) -> None:
+    # Passes the data of a resumed download to the hash and the inspection
+    with open(path, 'rb') as fp:
+      for chunk in iter(lambda: fp.read(self.chunk_size), b''):
+        if md5: md5.update(chunk)
+        self._feed(stream, chunk)
+
+  def _verify(self, task: DownloadTask, size: int, md5) -> None:
+    software = task.software
+    if not software:
+      return
+    if software.size and size != software.size:
+      raise DownloadError('Unexpected size: %d (expected %d)' % (size, software.size),
+                          corrupt=True)
+    if md5 and md5.hexdigest() != software.md5hash.strip().lower():
+      raise DownloadError('MD5 mismatch: %s (expected %s)' % (md5.hexdigest(), software.md5hash),
+                          corrupt=True)
+
+  def _remove(self, path: str) -> None:
+    if os.path.exists(path):
+      os.remove(path)
+
+  def _add_total(self, size: int) -> None:
+    if self.progress:
+      with self.progress.lock: self.progress.bytes_total += size
+
+  def _advance(self, size: int) -> None:
+    if self.progress and size:
+      with self.progress.lock: self.progress.bytes_done += size
+      self._report()
+
+  def _finish(self, failed: bool = False) -> None:
+    if self.progress:
+      with self.progress.lock:
+        self.progress.files_done += 1
+        if failed: self.progress.files_failed += 1
+      self._report()
+
+  def _report(self, force: bool = False) -> None:
+    if not self.progress_callback or not self.progress:
+      return
+    now = time.monotonic()
+    if force or now - self._last_progress >= self.progress_interval:
+      self._last_progress = now
+      self.progress_callback(self.progress)
@@ -0,0 +1,208 @@
+# MIT License
+
+# Copyright (c) 2022 MatrixEditor
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+__doc__ = '''
+``isu_new_url()`` returns exactly one guess per firmware name, but the names found
+on devices and in update lists don't follow one scheme: the version may be joined
+with ``_V``, ``-V``, ``.`` or ``_`` and the file may be located on the edge server
+(``srupdates``/``nsupdates``) or behind ``Update.aspx``. ``isu_url_candidates()``
+returns all plausible URLs of a name and the ``ISUProber`` checks them with `HEAD`
+requests:
+
+>>> prober = ISUProber(workers=16, cache_path='urls.json')
+>>> urls = prober.probe(['ir-mmi-FS2026-0500-0549_V2.12.25c.EX72088-1A12', ...])
+>>> urls['ir-mmi-FS2026-0500-0549_V2.12.25c.EX72088-1A12']
+'https://update.wifiradiofrontier.com/Update.aspx?f=/updates/ir-mmi-FS2026-0500-0549.2.12.25c.EX72088-1A12.isu.bin'
+
+The candidates of all names are checked in one parallel pass, most likely ones
+first. Candidates of a name that was already found are skipped and confirmed URLs
+are cached.
+'''
+
+import json
+import os
+import re
+import threading
+import urllib3
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .fileutil import atomic_write
+from .netconfig import FSNetConfiguration
+from .isudata import (
+  ISU_FILE_PROVIDER_HOST, ISU_EDGE_PROVIDER_HOST, ISU_REQUEST_HEADERS, isu_new_url
+)
+
+__all__ = [
+  "ISUProber", "isu_url_candidates", "split_firmware_name", "PROBE_CACHE_PATH"
+]
+
+PROBE_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.fsapi', 'urls.json')
+
+# Names without a 'V' separator, e.g. ns-mmi-FS5332-0000-0007_1.0.57-37
+RE_FIRMWARE_NAME = re.compile(r"^(.*?-FS\d{4}-\d{4}-\d{4})[_.](.+)$")
+
+# The ways to join customisation and version
+FIRMWARE_NAME_SEPARATORS = ('_V', '-V', '.', '_')
+
+def split_firmware_name(name: str) -> tuple:
+  '''Splits a firmware name into its customisation and version.
+
+  :returns: a ``(customisation, version)`` tuple or ``None`` if the name can't be split
+  '''
+  for separator in ('_V', '-V'):
+    if separator in name:
+      customisation, version = name.split(separator, 1)
+      return customisation, version
+  match = RE_FIRMWARE_NAME.match(name)
+  return match.groups() if match else None
+
+def _isu_new_url(name: str, file_url: str, edge_url: str) -> str:
+  # The URL of isu_new_url() on the given servers
+  url = isu_new_url(name)
+  if url:
+    url = url.replace('https://' + ISU_FILE_PROVIDER_HOST, file_url, 1)
+    url = url.replace('https://' + ISU_EDGE_PROVIDER_HOST, edge_url, 1)
+  return url
+
+def isu_url_candidates(name: str, file_url: str = 'https://' + ISU_FILE_PROVIDER_HOST,
+                       edge_url: str = 'https://' + ISU_EDGE_PROVIDER_HOST) -> list:
+  '''Returns all plausible download URLs of the given firmware name.
+
+  The URL generated by ``isu_new_url()`` is always the first one.
+
+  :param name: the firmware name
+  :param file_url: the base URL of the update server
+  :param edge_url: the base URL of the edge server
+  '''
+  candidates = []
+  url = _isu_new_url(name, file_url, edge_url)
+  if url:
+    candidates.append(url)
+
+  values = split_firmware_name(name)
+  if not values:
+    return candidates
+
+  customisation, version = values
+  names = [name] + [customisation + separator + version for separator in FIRMWARE_NAME_SEPARATORS]
+  for variant in dict.fromkeys(names):
+    candidates.extend([
+      '%s/Update.aspx?f=/updates/%s.isu.bin' % (file_url, variant),
+      '%s/srupdates/srupdates/%s/%s.isu.bin' % (edge_url, customisation, variant),
+      '%s/nsupdates/nsupdates/%s/%s.ota.bin' % (edge_url, customisation, variant),
+    ])
+  return list(dict.fromkeys(candidates))
+
+class ISUProber:
+  '''Finds the download URLs of firmware binaries.
+
+  :param workers: the amount of concurrent requests
+  :param netconfig: a custom network configuration. If none is given, a connection pool
+                    that keeps up to ``workers`` connections per host is used.
+  :param timeout: the connect and read timeout in seconds
+  :param cache_path: a JSON file storing all confirmed URLs
+  :param file_url: the base URL of the update server
+  :param edge_url: the base URL of the edge server
+  '''
+
+  def __init__(self, workers: int = 16, netconfig: FSNetConfiguration = None,
+               timeout: float = 10.0, cache_path: str = None,
+               file_url: str = 'https://' + ISU_FILE_PROVIDER_HOST,
+               edge_url: str = 'https://' + ISU_EDGE_PROVIDER_HOST) -> None:
+    self.workers = max(1, workers)
+    self.file_url = file_url
+    self.edge_url = edge_url
+    self.cache_path = cache_path
+    self.confirmed = {}
+    self.modified = False
+    self.lock = threading.Lock()
+    if netconfig is None:
+      netconfig = FSNetConfiguration(
+        maxsize=self.workers, timeout=urllib3.Timeout(connect=timeout, read=timeout),
+        retries=urllib3.Retry(2, redirect=3, backoff_factor=0.2)
+      )
+    self.netconfig = netconfig
+    if cache_path and os.path.isfile(cache_path):
+      with open(cache_path, 'r') as fp:
+        self.confirmed.update(json.load(fp).get('urls', {}))
+
+  def get_url(self, name: str) -> str:
+    '''Returns the most likely URL of the given firmware name (see ``isu_new_url()``).'''
+    return _isu_new_url(name, self.file_url, self.edge_url)
+
+  def check(self, url: str) -> bool:
+    '''Returns whether a file is located at the given URL.'''
+    try:
+      response = self.netconfig.delegate_request('HEAD', url, ISU_REQUEST_HEADERS)
+    except urllib3.exceptions.HTTPError:
+      return False
+    return response.status == 200 and response.headers.get('Content-Length') != '0'
+
+  def probe(self, names: list) -> dict:
+    '''Searches the download URL of each given firmware name.
+
+    :returns: a dictionary mapping each name to its URL (``None`` if not found)
+    '''
+    names = list(dict.fromkeys(name.strip() for name in names if name and name.strip()))
+    results = {name: self.confirmed.get(name) for name in names}
+    candidates = {name: isu_url_candidates(name, self.file_url, self.edge_url)
+                  for name in names if not results[name]}
+
+    # The best candidate of a name found so far (as index into its candidates)
+    found = {}
+
+    def check(name: str, index: int) -> None:
+      with self.lock:
+        if found.get(name, index + 1) < index:
+          return
+      if self.check(candidates[name][index]):
+        with self.lock:
+          if found.get(name, index + 1) > index:
+            found[name] = index
+
+    # All first candidates are checked before all second ones and so on, so names
+    # are usually found before their less likely candidates are checked.
+    tasks = []
+    for index in range(max(map(len, candidates.values()), default=0)):
+      tasks.extend((name, index) for name in candidates if index < len(candidates[name]))
+
+    with ThreadPoolExecutor(max_workers=self.workers) as executor:
+      for _ in executor.map(lambda task: check(*task), tasks):
+        pass
+
+    with self.lock:
+      for name, index in found.items():
+        results[name] = self.confirmed[name] = candidates[name][index]
+        self.modified = True
+    return results
+
+  def save(self, path: str = None) -> None:
+    '''Writes all confirmed URLs to the given path (or the cache path).'''
+    path = path or self.cache_path
+    if not path:
+      raise ValueError('No path to save the confirmed URLs')
+
+    with self.lock:
+      values = {'urls': dict(sorted(self.confirmed.items()))}
+      self.modified = False
+    with atomic_write(path) as fp:
+      json.dump(values, fp, indent=1)
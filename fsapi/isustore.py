@@ -0,0 +1,256 @@
+# MIT License
+
+# Copyright (c) 2022 MatrixEditor
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+__doc__ = '''
+The ``FirmwareStore`` keeps each downloaded firmware binary exactly once. Files are
+stored under their SHA-256 hash and indexed by
+
+* their name (``<customisation>_V<version>``),
+* their MD5 hash (as given by ``ISUSoftwareElement.md5hash``) and
+* the URLs they were downloaded from.
+
+>>> store = FirmwareStore('firmware')
+>>> store.add('ir-mmi-FS2026-0500-0549_V2.12.25c.EX72088-1A12.isu.bin',
+...           'ir-mmi-FS2026-0500-0549_V2.12.25c.EX72088-1A12')
+>>> entry = store.find('ir-mmi-FS2026-0500-0549', '2.12.25c.EX72088-1A12')
+>>> store.export(entry, 'update.isu.bin')
+
+Exported files are hard links to the stored object where possible, so a file that
+is already present in the store costs neither a download nor disk space. Stored
+objects are therefore read-only: an exported file (or a file added with ``move``)
+shares its content with the store and must be copied before it is edited in place. Pass a
+store to ``isu_get_update()`` or the ``ISUDownloader`` to check it before any request
+is made.
+'''
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+import threading
+
+from typing import NamedTuple
+
+from .fileutil import atomic_write
+from .isu.product import FSCustomisation, FSVersion
+
+__all__ = [
+  "FirmwareStore", "StoreEntry", "FIRMWARE_STORE_PATH", "get_firmware_name"
+]
+
+FIRMWARE_STORE_PATH = os.path.join(os.path.expanduser('~'), '.fsapi', 'firmware')
+
+# The mode of stored objects, which are shared with all links to them
+OBJECT_MODE = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+
+class StoreEntry(NamedTuple):
+  '''A firmware binary in the ``FirmwareStore``.
+
+  :param sha256: the SHA-256 hash of the file (the key of the object)
+  :param md5: the MD5 hash of the file
+  :param size: the file's size
+  :param name: the firmware name (``None`` if the object was found by hash or URL)
+  '''
+  sha256: str
+  md5: str
+  size: int
+  name: str = None
+
+def get_firmware_name(customisation: str, version: str) -> str:
+  '''Returns the name of a firmware binary as used by ``isu_new_url()``.'''
+  return '%s_V%s' % (customisation, version)
+
+def _hash_file(path: str) -> tuple:
+  sha256, md5, size = hashlib.sha256(), hashlib.md5(), 0
+  with open(path, 'rb') as fp:
+    for chunk in iter(lambda: fp.read(0x100000), b''):
+      sha256.update(chunk)
+      md5.update(chunk)
+      size += len(chunk)
+  return sha256.hexdigest(), md5.hexdigest(), size
+
+class FirmwareStore:
+  '''A content-addressed store of firmware binaries.
+
+  The store consists of an ``objects`` directory with one file per SHA-256 hash and
+  an ``index.json`` file mapping names, MD5 hashes and URLs to these objects.
+
+  :param root: the directory of the store (created if needed)
+  '''
+
+  def __init__(self, root: str = FIRMWARE_STORE_PATH) -> None:
+    self.root = root
+    self.objects = {}
+    self.names = {}
+    self.urls = {}
+    self.md5 = {}
+    self.lock = threading.Lock()
+    os.makedirs(os.path.join(root, 'objects'), exist_ok=True)
+    if os.path.isfile(self.index_path):
+      self.load()
+
+  @property
+  def index_path(self) -> str:
+    return os.path.join(self.root, 'index.json')
+
+  def get_path(self, entry: StoreEntry) -> str:
+    '''Returns the path of the stored object.'''
+    return os.path.join(self.root, 'objects', entry.sha256[:2], entry.sha256)
+
+  def _entry(self, sha256: str, name: str = None) -> StoreEntry:
+    values = self.objects.get(sha256)
+    if values is None or not os.path.isfile(os.path.join(self.root, 'objects', sha256[:2], sha256)):
+      return None
+    return StoreEntry(sha256, values['md5'], values['size'], name)
+
+  def find(self, customisation: str, version: str) -> StoreEntry:
+    '''Returns the entry of the given firmware or ``None`` if not stored.'''
+    return self.find_name(get_firmware_name(customisation, version))
+
+  def find_name(self, name: str) -> StoreEntry:
+    sha256 = self.names.get(name)
+    return self._entry(sha256, name) if sha256 else None
+
+  def find_md5(self, md5: str) -> StoreEntry:
+    sha256 = self.md5.get(md5.strip().lower()) if md5 else None
+    return self._entry(sha256) if sha256 else None
+
+  def find_url(self, url: str) -> StoreEntry:
+    sha256 = self.urls.get(url)
+    return self._entry(sha256) if sha256 else None
+
+  def lookup(self, url: str = None, software = None) -> StoreEntry:
+    '''Searches an ``ISUSoftwareElement`` (by MD5 hash or name) or a download URL.'''
+    entry = None
+    if software is not None:
+      if software.md5hash:
+        # The hash identifies the file, the name alone could point to another build
+        return self.find_md5(software.md5hash)
+      if software.customisation and software.version:
+        entry = self.find(software.customisation, software.version)
+    if entry is None and url:
+      entry = self.find_url(url)
+    return entry
+
+  def entries(self, module_type: str = None, device_type: str = None):
+    '''Iterates over all named entries.
+
+    :param module_type: only entries of this module (e.g. ``FS2026``)
+    :param device_type: only entries of this device type (e.g. ``ir-mmi``)
+    :returns: a generator of ``(FSCustomisation, FSVersion, StoreEntry)`` tuples
+    '''
+    for name, sha256 in sorted(self.names.items()):
+      customisation, version = FSCustomisation(), FSVersion()
+      try:
+        value, _, ver = name.partition('_V')
+        customisation.loads(value)
+        version.loads(ver)
+      except (IndexError, ValueError):
+        continue
+      if module_type and customisation.module_type != module_type: continue
+      if device_type and customisation.device_type != device_type: continue
+      entry = self._entry(sha256, name)
+      if entry: yield customisation, version, entry
+
+  def add(self, path: str, name: str = None, url: str = None, move: bool = False) -> StoreEntry:
+    '''Adds a file to the store.
+
+    If an object with the same content is already stored, only the index is updated.
+
+    :param path: the file to add
+    :param name: the firmware name (``<customisation>_V<version>``)
+    :param url: the URL the file was downloaded from
+    :param move: whether the file may be moved into the store. The file is replaced 
+                 by a (read-only) link to the stored object.
+    '''
+    sha256, md5, size = _hash_file(path)
+    entry = StoreEntry(sha256, md5, size, name)
+    target = self.get_path(entry)
+    with self.lock:
+      if not os.path.isfile(target):
+        if move:
+          os.makedirs(os.path.dirname(target), exist_ok=True)
+          os.replace(path, target)
+          # Leave a link at the original location
+          _link(target, path)
+        else:
+          _copy(path, target)
+        os.chmod(target, OBJECT_MODE)
+      elif move and not os.path.samefile(target, path):
+        # The content is already stored, so the file becomes a link to the object
+        # instead of a second copy.
+        _replace_link(target, path)
+
+      self.objects[sha256] = {'md5': md5, 'size': size}
+      self.md5[md5] = sha256
+      if name: self.names[name] = sha256
+      if url: self.urls[url] = sha256
+    return entry
+
+  def export(self, entry: StoreEntry, path: str, copy: bool = False) -> None:
+    '''Places the stored object at the given path.
+
+    The file is a hard link to the read-only object if possible, use ``copy`` to 
+    get a file that can be edited.
+
+    :param entry: the stored entry
+    :param path: the target path
+    :param copy: whether the object should be copied instead of linked
+    '''
+    source = self.get_path(entry)
+    if copy:
+      _copy(source, path)
+    elif not (os.path.exists(path) and os.path.samefile(source, path)):
+      _replace_link(source, path)
+
+  def load(self) -> None:
+    with open(self.index_path, 'r') as fp:
+      values = json.load(fp)
+    with self.lock:
+      self.objects.update(values.get('objects', {}))
+      self.names.update(values.get('names', {}))
+      self.urls.update(values.get('urls', {}))
+      for sha256, value in self.objects.items():
+        self.md5[value['md5']] = sha256
+
+  def save(self) -> None:
+    '''Writes the index of this store.'''
+    with self.lock:
+      values = {'objects': self.objects, 'names': self.names, 'urls': self.urls}
+      with atomic_write(self.index_path) as fp:
+        json.dump(values, fp, indent=1, sort_keys=True)
+
+def _copy(source: str, path: str) -> None:
+  with open(source, 'rb') as src, atomic_write(path, 'wb') as fp:
+    shutil.copyfileobj(src, fp, 0x100000)
+
+def _replace_link(source: str, path: str) -> None:
+  temp_path = '%s.%d.tmp' % (path, threading.get_ident())
+  _link(source, temp_path)
+  os.replace(temp_path, path)
+
+def _link(source: str, path: str) -> None:
+  try:
+    os.link(source, path)
+  except OSError:
+    # e.g. another file system or no support for hard links
+    shutil.copyfile(source, path)
@@ -19,17 +19,68 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+__doc__ = '''
+All HTTP requests of this package are sent through a ``FSNetConfiguration``. Without
+explicit pools, the configuration manages one keep-alive connection pool per host,
+so following requests to the same device or update server reuse their connections:
+
+>>> config = FSNetConfiguration(maxsize=8, block=True, timeout=10.0)
+>>> response = isu_find_update(mac, customisation, version, netconfig=config)
+
+Requests to a proxy reuse their connections in the same way:
+
+>>> config = FSNetConfiguration(proxy_url='http://127.0.0.1:8080')
+
+Functions called without a configuration use the shared instance returned by
+``get_default_netconfig()``.
+'''
+
+import threading
 import urllib3
 
+__all__ = [
+  "FSNetConfiguration", "get_default_netconfig", "set_default_netconfig"
+]
+
 class FSNetConfiguration:
+  '''The transport used to send HTTP requests.
+
+  A custom pool or proxy manager can be passed to control every detail. Otherwise,
+  a ``PoolManager`` (or ``ProxyManager`` if ``proxy_url`` is set) is created on first
+  use with the given options.
+
+  :param proxy_manager: a custom proxy manager
+  :param http_pool: a custom pool or pool manager for all requests
+  :param https_pool: a custom pool used for all requests; HTTP URLs are upgraded to HTTPS
+  :param headers: headers added to every request (replacing headers of the same name)
+  :param maxsize: the amount of connections kept open per host
+  :param block: whether requests wait for a free connection if ``maxsize`` connections
+                to a host are in use (otherwise additional connections are opened and
+                closed after use)
+  :param num_pools: the amount of hosts whose connections are kept open
+  :param timeout: the default timeout in seconds (or a ``urllib3.Timeout``)
+  :param retries: the default retries (a ``urllib3.Retry``, an integer or ``False``)
+  :param proxy_url: the URL of a proxy all requests are sent through
+  '''
+
   def __init__(self, proxy_manager: urllib3.ProxyManager = None,
                http_pool: urllib3.HTTPConnectionPool = None,
                https_pool: urllib3.HTTPSConnectionPool = None,
-               headers: dict = None) -> None:
+               headers: dict = None, maxsize: int = 4, block: bool = False,
+               num_pools: int = 16, timeout = None, retries = None,
+               proxy_url: str = None) -> None:
     self.proxy_manager = proxy_manager
     self.http_pool = http_pool
     self.https_pool = https_pool
     self.headers = headers
+    self.maxsize = maxsize
+    self.block = block
+    self.num_pools = num_pools
+    self.timeout = timeout
+    self.retries = retries
+    self.proxy_url = proxy_url
+    self._manager = None
+    self._lock = threading.Lock()
 
   def should_use_http(self) -> bool:
     return self.http_pool is not None
@@ -38,27 +89,68 @@ class FSNetConfiguration:
     return self.https_pool is not None
   
   def should_use_proxy(self) -> bool:
-    return self.proxy_manager is not None
+    return self.proxy_manager is not None or self.proxy_url is not None
   
   def use_custom_headers(self) -> bool:
     return self.headers is not None
 
+  def get_pool(self):
+    '''Returns the pool or pool manager used for the next request.'''
+    if self.should_use_https():
+      return self.https_pool
+    if self.proxy_manager is not None:
+      return self.proxy_manager
+    if self.should_use_http():
+      return self.http_pool
+
+    if self._manager is None:
+      with self._lock:
+        if self._manager is None:
+          options = {'num_pools': self.num_pools, 'maxsize': self.maxsize, 'block': self.block}
+          if self.timeout is not None: options['timeout'] = self.timeout
+          if self.retries is not None: options['retries'] = self.retries
+          if self.proxy_url:
+            self._manager = urllib3.ProxyManager(self.proxy_url, **options)
+          else:
+            self._manager = urllib3.PoolManager(**options)
+    return self._manager
+
   def delegate_request(self, method: str, url: str, headers: dict = None,
                        fields: dict = None,
                        **kwargs) -> urllib3.HTTPResponse:
-    pool = self.http_pool 
-    if self.should_use_https():
-      pool = self.https_pool
-    elif self.should_use_proxy():
-      pool = self.proxy_manager
-    
-    if self.should_use_https() and 'https' not in url: url = url.replace('http', 'https')
-
-    if not pool: 
-      raise ValueError('Invalid pool option: missing pool object')
+    pool = self.get_pool()
+    if self.should_use_https() and url.startswith('http://'):
+      url = 'https://' + url[len('http://'):]
 
     if self.use_custom_headers():
-      headers = self.headers
+      headers = dict(headers or {}, **self.headers)
     
     return pool.request(method, url, headers=headers, fields=fields, **kwargs)
 
+  def clear(self) -> None:
+    '''Closes all connections kept open by this configuration.'''
+    for pool in (self._manager, self.http_pool, self.https_pool, self.proxy_manager):
+      if pool is None:
+        continue
+      if hasattr(pool, 'clear'):
+        pool.clear()
+      else:
+        pool.close()
+
+_default_netconfig = None
+_default_lock = threading.Lock()
+
+def get_default_netconfig() -> FSNetConfiguration:
+  '''Returns the configuration used by functions called without one.'''
+  global _default_netconfig
+  if _default_netconfig is None:
+    with _default_lock:
+      if _default_netconfig is None:
+        _default_netconfig = FSNetConfiguration()
+  return _default_netconfig
+
+def set_default_netconfig(netconfig: FSNetConfiguration) -> None:
+  '''Replaces the configuration used by functions called without one.'''
+  global _default_netconfig
+  with _default_lock:
+    _default_netconfig = netconfig
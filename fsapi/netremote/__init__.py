@@ -25,7 +25,9 @@ All nodes that are presented here were converted from the Java-source code of th
 Medion Lifestream 2. 
 
 The script used for converting the code is placed `here`_. The source code was converted,
-because nodes.py contains more that 4000 lines of code in the end (to much work by hand).
+because there are almost 300 nodes (to much work by hand). The script generates a table with 
+the definition of each node (``nodetable.py``), from which the node classes in ``nodes.py`` 
+are created when they are accessed for the first time.
 
 When querying a resource or trying to set value to a specific node, there is always a status
 message that comes along with the response. The possible values for this status are:
@@ -53,24 +55,42 @@ message that comes along with the response. The possible values for this status
 
 from .basenode import *
 from .radiohttp import *
-from . import nodes
+from .encoder import *
+from .trace import *
+from .registry import *
+from .retry import *
+from .capabilities import *
+from .fleet import *
+from .nodetable import NODE_TABLE, NODE_CACHEABLE, NODE_NOTIFYING, NODE_READONLY
+
+import importlib
+
+# The nodes module is imported on first access of ``fsapi.netremote.nodes``. 
+# Everything that can be answered by the node table won't create any node 
+# class at all.
+
+def __getattr__(name: str):
+  if name == 'nodes':
+    return importlib.import_module('.nodes', __name__)
+  raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
 def get_all_node_names() -> list: # -> list[str]
   '''Returns all loaded node names.'''
-  names = []
-  for key in nodes.__dict__:
-    if 'Base' in key: names.append(nodes.__dict__[key].get_name())
-  return names
+  return list(NODE_TABLE)
 
 def get_all_node_types() -> dict: # -> dict[str, type]
   '''Returns all node names together with their class type.
+
+  The mapping is created once and is read-only.
   
   :rtype: dict[str, type]
   '''
-  types = {}
-  for key in nodes.__dict__:
-    if 'Base' in key: 
-      class_Type = nodes.__dict__[key]
-      types[class_Type.get_name()] = class_Type 
-  return types
+  return get_node_registry().types()
+
+def get_node_type(name: str) -> type:
+  '''Returns the class type of the node with the given name.
 
+  :param name: the node's name, e.g. ``netRemote.sys.info.version``
+  :returns: the node class or ``None`` if there is no such node
+  '''
+  return get_node_registry().get(name)
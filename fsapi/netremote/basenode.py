@@ -51,21 +51,23 @@ Use ``fsapi.get_all_node_names()`` to get all implemented nodes.
 
 Each node provides the following attributes: ``cacheable`` [bool], ``notifying`` [bool], 
 ``readonly`` [bool], <static> ``package_name`` [str], ``prototype`` [NodePrototype] and the 
-stored value in case the node is not a ``NodeList``. These node list classes just contain a list 
-of ``NodeListItems``, which can contain one ore more fields. These are packed into a dictionary 
-named `attr`.
+stored value in case the node is not a ``NodeList``. These node list classes store their items 
+column by column in a ``NodeListColumns`` object. Each item is returned as a ``NodeListItemView``, 
+which packs its fields into a dictionary named `attr` when accessed.
 
 To make the import of NodeLists and NodeListItems easier, these classes come with an inbuild function 
 named ``loadxml()``. Note that the XMLElement always needs to be the root element.
 '''
 
+from typing import NamedTuple
 from xml.etree import ElementTree as xmltree
 
 __all__ = [
 "ARG_TYPE_C", "ARG_TYPE_E8", "ARG_TYPE_U8", "ARG_TYPE_U16", "ARG_TYPE_U32", "ARG_TYPE_S8", 
 "ARG_TYPE_S16", "ARG_TYPE_S32", "ARG_TYPE_U", "NodeArg", "NodePrototype", "NodeInfo", 
 "NodeInteger", "NodeS8", "NodeS16", "NodeS32", "NodeU8", "NodeU16", "NodeU32", "NodeE8",
-"NodeC", "NodeU", "NodeListItem", "NodeList", 
+"NodeC", "NodeU", "NodeListItem", "NodeListItemView", "NodeListColumns", "NodeList", 
+"NodeError"
 ]
 
 ARG_TYPE_C: int = 0x10
@@ -87,79 +89,116 @@ ARG_TYPE_S32: int = 0x17
 ARG_TYPE_U: int = 0x18
 '''array of data'''
 
-class NodeArg:
+class NodeError(Exception):
+  """The base class for all node related issues.
+
+  :param status: the status that caused this error, either the HTTP status code or
+                 the status of the ``fsapiResponse``
+  """
+  def __init__(self, message: str = None, status = None) -> None:
+    super().__init__(message)
+    self.status = status
+
+class NodeArg(NamedTuple):
   '''A simple Node-Argument.
   
   This class has to be added to the ``NodePrototype`` if the node can be altered. The
-  default name for an argument is "`value`".
+  default name for an argument is "`value`". Arguments are immutable, so they can be 
+  shared between all node classes.
 
   :param name: the argument's name (default "`value`")
   :param length: the maximum data length
   :param data_type: one of the previous declared data types
   '''
-  def __init__(self, name: str = None, length: int = 0, data_type: int = 0) -> None:
-    self.name = name
-    self.length = length
-    self.data_type = data_type
+  name: str = None
+  length: int = 0
+  data_type: int = 0
 
 class NodePrototype:
   '''The prototype for a node definition. 
   
   This class stores the arguments that are necessary when reading from or writing to 
-  a node.
+  a node. The arguments are stored in a tuple, because a prototype is shared by all 
+  instances of a node class.
 
   :param arg: a single ``NodeArg``
   :param args: a list of ``NodeArg``
   '''
+  __slots__ = ('arguments',)
   
   def __init__(self, arg: NodeArg = None, args: list = None) -> None:
-    if arg: self.arguments = [arg]
-    elif args: self.arguments = args if args else []
+    if arg: self.arguments = (arg,)
+    else: self.arguments = tuple(args) if args else ()
 
-  def get_args(self) -> list:
+  def get_args(self) -> tuple:
     '''Returns the stored node's arguments.'''
     return self.arguments
   
   def __iter__(self):
     return iter(self.arguments)
 
+  def __len__(self) -> int:
+    return len(self.arguments)
+
 class NodeInfo:
   '''The base class for all nodes.
   
   As defined above, each node provides the following attributes: ``cacheable`` [bool], 
   ``notifying`` [bool], ``readonly`` [bool], <static> ``package_name`` [str], ``prototype`` 
   [NodePrototype] and the stored value in case the node is not a ``NodeList``.
-  '''
 
-  def is_cacheable(self) -> bool:
+  All of these attributes except the value are class attributes, which are defined by 
+  the node classes in ``nodes.py``. The methods below can be called on the class and 
+  on its instances.
+  '''
+  package_name: str = None
+  cacheable: bool = False
+  notifying: bool = False
+  readonly: bool = False
+  prototype: NodePrototype = None
+
+  @classmethod
+  def is_cacheable(cls) -> bool:
     '''Returns whether this node can be cached (on the device).'''
-    return False
+    return cls.cacheable
   
-  def is_notifying(self) -> bool:
+  @classmethod
+  def is_notifying(cls) -> bool:
     '''Returns whether this node is notifying.'''
-    return False
+    return cls.notifying
 
-  def is_readonly(self) -> bool:
+  @classmethod
+  def is_readonly(cls) -> bool:
     '''Returns whether this node can't be altered.'''
-    return False
+    return cls.readonly
   
-  def get_name(self) -> str:
+  @classmethod
+  def get_name(cls) -> str:
     '''Returns the name of this node.'''
-    pass
+    return cls.package_name
 
-  def get_prototype(self) -> NodePrototype:
+  @classmethod
+  def get_prototype(cls) -> NodePrototype:
     '''Returns the prototype for this node.'''
-    pass
+    return cls.prototype
 
   def update(self):
     '''@Deprecated'''
     pass
 
 class NodeInteger(NodeInfo):
-  def __init__(self, value: int, min_value: int = 0, max_value: int = 0) -> None:
+  '''The base class for all integer nodes.
+
+  :param minimum: the smallest valid value (inclusive)
+  :param maximum: the largest valid value (inclusive)
+  '''
+  minimum: int = 0
+  maximum: int = 0
+
+  def __init__(self, value: int = None, min_value: int = None, max_value: int = None) -> None:
     self.value = value
-    self.minimum = min_value
-    self.maximum = max_value
+    if min_value is not None: self.minimum = min_value
+    if max_value is not None: self.maximum = max_value
   
   def get_value(self) -> int:
     return self.value
@@ -176,33 +215,47 @@ class NodeInteger(NodeInfo):
       return __o.get_value() == self.get_value() 
 
 class NodeS8(NodeInteger):
-  def __init__(self, value: int, max_size: int = 0) -> None:
-    super().__init__(value, 127, -127)
+  minimum, maximum = -0x80, 0x7f
+
+  def __init__(self, value: int = None, max_size: int = 0) -> None:
+    super().__init__(value)
 
 class NodeS16(NodeInteger):
-  def __init__(self, value: int, max_size: int = 0) -> None:
-    super().__init__(value, 0x7fff, -0x7fff)
+  minimum, maximum = -0x8000, 0x7fff
+
+  def __init__(self, value: int = None, max_size: int = 0) -> None:
+    super().__init__(value)
 
 class NodeS32(NodeInteger):
-  def __init__(self, value: int, max_size: int = 0) -> None:
-    super().__init__(value, 0x7fffffff, -0x7fffffff)
+  minimum, maximum = -0x80000000, 0x7fffffff
+
+  def __init__(self, value: int = None, max_size: int = 0) -> None:
+    super().__init__(value)
 
 class NodeU8(NodeInteger):
-  def __init__(self, value: int, max_size: int = 0) -> None:
-    super().__init__(value, 0xff, 0)
+  minimum, maximum = 0, 0xff
+
+  def __init__(self, value: int = None, max_size: int = 0) -> None:
+    super().__init__(value)
 
 class NodeU16(NodeInteger):
-  def __init__(self, value: int, max_size: int = 0) -> None:
-    super().__init__(value, 0xffff, 0)
+  minimum, maximum = 0, 0xffff
+
+  def __init__(self, value: int = None, max_size: int = 0) -> None:
+    super().__init__(value)
 
 class NodeU32(NodeInteger):
-  def __init__(self, value: int, max_size: int = 0) -> None:
-    super().__init__(value, 0xffffffff, 0)
+  minimum, maximum = 0, 0xffffffff
+
+  def __init__(self, value: int = None, max_size: int = 0) -> None:
+    super().__init__(value)
 
 class NodeE8(NodeInfo):
+  mapping: dict = None
+
   def __init__(self, value: int = 0, mapping: dict = None) -> None:
     self.value = value
-    self.mapping = mapping
+    if mapping is not None: self.mapping = mapping
 
   def get_enum_value(self) -> object:
     if not self.mapping or self.value not in self.mapping: return None
@@ -215,16 +268,18 @@ class NodeE8(NodeInfo):
     return 'NodeE8<%s>' % self.get_enum_value()
 
 class NodeC(NodeInfo):
-  def __init__(self, value: str = None, max_size: int = 0) -> None:
+  max_size: int = 0
+
+  def __init__(self, value: str = None, max_size: int = None) -> None:
     super().__init__()
     self.value = value
-    self.max_size = max_size
+    if max_size is not None: self.max_size = max_size
   
   def get_maximum_length(self) -> int:
     return self.max_size
 
 class NodeU(NodeC):
-  def __init__(self, value: str = None, max_size: int = 0) -> None:
+  def __init__(self, value: str = None, max_size: int = None) -> None:
     super().__init__(value, max_size)
 
 class NodeListItem:
@@ -234,26 +289,171 @@ class NodeListItem:
   def loadxml(self, element: xmltree.Element):
     key = element.get('key', None)
     self.attr['key'] = key
-    for field_node in element.findall('field'):
-      self.attr[field_node.attrib['name']] = field_node[0].text
+    for field_node in element:
+      if field_node.tag == 'field' and len(field_node):
+        self.attr[field_node.get('name')] = field_node[0].text
   
   def get_attr_by_name(self, field: str) -> object:
     if not field or field not in self.attr: return None
     return self.attr[field]
 
+class NodeListItemView(NodeListItem):
+  '''A lazy view on a single row of ``NodeListColumns``.
+
+  The ``attr`` dictionary is only created when it is accessed, ``get_attr_by_name()``
+  reads the value directly from the column.
+  '''
+  __slots__ = ('columns', 'index')
+
+  def __init__(self, columns: 'NodeListColumns', index: int) -> None:
+    self.columns = columns
+    self.index = index
+
+  @property
+  def attr(self) -> dict:
+    index = self.index
+    return {name: column[index] for name, column in self.columns.columns.items()}
+
+  def loadxml(self, element: xmltree.Element):
+    raise TypeError('NodeListItemView objects are read-only')
+
+  def get_attr_by_name(self, field: str) -> object:
+    column = self.columns.columns.get(field)
+    return column[self.index] if column is not None else None
+
+  def __repr__(self) -> str:
+    return 'NodeListItemView(%r)' % self.attr
+
+# Converts the text of a list field into the python type of its argument. Only
+# single values are converted, arrays (length > 1) are kept as strings.
+_ARG_CONVERTERS = {
+  ARG_TYPE_E8: int, ARG_TYPE_U8: int, ARG_TYPE_U16: int, ARG_TYPE_U32: int, 
+  ARG_TYPE_S8: int, ARG_TYPE_S16: int, ARG_TYPE_S32: int
+}
+
+def _convert_field(converter, text: str) -> object:
+  if converter is None or text is None: return text
+  try:
+    return converter(text)
+  except ValueError:
+    return text
+
+class NodeListColumns:
+  '''Columnar storage for the items of a ``NodeList``.
+
+  Instead of one ``NodeListItem`` with its own ``attr`` dictionary per item, all 
+  values of a field are stored in one list (column). The columns are created from 
+  the arguments of the node's prototype and the values are converted according to 
+  the argument's ``data_type``. Fields that are not declared in the prototype are 
+  added as untyped columns when they occur.
+
+  Items are returned as ``NodeListItemView`` objects, which are created on access:
+
+  >>> columns = NodeListColumns(NodePrototype(args=[NodeArg('key', 1, ARG_TYPE_U32)]))
+  >>> columns.append({'key': '1'})
+  >>> columns[0].attr
+  {'key': 1}
+  >>> columns.to_json()
+  {'key': [1]}
+
+  :param prototype: the prototype of the list node
+  '''
+
+  def __init__(self, prototype: NodePrototype = None) -> None:
+    self.columns = {}
+    self.converters = {}
+    self.length = 0
+    self.add_column('key', ARG_TYPE_U32)
+    if prototype:
+      for argument in prototype:
+        self.add_column(argument.name, argument.data_type, argument.length)
+
+  def add_column(self, name: str, data_type: int = 0, length: int = 1) -> list:
+    '''Adds a new column (filled with ``None`` for all stored items).'''
+    if name in self.columns:
+      return self.columns[name]
+    column = [None] * self.length
+    self.columns[name] = column
+    self.converters[name] = _ARG_CONVERTERS.get(data_type) if length <= 1 else None
+    return column
+
+  def loadxml(self, element: xmltree.Element):
+    '''Imports the key and fields of a single <item> element.'''
+    columns, converters = self.columns, self.converters
+    columns['key'].append(_convert_field(converters['key'], element.get('key', None)))
+    for field_node in element:
+      if field_node.tag != 'field' or not len(field_node): continue
+      name = field_node.get('name')
+      column = columns.get(name)
+      if column is None: column = self.add_column(name)
+      column.append(_convert_field(converters[name], field_node[0].text))
+    self._close_row()
+
+  def append(self, item):
+    '''Appends a ``NodeListItem`` or a dictionary of field values.'''
+    attributes = item.attr if isinstance(item, NodeListItem) else item
+    for name, value in attributes.items():
+      column = self.columns.get(name)
+      if column is None: column = self.add_column(name)
+      column.append(_convert_field(self.converters[name], value))
+    self._close_row()
+
+  def extend(self, items):
+    for item in items:
+      self.append(item)
+
+  def _close_row(self):
+    # Fields that were not present in the item are stored as None
+    self.length += 1
+    for column in self.columns.values():
+      if len(column) < self.length: column.append(None)
+
+  def to_json(self) -> dict:
+    '''Returns the stored columns without copying them.'''
+    return self.columns
+
+  def __len__(self) -> int:
+    return self.length
+
+  def __getitem__(self, index):
+    if isinstance(index, slice):
+      return [NodeListItemView(self, i) for i in range(*index.indices(self.length))]
+    if index < 0: index += self.length
+    if not 0 <= index < self.length:
+      raise IndexError('list index out of range')
+    return NodeListItemView(self, index)
+
+  def __iter__(self):
+    for index in range(self.length):
+      yield NodeListItemView(self, index)
+
 class NodeList(NodeInfo):
+  '''The base class for all list nodes.
+
+  The items are stored in a ``NodeListColumns`` object, which will be created with 
+  the node's prototype as soon as the first item is added.
+  '''
   def __init__(self, items: list = None) -> None:
     super().__init__()
-    self.items = items if items else []
+    self.columns = None
+    if items: self.get_items().extend(items)
 
   def loadxml(self, element: xmltree.Element):
     for item in element.findall('item'):
-      node_item = NodeListItem()
-      node_item.loadxml(item)
-      self.get_items().append(node_item)
+      self.loaditem(item)
+
+  def loaditem(self, element: xmltree.Element):
+    '''Imports a single <item> element.'''
+    self.get_items().loadxml(element)
 
   def size(self) -> int:
-    return len(self.items)
+    return len(self.columns) if self.columns else 0
   
-  def get_items(self) -> list:
-    return self.items
\ No newline at end of file
+  def get_items(self) -> NodeListColumns:
+    if self.columns is None:
+      self.columns = NodeListColumns(self.get_prototype())
+    return self.columns
+
+  @property
+  def items(self) -> NodeListColumns:
+    return self.get_items()
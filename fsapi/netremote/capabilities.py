@@ -0,0 +1,130 @@
+# MIT License
+
+# Copyright (c) 2022 MatrixEditor
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+__doc__ = '''
+Every firmware implements only a subset of all nodes. The ``CapabilityCache`` remembers
+which nodes returned `FS_NODE_DOES_NOT_EXIST` for a firmware version (the value of
+``netRemote.sys.info.version``), so these nodes can be skipped on all devices running
+the same firmware:
+
+>>> cache = fsapi.CapabilityCache('capabilities.json')
+>>> version = fsapi.get_device_version(radio)
+>>> nodes = cache.filter(version, fsapi.get_all_node_names())
+>>> ... # query the nodes and call cache.record(version, name, status)
+>>> cache.save()
+
+The cache is stored as JSON and a node is removed from the cache again as soon as it
+returns `FS_OK`.
+'''
+
+import json
+import os
+import threading
+
+from ..fileutil import atomic_write
+from ..netconfig import FSNetConfiguration
+from .radiohttp import *
+from .registry import get_node_registry
+
+__all__ = [
+  "CapabilityCache", "get_device_version", "CAPABILITY_CACHE_PATH"
+]
+
+CAPABILITY_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.fsapi', 'capabilities.json')
+
+def get_device_version(radio: RadioHttp, netconfig: FSNetConfiguration = None,
+                       parameters: dict = None) -> str:
+  '''Returns the firmware version of the given device or ``None`` if not available.'''
+  node_class = get_node_registry().get('netRemote.sys.info.version')
+  response = netremote_request(GET, node_class, radio, netconfig, parameters)
+  if response.status != 'FS_OK' or not response.content.value:
+    return None
+  return response.content.value
+
+class CapabilityCache:
+  '''Stores the unsupported nodes of each firmware version.
+
+  :param path: the JSON file to load the cache from and to save it to. If the file
+               does not exist, the cache starts empty.
+  '''
+
+  def __init__(self, path: str = None) -> None:
+    self.path = path
+    self.versions = {}
+    self.modified = False
+    self.lock = threading.Lock()
+    if path and os.path.isfile(path):
+      self.load(path)
+
+  def is_supported(self, version: str, name: str) -> bool:
+    '''Returns ``False`` if the node is known to be unsupported by the given version.'''
+    unsupported = self.versions.get(version)
+    return not unsupported or name not in unsupported
+
+  def get_unsupported(self, version: str) -> set:
+    '''Returns the names of all unsupported nodes of the given version.'''
+    return set(self.versions.get(version, ()))
+
+  def filter(self, version: str, names: list) -> list:
+    '''Returns the given node names without the ones unsupported by the version.'''
+    unsupported = self.versions.get(version)
+    if not unsupported:
+      return list(names)
+    return [name for name in names if name not in unsupported]
+
+  def record(self, version: str, name: str, status: str) -> None:
+    '''Updates the cache with the status returned by a node.
+
+    Only `FS_NODE_DOES_NOT_EXIST` and `FS_OK` are taken into account, all other
+    statuses don't state whether a node is implemented.
+    '''
+    if not version: return
+    with self.lock:
+      if status == 'FS_NODE_DOES_NOT_EXIST':
+        unsupported = self.versions.setdefault(version, set())
+        if name not in unsupported:
+          unsupported.add(name)
+          self.modified = True
+      elif status == 'FS_OK':
+        unsupported = self.versions.get(version)
+        if unsupported and name in unsupported:
+          unsupported.discard(name)
+          self.modified = True
+
+  def load(self, path: str = None) -> None:
+    with open(path or self.path, 'r') as fp:
+      values = json.load(fp)
+    with self.lock:
+      for version, names in values.get('versions', {}).items():
+        self.versions.setdefault(version, set()).update(names)
+
+  def save(self, path: str = None) -> None:
+    '''Writes the cache to the given path (or the path it was loaded from).'''
+    path = path or self.path
+    if not path:
+      raise ValueError('No path to save the capability cache')
+
+    with self.lock:
+      values = {'versions': {version: sorted(names) for version, names in self.versions.items()}}
+      self.modified = False
+
+    with atomic_write(path) as fp:
+      json.dump(values, fp, indent=1)
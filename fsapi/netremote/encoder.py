@@ -0,0 +1,158 @@
+# MIT License
+
+# Copyright (c) 2022 MatrixEditor
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+__doc__ = '''
+Values passed to a `SET` request are validated and encoded by a ``SetEncoder``, which
+is created once per node class from the arguments of its prototype:
+
+* integer arguments must be within the bounds of their type (e.g. ``0..255`` for `u8`)
+* enum arguments (`e8`) accept the numeric value or its label
+* text arguments are limited to the maximum length of the node (in UTF-8 bytes)
+
+All values are URL-encoded. An invalid value raises a ``NodeValueError`` before any
+request is sent:
+
+>>> encoder = fsapi.get_set_encoder(fsapi.nodes.BaseSysAudioVolume)
+>>> encoder.encode({'value': 12})
+'&value=12'
+>>> encoder.encode({'value': 300})
+NodeValueError: value: 300 is not within [0, 255]
+'''
+
+from urllib.parse import quote
+
+from .basenode import *
+
+__all__ = [
+  "NodeValueError", "SetEncoder", "get_set_encoder", "encode_parameters"
+]
+
+# Integer argument types and the node class defining their bounds
+_INTEGER_TYPES = {
+  ARG_TYPE_U8: NodeU8, ARG_TYPE_U16: NodeU16, ARG_TYPE_U32: NodeU32,
+  ARG_TYPE_S8: NodeS8, ARG_TYPE_S16: NodeS16, ARG_TYPE_S32: NodeS32,
+}
+
+class NodeValueError(NodeError, ValueError):
+  """Raised if a value can't be applied to a node."""
+  pass
+
+def _to_int(name: str, value: object) -> int:
+  if isinstance(value, float) and not value.is_integer():
+    raise NodeValueError('%s: expected an integer, got %r' % (name, value))
+  try:
+    return int(value)
+  except (TypeError, ValueError):
+    raise NodeValueError('%s: expected an integer, got %r' % (name, value))
+
+def _compile_integer(name: str, node_type: type):
+  minimum, maximum = node_type.minimum, node_type.maximum
+
+  def encode(value: object) -> str:
+    value = _to_int(name, value)
+    if not minimum <= value <= maximum:
+      raise NodeValueError('%s: %d is not within [%d, %d]' % (name, value, minimum, maximum))
+    return str(value)
+  return encode
+
+def _compile_enum(name: str, mapping: dict):
+  labels = {label: key for key, label in mapping.items()} if mapping else {}
+
+  def encode(value: object) -> str:
+    if isinstance(value, str) and value in labels:
+      value = labels[value]
+    value = _to_int(name, value)
+    if mapping and value not in mapping:
+      raise NodeValueError('%s: %d is not one of %s' % (name, value, sorted(mapping)))
+    if not 0 <= value <= 0xff:
+      raise NodeValueError('%s: %d is not within [0, 255]' % (name, value))
+    return str(value)
+  return encode
+
+def _compile_text(name: str, max_length: int):
+  def encode(value: object) -> str:
+    data = value if isinstance(value, bytes) else str(value).encode('utf-8')
+    if max_length and len(data) > max_length:
+      raise NodeValueError('%s: %d bytes exceed the maximum length of %d'
+                           % (name, len(data), max_length))
+    return quote(data, safe='')
+  return encode
+
+def encode_parameters(parameters: dict) -> str:
+  '''URL-encodes the given parameters without validation.
+
+  :returns: the query string starting with ``&`` or an empty string
+  '''
+  if not parameters: return ''
+  return ''.join('&%s=%s' % (quote(str(key), safe=''), quote(str(value), safe=''))
+                 for key, value in parameters.items())
+
+class SetEncoder:
+  '''Validates and encodes the values of `SET` requests for a node class.
+
+  Use ``get_set_encoder()`` to get the cached encoder of a node class.
+
+  :param node_class: the node class
+  '''
+
+  def __init__(self, node_class: type) -> None:
+    self.node_class = node_class
+    self.arguments = {}
+
+    prototype = node_class.get_prototype()
+    for arg in (prototype or ()):
+      name = arg.name or 'value'
+      if arg.data_type in _INTEGER_TYPES:
+        self.arguments[name] = _compile_integer(name, _INTEGER_TYPES[arg.data_type])
+      elif arg.data_type == ARG_TYPE_E8:
+        self.arguments[name] = _compile_enum(name, getattr(node_class, 'mapping', None))
+      else:
+        max_length = arg.length if arg.length > 1 else getattr(node_class, 'max_size', 0)
+        self.arguments[name] = _compile_text(name, max_length)
+
+  def encode(self, parameters: dict) -> str:
+    '''Validates and encodes the given parameters.
+
+    Parameters not defined by the node (e.g. the session id `sid`) are only URL-encoded.
+
+    :raises NodeValueError: if the node is read-only or a value is invalid
+    :returns: the query string starting with ``&``
+    '''
+    if self.node_class.is_readonly():
+      raise NodeValueError('Node is read-only: %s' % self.node_class.get_name())
+
+    query = []
+    for key, value in (parameters or {}).items():
+      encode = self.arguments.get(key)
+      if encode is None:
+        query.append('&%s=%s' % (quote(str(key), safe=''), quote(str(value), safe='')))
+      else:
+        query.append('&%s=%s' % (key, encode(value)))
+    return ''.join(query)
+
+_encoders = {}
+
+def get_set_encoder(node_class: type) -> SetEncoder:
+  '''Returns the (cached) ``SetEncoder`` of the given node class.'''
+  encoder = _encoders.get(node_class)
+  if encoder is None:
+    encoder = _encoders[node_class] = SetEncoder(node_class)
+  return encoder
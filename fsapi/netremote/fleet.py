@@ -0,0 +1,315 @@
+# MIT License
+
+# Copyright (c) 2022 MatrixEditor
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+__doc__ = '''
+The ``FleetExecutor`` runs the same plan of NetRemote requests against many devices
+at once. Targets can be loaded from a file or expanded from a network range:
+
+>>> targets = fsapi.expand_targets('192.168.0.0/24')
+>>> plan = [
+...   fsapi.FleetTask(fsapi.GET, 'netRemote.sys.info.version'),
+...   fsapi.FleetTask(fsapi.LIST_GET_NEXT, 'netRemote.nav.presets'),
+... ]
+>>> for result in fsapi.FleetExecutor(max_workers=64).run(targets, plan):
+...   print(result.host, result.node, result.status)
+
+All requests share one connection pool. The amount of requests running at the same
+time is limited globally (``max_workers``) and per device (``per_host``). Results are
+returned as soon as they are available, so the order of the records is not defined.
+'''
+
+import ipaddress
+import queue
+import threading
+import time
+import urllib3
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+from ..netconfig import FSNetConfiguration
+from .radiohttp import *
+from .encoder import get_set_encoder
+from .registry import get_node_registry
+
+__all__ = [
+  "FleetTask", "FleetResult", "FleetExecutor", "expand_targets", "load_targets"
+]
+
+class FleetTask(NamedTuple):
+  '''A single request of a fleet plan.
+
+  :param method: one of `GET`, `SET`, `LIST_GET_NEXT`
+  :param node: the node name or node class
+  :param parameters: additional request parameters (e.g. ``{'value': 1}`` for `SET`)
+  '''
+  method: str
+  node: object
+  parameters: dict = None
+
+class FleetResult(NamedTuple):
+  '''The record of a task executed on one device.
+
+  :param host: the target host
+  :param method: the request method
+  :param node: the node name
+  :param status: the returned status, ``None`` if the request failed
+  :param value: the value of the node or the list items (``list[dict]``)
+  :param error: the error message if the request failed
+  :param elapsed: the time spent on this task in seconds
+  :param cached: whether the status was taken from the capability cache without
+                 sending a request
+  '''
+  host: str
+  method: str
+  node: str
+  status: str = None
+  value: object = None
+  error: str = None
+  elapsed: float = 0.0
+  cached: bool = False
+
+  def to_json(self) -> dict:
+    return self._asdict()
+
+def expand_targets(spec: str, pin: str = RADIO_HTTP_DEFAULT_PIN) -> list: # -> list[RadioHttp]
+  '''Creates the targets of a host address or network range.
+
+  :param spec: an address (``192.168.0.10``) or a network in CIDR notation
+               (``192.168.0.0/24``)
+  :param pin: the PIN used for all targets
+  '''
+  if '/' not in spec:
+    return [RadioHttp(spec, pin)]
+  network = ipaddress.ip_network(spec, strict=False)
+  return [RadioHttp(str(address), pin) for address in network.hosts()]
+
+def load_targets(path: str, pin: str = RADIO_HTTP_DEFAULT_PIN) -> list: # -> list[RadioHttp]
+  '''Loads the targets from a file.
+
+  Each line contains a host address or network range, optionally followed by the PIN
+  of that device. Empty lines and lines starting with ``#`` are ignored. Duplicate
+  hosts are only returned once::
+
+      192.168.0.10 4321
+      192.168.1.0/28
+
+  :param path: the file to read
+  :param pin: the default PIN
+  '''
+  targets = {}
+  with open(path, 'r') as fp:
+    for line in fp:
+      line = line.split('#', 1)[0].strip()
+      if not line: continue
+
+      values = line.split()
+      for radio in expand_targets(values[0], values[1] if len(values) > 1 else pin):
+        targets.setdefault(radio.host, radio)
+  return list(targets.values())
+
+class _HostState:
+  __slots__ = ('radio', 'tasks', 'lock', 'sid', 'down', 'version')
+
+  def __init__(self, radio: RadioHttp, tasks: list) -> None:
+    self.radio = radio
+    self.tasks = deque(tasks)
+    self.lock = threading.Lock()
+    self.sid = None
+    self.down = False
+    self.version = None
+
+class FleetExecutor:
+  '''Executes a plan of NetRemote requests on many devices concurrently.
+
+  :param max_workers: the maximum amount of requests running at the same time
+  :param per_host: the maximum amount of requests running at the same time on one device
+  :param timeout: the connect and read timeout of each request in seconds
+  :param netconfig: a custom network configuration. If none is given, a connection pool
+                    with enough connections for all workers is created.
+  :param session: whether a session should be created on each device before the plan is
+                  executed (the session id is passed as `sid` to all requests)
+  :param max_items: the amount of items per `LIST_GET_NEXT` page
+  :param retry_policy: an optional ``RetryPolicy`` used for all requests
+  :param capabilities: an optional ``CapabilityCache``. If given, the firmware version of
+                       each device is queried first and nodes known to be unsupported by
+                       that version are skipped.
+  '''
+
+  def __init__(self, max_workers: int = 32, per_host: int = 1, timeout: float = 5.0,
+               netconfig: FSNetConfiguration = None, session: bool = False,
+               max_items: int = 100, retry_policy = None, capabilities = None) -> None:
+    self.max_workers = max(1, max_workers)
+    self.per_host = max(1, per_host)
+    self.timeout = timeout
+    self.session = session
+    self.max_items = max_items
+    self.retry_policy = retry_policy
+    self.capabilities = capabilities
+    if netconfig is None:
+      netconfig = FSNetConfiguration(
+        num_pools=self.max_workers, maxsize=self.per_host,
+        timeout=urllib3.Timeout(total=timeout), retries=False
+      )
+    self.netconfig = netconfig
+
+  def run(self, targets: list, plan: list):
+    '''Executes the plan on all targets.
+
+    The generator yields a ``FleetResult`` for each task and target as soon as it is
+    finished. If a device can't be reached, the remaining tasks of that device are
+    reported without sending any further requests. Closing the generator stops all
+    pending tasks.
+
+    :param targets: the ``RadioHttp`` targets
+    :param plan: a list of ``FleetTask`` objects
+    :raises ValueError: if the plan contains an unknown node or an invalid value
+    :returns: a generator of ``FleetResult`` objects
+    '''
+    tasks = [self._resolve(task) for task in plan]
+    if not targets or not tasks:
+      return
+
+    results = queue.Queue()
+    stopped = threading.Event()
+    hosts = [_HostState(radio, tasks) for radio in targets]
+
+    def worker(state: _HostState) -> None:
+      try:
+        while not stopped.is_set():
+          with state.lock:
+            if not state.tasks: break
+            task = state.tasks.popleft()
+          results.put(self._execute(state, task))
+      finally:
+        results.put(None)
+
+    # Each worker processes the tasks of one device, so a device never blocks a
+    # thread while waiting for its own limit.
+    workers = len(hosts) * min(self.per_host, len(tasks))
+    executor = ThreadPoolExecutor(max_workers=min(self.max_workers, workers))
+    futures = []
+    try:
+      for state in hosts:
+        for _ in range(min(self.per_host, len(tasks))):
+          futures.append(executor.submit(worker, state))
+
+      while workers:
+        result = results.get()
+        if result is None:
+          workers -= 1
+        else:
+          yield result
+    finally:
+      stopped.set()
+      for future in futures: future.cancel()
+      executor.shutdown(wait=False)
+
+  def _resolve(self, task: FleetTask) -> FleetTask:
+    node = task.node
+    if isinstance(node, str):
+      node = get_node_registry().get(node)
+      if node is None:
+        raise ValueError('Unknown node: %s' % task.node)
+    if task.method == SET:
+      # Invalid values are reported once instead of failing on every device
+      get_set_encoder(node).encode(task.parameters)
+    return FleetTask(task.method, node, task.parameters)
+
+  def _execute(self, state: _HostState, task: FleetTask) -> FleetResult:
+    radio = state.radio
+    name = task.node.get_name()
+    if state.down:
+      return FleetResult(radio.host, task.method, name, error='host unreachable')
+
+    start = time.monotonic()
+    try:
+      parameters = dict(task.parameters or {})
+      if self.session:
+        sid = self._get_session(state)
+        if sid is not None: parameters['sid'] = sid
+
+      version = None
+      if self.capabilities is not None:
+        version = self._get_version(state, parameters.get('sid'))
+        if not self.capabilities.is_supported(version, name):
+          return FleetResult(radio.host, task.method, name, 'FS_NODE_DOES_NOT_EXIST',
+                             cached=True)
+
+      if task.method == LIST_GET_NEXT:
+        status, value = self._fetch_list(task.node, radio, parameters)
+      else:
+        response = self._request(task.method, task.node, radio, parameters)
+        status = response.status
+        value = response.content.value if response.content is not None else None
+
+      if version: self.capabilities.record(version, name, status)
+      return FleetResult(radio.host, task.method, name, status, value,
+                         elapsed=time.monotonic() - start)
+    except urllib3.exceptions.HTTPError as error:
+      # The connection could not be established or was interrupted, so there
+      # is no use in sending the other requests to this device.
+      reason = getattr(error, 'reason', error)
+      if isinstance(reason, (urllib3.exceptions.NewConnectionError,
+                             urllib3.exceptions.ConnectTimeoutError)):
+        state.down = True
+      return FleetResult(radio.host, task.method, name, error=str(error),
+                         elapsed=time.monotonic() - start)
+    except Exception as error:
+      return FleetResult(radio.host, task.method, name, error=str(error),
+                         elapsed=time.monotonic() - start)
+
+  def _get_session(self, state: _HostState) -> str:
+    with state.lock:
+      if state.sid is None:
+        response = self._request(CREATE_SESSION, get_node_registry().get('CREATE_SESSION'),
+                                 state.radio)
+        if response.content is not None:
+          state.sid = response.content.value
+      return state.sid
+
+  def _get_version(self, state: _HostState, sid: str = None) -> str:
+    with state.lock:
+      if state.version is None:
+        node_class = get_node_registry().get('netRemote.sys.info.version')
+        response = self._request(GET, node_class, state.radio, {'sid': sid} if sid else None)
+        # An empty string marks devices without a version, so the request
+        # is not repeated for each task.
+        state.version = (response.content.value or '') if response.status == 'FS_OK' else ''
+      return state.version
+
+  def _request(self, method: str, node_class, radio: RadioHttp,
+               parameters: dict = None) -> ApiResponse:
+    if self.retry_policy:
+      return self.retry_policy.request(method, node_class, radio, self.netconfig, parameters)
+    return netremote_request(method, node_class, radio, self.netconfig, parameters)
+
+  def _fetch_list(self, node_class, radio: RadioHttp, parameters: dict) -> tuple:
+    status, items = None, []
+    pages = netremote_list_pages(node_class, radio, self.netconfig, parameters,
+                                 max_items=self.max_items, prefetch=False,
+                                 retry_policy=self.retry_policy)
+    for page in pages:
+      if status is None: status = page.status
+      if page.status == 'FS_OK':
+        items.extend(item.attr for item in page.content.get_items())
+    return status, items
@@ -0,0 +1,298 @@
+# This code was generated from JAVA source code
+# DO NOT CHANGE
+NODE_CACHEABLE = 0x01
+NODE_NOTIFYING = 0x02
+NODE_READONLY  = 0x04
+
+# <node name>: (<class name>, <base class>, <flags>, <list arguments>, <enum values>)
+#
+# List arguments are stored as (<name>, <length>, <data type>) and enum values
+# are numbered by their position.
+NODE_TABLE = {
+  'CREATE_SESSION': ('BaseCreateSession', 'NodeC', 0, None, None),
+  'netRemote.airplay.clearPassword': ('BaseAirplayClearPassword', 'NodeE8', 0, None, ('CLEAR',)),
+  'netRemote.airplay.setPassword': ('BaseAirplaySetPassword', 'NodeC', 0, None, None),
+  'netRemote.avs.alarmVolume': ('BaseAvsAlarmVolume', 'NodeU8', 3, None, None),
+  'netRemote.avs.authcode': ('BaseAvsAuthcode', 'NodeC', 0, None, None),
+  'netRemote.avs.hastoken': ('BaseAvsHastoken', 'NodeE8', 6, None, ('FALSE', 'TRUE')),
+  'netRemote.avs.locale': ('BaseAvsLocale', 'NodeU32', 4, None, None),
+  'netRemote.avs.logout': ('BaseAvsLogout', 'NodeU8', 3, None, None),
+  'netRemote.avs.metadata': ('BaseAvsMetadata', 'NodeC', 4, None, None),
+  'netRemote.avs.productmetadata': ('BaseAvsProductmetadata', 'NodeC', 4, None, None),
+  'netRemote.avs.token': ('BaseAvsToken', 'NodeC', 4, None, None),
+  'netRemote.avs.validLocales': ('BaseAvsValidLocales', 'NodeList', 5, (('key', 1, 20), ('name', 50, 16), ('code', 20, 16)), None),
+  'netRemote.bluetooth.connectedDevices': ('BaseBluetoothConnectedDevices', 'NodeList', 4, (('key', 1, 20), ('deviceState', 1, 17), ('deviceName', 65, 16)), None),
+  'netRemote.bluetooth.connectedDevicesListVersion': ('BaseBluetoothConnectedDevicesListVersion', 'NodeU32', 6, None, None),
+  'netRemote.bluetooth.discoverableState': ('BaseBluetoothDiscoverableState', 'NodeE8', 2, None, ('IDLE', 'DISCOVERABLE')),
+  'netRemote.cast.appName': ('BaseCastAppName', 'NodeC', 6, None, None),
+  'netRemote.cast.tos': ('BaseCastTos', 'NodeE8', 0, None, ('INACTIVE', 'ACTIVE', 'UNSET')),
+  'netRemote.cast.usageReport': ('BaseCastUsageReport', 'NodeE8', 0, None, ('INACTIVE', 'ACTIVE')),
+  'netRemote.cast.version': ('BaseCastVersion', 'NodeC', 4, None, None),
+  'netRemote.fsdca.authCode': ('BaseFsdcaAuthCode', 'NodeC', 0, None, None),
+  'netRemote.fsdca.clientId': ('BaseFsdcaClientId', 'NodeC', 4, None, None),
+  'netRemote.fsdca.disassociate': ('BaseFsdcaDisassociate', 'NodeE8', 0, None, ('NO_REQUEST', 'DISSASOCIATE')),
+  'netRemote.fsdca.fsdcaId': ('BaseFsdcaFsdcaId', 'NodeC', 4, None, None),
+  'netRemote.fsdca.state': ('BaseFsdcaState', 'NodeE8', 6, None, ('FSDCA_STATE_INITIAL', 'FSDCA_STATE_NOT_ASSOCIATED', 'FSDCA_STATE_AUTH_IN_PROGRESS', 'FSDCA_STATE_CONNECTING', 'FSDCA_STATE_CONNECTED', 'FSDCA_STATE_WAITING')),
+  'netRemote.misc.fsDebug.component': ('BaseMiscFsDebugComponent', 'NodeU8', 0, None, None),
+  'netRemote.misc.fsDebug.traceLevel': ('BaseMiscFsDebugTraceLevel', 'NodeU8', 0, None, None),
+  'netRemote.debug.incidentReport.lastCreatedKey': ('BaseDebugIncidentReportLastCreatedKey', 'NodeU8', 4, None, None),
+  'netRemote.debug.incidentReport.create': ('BaseDebugIncidentReportCreate', 'NodeU8', 0, None, None),
+  'netRemote.debug.incidentReport.list': ('BaseDebugIncidentReportList', 'NodeList', 4, (('uuid', 100, 16), ('path', 100, 16), ('time', 100, 16), ('key', 100, 16)), None),
+  'netRemote.debug.incidentReport.delete': ('BaseDebugIncidentReportDelete', 'NodeU8', 0, None, None),
+  'netRemote.misc.nvs.data': ('BaseMiscNvsData', 'NodeC', 0, None, None),
+  'netRemote.multichannel.primary.channelmask': ('BaseMultichannelPrimaryChannelmask', 'NodeE8', 0, None, ('NONE', 'LEFT', 'RIGHT', 'STEREO')),
+  'netRemote.multichannel.secondary0.channelmask': ('BaseMultichannelSecondary0Channelmask', 'NodeE8', 0, None, ('NONE', 'LEFT', 'RIGHT', 'STEREO')),
+  'netRemote.multichannel.secondary0.status': ('BaseMultichannelSecondary0Status', 'NodeE8', 6, None, ('SYNCHRONISING', 'READY', 'INVALID')),
+  'netRemote.multichannel.system.addsecondary': ('BaseMultichannelSystemAddsecondary', 'NodeC', 0, None, None),
+  'netRemote.multichannel.system.compatibilityid': ('BaseMultichannelSystemCompatibilityid', 'NodeC', 4, None, None),
+  'netRemote.multichannel.system.create': ('BaseMultichannelSystemCreate', 'NodeC', 0, None, None),
+  'netRemote.multichannel.system.id': ('BaseMultichannelSystemId', 'NodeC', 6, None, None),
+  'netRemote.multichannel.system.name': ('BaseMultichannelSystemName', 'NodeC', 4, None, None),
+  'netRemote.multichannel.system.removesecondary': ('BaseMultichannelSystemRemovesecondary', 'NodeC', 0, None, None),
+  'netRemote.multichannel.system.state': ('BaseMultichannelSystemState', 'NodeE8', 6, None, ('INDEPENDENT', 'PRIMARY', 'SECONDARY')),
+  'netRemote.multichannel.system.unpair': ('BaseMultichannelSystemUnpair', 'NodeE8', 0, None, ('IDLE', 'UNPAIR')),
+  'netRemote.multiroom.caps.maxClients': ('BaseMultiroomCapsMaxClients', 'NodeU8', 5, None, None),
+  'netRemote.multiroom.caps.protocolVersion': ('BaseMultiroomCapsProtocolVersion', 'NodeU32', 4, None, None),
+  'netRemote.multiroom.client.mute0': ('BaseMultiroomClientMute0', 'NodeE8', 2, None, ('NOT_MUTE', 'MUTE')),
+  'netRemote.multiroom.client.mute1': ('BaseMultiroomClientMute1', 'NodeE8', 2, None, ('NOT_MUTE', 'MUTE')),
+  'netRemote.multiroom.client.mute2': ('BaseMultiroomClientMute2', 'NodeE8', 2, None, ('NOT_MUTE', 'MUTE')),
+  'netRemote.multiroom.client.mute3': ('BaseMultiroomClientMute3', 'NodeE8', 2, None, ('NOT_MUTE', 'MUTE')),
+  'netRemote.multiroom.client.status0': ('BaseMultiroomClientStatus0', 'NodeE8', 6, None, ('CONNECTED', 'SYNCRONIZING', 'READY_TO_STREAM')),
+  'netRemote.multiroom.client.status1': ('BaseMultiroomClientStatus1', 'NodeE8', 6, None, ('CONNECTED', 'SYNCRONIZING', 'READY_TO_STREAM')),
+  'netRemote.multiroom.client.status2': ('BaseMultiroomClientStatus2', 'NodeE8', 6, None, ('CONNECTED', 'SYNCRONIZING', 'READY_TO_STREAM')),
+  'netRemote.multiroom.client.status3': ('BaseMultiroomClientStatus3', 'NodeE8', 6, None, ('CONNECTED', 'SYNCRONIZING', 'READY_TO_STREAM')),
+  'netRemote.multiroom.client.volume0': ('BaseMultiroomClientVolume0', 'NodeU8', 2, None, None),
+  'netRemote.multiroom.client.volume1': ('BaseMultiroomClientVolume1', 'NodeU8', 2, None, None),
+  'netRemote.multiroom.client.volume2': ('BaseMultiroomClientVolume2', 'NodeU8', 2, None, None),
+  'netRemote.multiroom.client.volume3': ('BaseMultiroomClientVolume3', 'NodeU8', 2, None, None),
+  'netRemote.multiroom.device.clientIndex': ('BaseMultiroomDeviceClientIndex', 'NodeU8', 6, None, None),
+  'netRemote.multiroom.device.clientStatus': ('BaseMultiroomDeviceClientStatus', 'NodeE8', 6, None, ('CONNECTED', 'SYNCRONIZING', 'READY_TO_STREAM')),
+  'netRemote.multiroom.device.listAll': ('BaseMultiroomDeviceListAll', 'NodeList', 4, (('key', 1, 20), ('UDN', 256, 16), ('FriendlyName', 256, 16), ('IPAddress', 16, 16), ('AudioSyncVersion', 11, 16), ('GroupId', 37, 16), ('GroupName', 256, 16), ('GroupRole', 1, 17), ('ClientNumber', 1, 18), ('SystemId', 37, 16), ('SystemRole', 1, 17), ('SystemName', 256, 16)), None),
+  'netRemote.multiroom.device.listAllVersion': ('BaseMultiroomDeviceListAllVersion', 'NodeU32', 6, None, None),
+  'netRemote.multiroom.device.serverStatus': ('BaseMultiroomDeviceServerStatus', 'NodeE8', 6, None, ('STREAM_STARTING', 'STREAM_PRESENTABLE', 'STREAM_UNPRESENTABLE')),
+  'netRemote.multiroom.device.transportOptimisation': ('BaseMultiroomDeviceTransportOptimisation', 'NodeE8', 0, None, ('DISABLED', 'ENABLED')),
+  'netRemote.multiroom.group.addClient': ('BaseMultiroomGroupAddClient', 'NodeC', 0, None, None),
+  'netRemote.multiroom.group.attachedClients': ('BaseMultiroomGroupAttachedClients', 'NodeU8', 6, None, None),
+  'netRemote.multiroom.group.becomeServer': ('BaseMultiroomGroupBecomeServer', 'NodeE8', 2, None, ('NO_GROUP', 'CLIENT', 'SERVER')),
+  'netRemote.multiroom.group.create': ('BaseMultiroomGroupCreate', 'NodeC', 0, None, None),
+  'netRemote.multiroom.group.destroy': ('BaseMultiroomGroupDestroy', 'NodeE8', 0, None, ('IDLE', 'DESTROY')),
+  'netRemote.multiroom.group.id': ('BaseMultiroomGroupId', 'NodeC', 6, None, None),
+  'netRemote.multiroom.group.masterVolume': ('BaseMultiroomGroupMasterVolume', 'NodeU8', 2, None, None),
+  'netRemote.multiroom.group.name': ('BaseMultiroomGroupName', 'NodeC', 6, None, None),
+  'netRemote.multiroom.group.removeClient': ('BaseMultiroomGroupRemoveClient', 'NodeC', 0, None, None),
+  'netRemote.multiroom.group.state': ('BaseMultiroomGroupState', 'NodeE8', 2, None, ('NO_GROUP', 'CLIENT', 'SERVER')),
+  'netRemote.multiroom.group.streamable': ('BaseMultiroomGroupStreamable', 'NodeE8', 6, None, ('FALSE', 'TRUE')),
+  'netRemote.multiroom.singlegroup.state': ('BaseMultiroomSinglegroupState', 'NodeE8', 2, None, ('SINGLE', 'MULTIROOM')),
+  'netRemote.nav.action.context': ('BaseNavActionContext', 'NodeU32', 0, None, None),
+  'netRemote.nav.action.dabPrune': ('BaseNavActionDabPrune', 'NodeE8', 0, None, ('IDLE', 'PRUNE')),
+  'netRemote.nav.action.dabScan': ('BaseNavActionDabScan', 'NodeE8', 2, None, ('IDLE', 'SCAN')),
+  'netRemote.nav.action.navigate': ('BaseNavActionNavigate', 'NodeU32', 0, None, None),
+  'netRemote.nav.action.selectItem': ('BaseNavActionSelectItem', 'NodeU32', 0, None, None),
+  'netRemote.nav.action.selectPreset': ('BaseNavActionSelectPreset', 'NodeU32', 0, None, None),
+  'netRemote.nav.amazonMpGetRating': ('BaseNavAmazonMpGetRating', 'NodeU8', 6, None, None),
+  'netRemote.nav.amazonMpLoginComplete': ('BaseNavAmazonMpLoginComplete', 'NodeE8', 0, None, ('FALSE', 'TRUE')),
+  'netRemote.nav.amazonMpLoginUrl': ('BaseNavAmazonMpLoginUrl', 'NodeC', 6, None, None),
+  'netRemote.nav.amazonMpSetRating': ('BaseNavAmazonMpSetRating', 'NodeE8', 0, None, ('POSITIVE', 'NEGATIVE')),
+  'netRemote.nav.browseMode': ('BaseNavBrowseMode', 'NodeU32', 1, None, None),
+  'netRemote.nav.caps': ('BaseNavCaps', 'NodeU32', 4, None, None),
+  'netRemote.nav.context.depth': ('BaseNavContextDepth', 'NodeU8', 4, None, None),
+  'netRemote.nav.context.errorStr': ('BaseNavContextErrorStr', 'NodeC', 4, None, None),
+  'netRemote.nav.context.formData': ('BaseNavContextFormData', 'NodeC', 0, None, None),
+  'netRemote.nav.context.form.item': ('BaseNavContextFormItem', 'NodeList', 4, (('key', 1, 20), ('formItemType', 1, 17), ('id', 32, 16), ('label', 32, 16), ('description', 256, 16), ('optionsCount', 1, 19)), None),
+  'netRemote.nav.context.form.option': ('BaseNavContextFormOption', 'NodeList', 4, (('key', 1, 20), ('name', 32, 16)), None),
+  'netRemote.nav.context.list': ('BaseNavContextList', 'NodeList', 4, (('key', 1, 20), ('name', 766, 16), ('type', 1, 17), ('subType', 1, 17)), None),
+  'netRemote.nav.context.navigate': ('BaseNavContextNavigate', 'NodeU32', 0, None, None),
+  'netRemote.nav.context.numItems': ('BaseNavContextNumItems', 'NodeS32', 4, None, None),
+  'netRemote.nav.context.refresh': ('BaseNavContextRefresh', 'NodeE8', 0, None, ('FALSE', 'TRUE')),
+  'netRemote.nav.context.status': ('BaseNavContextStatus', 'NodeE8', 6, None, ('WAITING', 'READY', 'FAIL', 'FATAL_ERR', 'READY_ROOT')),
+  'netRemote.nav.currentTitle': ('BaseNavCurrentTitle', 'NodeC', 4, None, None),
+  'netRemote.nav.dabScanUpdate': ('BaseNavDabScanUpdate', 'NodeU32', 6, None, None),
+  'netRemote.nav.depth': ('BaseNavDepth', 'NodeU8', 4, None, None),
+  'netRemote.nav.description': ('BaseNavDescription', 'NodeC', 4, None, None),
+  'netRemote.nav.encFormData': ('BaseNavEncFormData', 'NodeC', 0, None, None),
+  'netRemote.nav.errorStr': ('BaseNavErrorStr', 'NodeC', 4, None, None),
+  'netRemote.nav.form.button': ('BaseNavFormButton', 'NodeList', 4, (('key', 1, 20), ('name', 32, 16)), None),
+  'netRemote.nav.formData': ('BaseNavFormData', 'NodeC', 0, None, None),
+  'netRemote.nav.form.item': ('BaseNavFormItem', 'NodeList', 4, (('key', 1, 20), ('formItemType', 1, 17), ('id', 32, 16), ('label', 32, 16), ('description', 256, 16), ('optionsCount', 1, 19)), None),
+  'netRemote.nav.form.option': ('BaseNavFormOption', 'NodeList', 4, (('key', 1, 20), ('name', 32, 16)), None),
+  'netRemote.nav.list': ('BaseNavList', 'NodeList', 4, (('key', 1, 20), ('name', 766, 16), ('type', 1, 17), ('subType', 1, 17), ('graphicUri', 766, 16), ('artist', 766, 16), ('contextMenu', 1, 17)), None),
+  'netRemote.nav.numItems': ('BaseNavNumItems', 'NodeS32', 4, None, None),
+  'netRemote.nav.preset.currentPreset': ('BaseNavPresetCurrentPreset', 'NodeU32', 6, None, None),
+  'netRemote.nav.preset.delete': ('BaseNavPresetDelete', 'NodeU32', 0, None, None),
+  'netRemote.nav.preset.download.artworkUrl': ('BaseNavPresetDownloadArtworkUrl', 'NodeC', 4, None, None),
+  'netRemote.nav.preset.download.blob': ('BaseNavPresetDownloadBlob', 'NodeC', 4, None, None),
+  'netRemote.nav.preset.download.download': ('BaseNavPresetDownloadDownload', 'NodeU32', 0, None, None),
+  'netRemote.nav.preset.download.name': ('BaseNavPresetDownloadName', 'NodeC', 4, None, None),
+  'netRemote.nav.preset.download.type': ('BaseNavPresetDownloadType', 'NodeC', 4, None, None),
+  'netRemote.nav.preset.listversion': ('BaseNavPresetListversion', 'NodeU32', 2, None, None),
+  'netRemote.nav.preset.swap.index1': ('BaseNavPresetSwapIndex1', 'NodeU32', 0, None, None),
+  'netRemote.nav.preset.swap.index2': ('BaseNavPresetSwapIndex2', 'NodeU32', 0, None, None),
+  'netRemote.nav.preset.swap.swap': ('BaseNavPresetSwapSwap', 'NodeU32', 0, None, None),
+  'netRemote.nav.preset.upload.artworkUrl': ('BaseNavPresetUploadArtworkUrl', 'NodeC', 0, None, None),
+  'netRemote.nav.preset.upload.blob': ('BaseNavPresetUploadBlob', 'NodeC', 0, None, None),
+  'netRemote.nav.preset.upload.name': ('BaseNavPresetUploadName', 'NodeC', 0, None, None),
+  'netRemote.nav.preset.upload.type': ('BaseNavPresetUploadType', 'NodeC', 0, None, None),
+  'netRemote.nav.preset.upload.upload': ('BaseNavPresetUploadUpload', 'NodeU32', 0, None, None),
+  'netRemote.nav.presets': ('BaseNavPresets', 'NodeList', 4, (('key', 1, 20), ('name', 65, 16), ('type', 32, 16), ('uniqid', 32, 16), ('blob', 2064, 16), ('artworkUrl', 512, 16)), None),
+  'netRemote.nav.refresh': ('BaseNavRefresh', 'NodeE8', 0, None, ('FALSE', 'TRUE')),
+  'netRemote.nav.releaseDate': ('BaseNavReleaseDate', 'NodeU32', 4, None, None),
+  'netRemote.nav.searchTerm': ('BaseNavSearchTerm', 'NodeC', 0, None, None),
+  'netRemote.nav.state': ('BaseNavState', 'NodeE8', 0, None, ('OFF', 'ON')),
+  'netRemote.nav.status': ('BaseNavStatus', 'NodeE8', 6, None, ('WAITING', 'READY', 'FAIL', 'FATAL_ERR', 'READY_ROOT')),
+  'netRemote.platform.OEM.colorProduct': ('BasePlatformOEMColorProduct', 'NodeC', 5, None, None),
+  'netRemote.platform.OEM.ledIntensity': ('BasePlatformOEMLedIntensity', 'NodeU8', 0, None, None),
+  'netRemote.platform.OEM.ledIntensitySteps': ('BasePlatformOEMLedIntensitySteps', 'NodeU8', 4, None, None),
+  'netRemote.platform.softApUpdate.updateModeRequest': ('BasePlatformSoftApUpdateUpdateModeRequest', 'NodeE8', 0, None, ('IDLE', 'START')),
+  'netRemote.platform.softApUpdate.updateModeStatus': ('BasePlatformSoftApUpdateUpdateModeStatus', 'NodeE8', 0, None, ('IDLE', 'STARTED')),
+  'netRemote.play.addPreset': ('BasePlayAddPreset', 'NodeU32', 0, None, None),
+  'netRemote.play.addPresetStatus': ('BasePlayAddPresetStatus', 'NodeE8', 6, None, ('PRESET_STORRED', 'PRESET_NOT_STORRED')),
+  'netRemote.play.alerttone': ('BasePlayAlerttone', 'NodeE8', 0, None, ('IDLE', 'PLAY')),
+  'netRemote.play.caps': ('BasePlayCaps', 'NodeU32', 4, None, None),
+  'netRemote.play.ConcurencyResponse': ('BasePlayConcurencyResponse', 'NodeE8', 0, None, ('FALSE', 'TRUE')),
+  'netRemote.play.ConcurencyStr': ('BasePlayConcurencyStr', 'NodeC', 4, None, None),
+  'netRemote.play.control': ('BasePlayControl', 'NodeE8', 0, None, ('STOP', 'PLAY', 'PAUSE', 'NEXT', 'PREVIOUS')),
+  'netRemote.play.errorStr': ('BasePlayErrorStr', 'NodeC', 4, None, None),
+  'netRemote.play.feedback': ('BasePlayFeedback', 'NodeE8', 0, None, ('IDLE', 'POSITIVE', 'NEGATIVE')),
+  'netRemote.play.frequency': ('BasePlayFrequency', 'NodeU32', 3, None, None),
+  'netRemote.play.info.album': ('BasePlayInfoAlbum', 'NodeC', 4, None, None),
+  'netRemote.play.info.albumDescription': ('BasePlayInfoAlbumDescription', 'NodeC', 4, None, None),
+  'netRemote.play.info.artist': ('BasePlayInfoArtist', 'NodeC', 4, None, None),
+  'netRemote.play.info.artistDescription': ('BasePlayInfoArtistDescription', 'NodeC', 4, None, None),
+  'netRemote.play.info.description': ('BasePlayInfoDescription', 'NodeC', 4, None, None),
+  'netRemote.play.info.duration': ('BasePlayInfoDuration', 'NodeU32', 4, None, None),
+  'netRemote.play.info.graphicUri': ('BasePlayInfoGraphicUri', 'NodeC', 4, None, None),
+  'netRemote.play.info.name': ('BasePlayInfoName', 'NodeC', 7, None, None),
+  'netRemote.play.info.providerLogoUri': ('BasePlayInfoProviderLogoUri', 'NodeC', 4, None, None),
+  'netRemote.play.info.providerName': ('BasePlayInfoProviderName', 'NodeC', 4, None, None),
+  'netRemote.play.info.text': ('BasePlayInfoText', 'NodeC', 7, None, None),
+  'netRemote.play.NotificationMessage': ('BasePlayNotificationMessage', 'NodeC', 6, None, None),
+  'netRemote.play.position': ('BasePlayPosition', 'NodeU32', 0, None, None),
+  'netRemote.play.rate': ('BasePlayRate', 'NodeS8', 0, None, None),
+  'netRemote.play.rating': ('BasePlayRating', 'NodeE8', 2, None, ('NEUTRAL', 'POSITIVE', 'NEGATIVE')),
+  'netRemote.play.repeat': ('BasePlayRepeat', 'NodeE8', 2, None, ('OFF', 'REPEAT_ALL', 'REPEAT_ONE')),
+  'netRemote.play.scrobble': ('BasePlayScrobble', 'NodeE8', 2, None, ('OFF', 'ON')),
+  'netRemote.play.serviceIds.dabEnsembleId': ('BasePlayServiceIdsDabEnsembleId', 'NodeU16', 5, None, None),
+  'netRemote.play.serviceIds.dabScids': ('BasePlayServiceIdsDabScids', 'NodeU8', 5, None, None),
+  'netRemote.play.serviceIds.dabServiceId': ('BasePlayServiceIdsDabServiceId', 'NodeU32', 5, None, None),
+  'netRemote.play.serviceIds.ecc': ('BasePlayServiceIdsEcc', 'NodeU8', 7, None, None),
+  'netRemote.play.serviceIds.fmRdsPi': ('BasePlayServiceIdsFmRdsPi', 'NodeU16', 7, None, None),
+  'netRemote.play.shuffle': ('BasePlayShuffle', 'NodeE8', 2, None, ('OFF', 'ON')),
+  'netRemote.play.shuffleStatus': ('BasePlayShuffleStatus', 'NodeE8', 6, None, ('OK', 'SHUFFLING', 'TOO_MANY_ITEMS', 'UNSUPPORTED')),
+  'netRemote.play.signalStrength': ('BasePlaySignalStrength', 'NodeU8', 4, None, None),
+  'netRemote.play.status': ('BasePlayStatus', 'NodeE8', 7, None, ('IDLE', 'BUFFERING', 'PLAYING', 'PAUSED', 'REBUFFERING', 'ERROR', 'STOPPED', 'ERROR_POPUP')),
+  'netRemote.spotify.bitRate': ('BaseSpotifyBitRate', 'NodeU8', 0, None, None),
+  'netRemote.spotify.lastError': ('BaseSpotifyLastError', 'NodeU8', 4, None, None),
+  'netRemote.spotify.loggedInState': ('BaseSpotifyLoggedInState', 'NodeE8', 0, None, ('NOT_LOGGED_IN', 'LOGGED_IN')),
+  'netRemote.spotify.loginUsingOauthToken': ('BaseSpotifyLoginUsingOauthToken', 'NodeC', 0, None, None),
+  'netRemote.spotify.playlist.name': ('BaseSpotifyPlaylistName', 'NodeC', 6, None, None),
+  'netRemote.spotify.playlist.uri': ('BaseSpotifyPlaylistUri', 'NodeC', 6, None, None),
+  'netRemote.spotify.status': ('BaseSpotifyStatus', 'NodeU8', 4, None, None),
+  'netRemote.spotify.username': ('BaseSpotifyUsername', 'NodeC', 4, None, None),
+  'netRemote.sys.alarm.config': ('BaseSysAlarmConfig', 'NodeList', 0, (('key', 1, 20), ('on', 1, 17), ('time', 7, 16), ('duration', 1, 18), ('source', 1, 17), ('preset', 1, 18), ('repeat', 1, 17), ('date', 9, 16), ('volume', 1, 18)), None),
+  'netRemote.sys.alarm.configChanged': ('BaseSysAlarmConfigChanged', 'NodeS8', 6, None, None),
+  'netRemote.sys.alarm.current': ('BaseSysAlarmCurrent', 'NodeS8', 4, None, None),
+  'netRemote.sys.alarm.duration': ('BaseSysAlarmDuration', 'NodeU32', 4, None, None),
+  'netRemote.sys.alarm.snooze': ('BaseSysAlarmSnooze', 'NodeU8', 0, None, None),
+  'netRemote.sys.alarm.snoozing': ('BaseSysAlarmSnoozing', 'NodeU16', 4, None, None),
+  'netRemote.sys.alarm.status': ('BaseSysAlarmStatus', 'NodeE8', 6, None, ('IDLE', 'ALARMING', 'SNOOZING')),
+  'netRemote.sys.audio.airableQuality': ('BaseSysAudioAirableQuality', 'NodeE8', 3, None, ('LOW', 'NORMAL', 'HIGH')),
+  'netRemote.sys.audio.eqCustom.param0': ('BaseSysAudioEqCustomParam0', 'NodeS16', 3, None, None),
+  'netRemote.sys.audio.eqCustom.param1': ('BaseSysAudioEqCustomParam1', 'NodeS16', 3, None, None),
+  'netRemote.sys.audio.eqCustom.param2': ('BaseSysAudioEqCustomParam2', 'NodeS16', 3, None, None),
+  'netRemote.sys.audio.eqCustom.param3': ('BaseSysAudioEqCustomParam3', 'NodeS16', 3, None, None),
+  'netRemote.sys.audio.eqCustom.param4': ('BaseSysAudioEqCustomParam4', 'NodeS16', 3, None, None),
+  'netRemote.sys.audio.eqLoudness': ('BaseSysAudioEqLoudness', 'NodeE8', 3, None, ('OFF', 'ON')),
+  'netRemote.sys.audio.eqPreset': ('BaseSysAudioEqPreset', 'NodeU8', 3, None, None),
+  'netRemote.sys.audio.extStaticDelay': ('BaseSysAudioExtStaticDelay', 'NodeU32', 0, None, None),
+  'netRemote.sys.audio.mute': ('BaseSysAudioMute', 'NodeE8', 3, None, ('NOT_MUTE', 'MUTE')),
+  'netRemote.sys.audio.volume': ('BaseSysAudioVolume', 'NodeU8', 3, None, None),
+  'netRemote.sys.caps.clockSourceList': ('BaseSysCapsClockSourceList', 'NodeList', 5, (('key', 1, 20), ('source', 10, 16)), None),
+  'netRemote.sys.caps.dabFreqList': ('BaseSysCapsDabFreqList', 'NodeList', 5, (('key', 1, 20), ('freq', 1, 20), ('label', 8, 16)), None),
+  'netRemote.sys.caps.eqBands': ('BaseSysCapsEqBands', 'NodeList', 5, (('key', 1, 20), ('label', 32, 16), ('min', 1, 22), ('max', 1, 22)), None),
+  'netRemote.sys.caps.eqPresets': ('BaseSysCapsEqPresets', 'NodeList', 5, (('key', 1, 20), ('label', 32, 16)), None),
+  'netRemote.sys.caps.extStaticDelayMax': ('BaseSysCapsExtStaticDelayMax', 'NodeU32', 5, None, None),
+  'netRemote.sys.caps.fmFreqRange.lower': ('BaseSysCapsFmFreqRangeLower', 'NodeU32', 5, None, None),
+  'netRemote.sys.caps.fmFreqRange.stepSize': ('BaseSysCapsFmFreqRangeStepSize', 'NodeU32', 5, None, None),
+  'netRemote.sys.caps.fmFreqRange.upper': ('BaseSysCapsFmFreqRangeUpper', 'NodeU32', 5, None, None),
+  'netRemote.sys.caps.fsdca': ('BaseSysCapsFsdca', 'NodeU32', 4, None, None),
+  'netRemote.sys.caps.utcSettingsList': ('BaseSysCapsUtcSettingsList', 'NodeList', 5, (('key', 1, 20), ('time', 1, 23), ('region', 32, 16)), None),
+  'netRemote.sys.caps.validLang': ('BaseSysCapsValidLang', 'NodeList', 5, (('key', 1, 20), ('langLabel', 32, 16)), None),
+  'netRemote.sys.caps.validModes': ('BaseSysCapsValidModes', 'NodeList', 5, (('key', 1, 20), ('id', 8, 16), ('selectable', 1, 17), ('label', 32, 16), ('streamable', 1, 17), ('modeType', 1, 17)), None),
+  'netRemote.sys.caps.volumeSteps': ('BaseSysCapsVolumeSteps', 'NodeU8', 5, None, None),
+  'netRemote.sys.cfg.irAutoPlayFlag': ('BaseSysCfgIrAutoPlayFlag', 'NodeE8', 1, None, ('AUTOPLAY_ON', 'AUTOPLAY_OFF')),
+  'netRemote.sys.clock.dateFormat': ('BaseSysClockDateFormat', 'NodeE8', 0, None, ('DATE_DD_MM_YYYY', 'DATE_MM_DD_YYYY')),
+  'netRemote.sys.clock.dst': ('BaseSysClockDst', 'NodeE8', 0, None, ('OFF', 'ON')),
+  'netRemote.sys.clock.localDate': ('BaseSysClockLocalDate', 'NodeC', 2, None, None),
+  'netRemote.sys.clock.localTime': ('BaseSysClockLocalTime', 'NodeC', 2, None, None),
+  'netRemote.sys.clock.mode': ('BaseSysClockMode', 'NodeE8', 0, None, ('_12_HOUR', '_24_HOUR')),
+  'netRemote.sys.clock.source': ('BaseSysClockSource', 'NodeE8', 0, None, ('MANUAL', 'DAB', 'FM', 'SNTP')),
+  'netRemote.sys.clock.timeZone': ('BaseSysClockTimeZone', 'NodeC', 0, None, None),
+  'netRemote.sys.clock.utcOffset': ('BaseSysClockUtcOffset', 'NodeS32', 0, None, None),
+  'netRemote.sys.factoryReset': ('BaseSysFactoryReset', 'NodeE8', 0, None, ('NONE', 'RESET')),
+  'netRemote.sys.info.activeSession': ('BaseSysInfoActiveSession', 'NodeE8', 5, None, ('NO', 'YES')),
+  'netRemote.sys.info.buildVersion': ('BaseSysInfoBuildVersion', 'NodeC', 4, None, None),
+  'netRemote.sys.info.controllerName': ('BaseSysInfoControllerName', 'NodeC', 0, None, None),
+  'netRemote.sys.info.dmruuid': ('BaseSysInfoDmruuid', 'NodeC', 4, None, None),
+  'netRemote.sys.info.friendlyName': ('BaseSysInfoFriendlyName', 'NodeC', 2, None, None),
+  'netRemote.sys.info.modelName': ('BaseSysInfoModelName', 'NodeC', 5, None, None),
+  'netRemote.sys.info.netRemoteVendorId': ('BaseSysInfoNetRemoteVendorId', 'NodeC', 5, None, None),
+  'netRemote.sys.info.radioId': ('BaseSysInfoRadioId', 'NodeC', 5, None, None),
+  'netRemote.sys.info.radioPin': ('BaseSysInfoRadioPin', 'NodeC', 0, None, None),
+  'netRemote.sys.info.radiotest': ('BaseSysInfoRadiotest', 'NodeC', 0, None, None),
+  'netRemote.sys.info.serialNumber': ('BaseSysInfoSerialNumber', 'NodeC', 5, None, None),
+  'netRemote.sys.info.version': ('BaseSysInfoVersion', 'NodeC', 5, None, None),
+  'netRemote.sys.ipod.dockStatus': ('BaseSysIpodDockStatus', 'NodeE8', 6, None, ('NOT_DOCKED', 'DOCKED_STILL_CONNECTING', 'DOCKED_ONLINE_READY', 'DOCKED_UNSUPPORTED_IPOD', 'DOCKED_UNKNOWN_DEVICE')),
+  'netRemote.sys.isu.control': ('BaseSysIsuControl', 'NodeE8', 0, None, ('IDLE', 'UPDATE_FIRMWARE', 'CHECK_FOR_UPDATE')),
+  'netRemote.sys.isu.mandatory': ('BaseSysIsuMandatory', 'NodeE8', 4, None, ('NO', 'YES')),
+  'netRemote.sys.isu.softwareUpdateProgress': ('BaseSysIsuSoftwareUpdateProgress', 'NodeU8', 4, None, None),
+  'netRemote.sys.isu.state': ('BaseSysIsuState', 'NodeE8', 6, None, ('IDLE', 'CHECK_IN_PROGRESS', 'UPDATE_AVAILABLE', 'UPDATE_NOT_AVAILABLE', 'CHECK_FAILED')),
+  'netRemote.sys.isu.summary': ('BaseSysIsuSummary', 'NodeC', 4, None, None),
+  'netRemote.sys.isu.version': ('BaseSysIsuVersion', 'NodeC', 4, None, None),
+  'netRemote.sys.lang': ('BaseSysLang', 'NodeU32', 0, None, None),
+  'netRemote.sys.mode': ('BaseSysMode', 'NodeU32', 3, None, None),
+  'netRemote.sys.net.commitChanges': ('BaseSysNetCommitChanges', 'NodeE8', 0, None, ('NO', 'YES')),
+  'netRemote.sys.net.ipConfig.address': ('BaseSysNetIpConfigAddress', 'NodeU32', 0, None, None),
+  'netRemote.sys.net.ipConfig.dhcp': ('BaseSysNetIpConfigDhcp', 'NodeE8', 0, None, ('NO', 'YES')),
+  'netRemote.sys.net.ipConfig.dnsPrimary': ('BaseSysNetIpConfigDnsPrimary', 'NodeU32', 0, None, None),
+  'netRemote.sys.net.ipConfig.dnsSecondary': ('BaseSysNetIpConfigDnsSecondary', 'NodeU32', 0, None, None),
+  'netRemote.sys.net.ipConfig.gateway': ('BaseSysNetIpConfigGateway', 'NodeU32', 0, None, None),
+  'netRemote.sys.net.ipConfig.subnetMask': ('BaseSysNetIpConfigSubnetMask', 'NodeU32', 0, None, None),
+  'netRemote.sys.net.keepConnected': ('BaseSysNetKeepConnected', 'NodeE8', 0, None, ('NO', 'YES')),
+  'netRemote.sys.net.uap.interfaceEnable': ('BaseSysNetUapInterfaceEnable', 'NodeE8', 2, None, ('INTERFACE_DISABLE', 'INTERFACE_ENABLE')),
+  'netRemote.sys.net.wired.interfaceEnable': ('BaseSysNetWiredInterfaceEnable', 'NodeE8', 0, None, ('INTERFACE_DISABLE', 'INTERFACE_ENABLE')),
+  'netRemote.sys.net.wired.macAddress': ('BaseSysNetWiredMacAddress', 'NodeC', 4, None, None),
+  'netRemote.sys.net.wlan.activateProfile': ('BaseSysNetWlanActivateProfile', 'NodeC', 0, None, None),
+  'netRemote.sys.net.wlan.connectedSSID': ('BaseSysNetWlanConnectedSSID', 'NodeU', 4, None, None),
+  'netRemote.sys.net.wlan.deactivateProfile': ('BaseSysNetWlanDeactivateProfile', 'NodeC', 0, None, None),
+  'netRemote.sys.net.wlan.interfaceEnable': ('BaseSysNetWlanInterfaceEnable', 'NodeE8', 0, None, ('INTERFACE_DISABLE', 'INTERFACE_ENABLE')),
+  'netRemote.sys.net.wlan.macAddress': ('BaseSysNetWlanMacAddress', 'NodeC', 4, None, None),
+  'netRemote.sys.net.wlan.performFCC': ('BaseSysNetWlanPerformFCC', 'NodeE8', 0, None, ('TEST_STOP', 'TEST_START')),
+  'netRemote.sys.net.wlan.performWPS': ('BaseSysNetWlanPerformWPS', 'NodeE8', 2, None, ('WPS_IDLE', 'WPS_PBC', 'WPS_PIN')),
+  'netRemote.sys.net.wlan.profiles': ('BaseSysNetWlanProfiles', 'NodeList', 4, (('key', 1, 20), ('ssid', 32, 18)), None),
+  'netRemote.sys.net.wlan.region': ('BaseSysNetWlanRegion', 'NodeE8', 0, None, ('INVALID', 'USA', 'CANADA', 'EUROPE', 'SPAIN', 'FRANCE', 'JAPAN', 'AUSTRALIA', 'Reserved8')),
+  'netRemote.sys.net.wlan.regionFcc': ('BaseSysNetWlanRegionFcc', 'NodeE8', 4, None, ('NOT_ACTIVE', 'ACTIVE')),
+  'netRemote.sys.net.wlan.removeProfile': ('BaseSysNetWlanRemoveProfile', 'NodeC', 0, None, None),
+  'netRemote.sys.net.wlan.rssi': ('BaseSysNetWlanRssi', 'NodeU8', 4, None, None),
+  'netRemote.sys.net.wlan.scan': ('BaseSysNetWlanScan', 'NodeE8', 2, None, ('IDLE', 'SCAN')),
+  'netRemote.sys.net.wlan.scanList': ('BaseSysNetWlanScanList', 'NodeList', 4, (('key', 1, 20), ('ssid', 32, 18), ('privacy', 1, 17), ('wpsCapability', 1, 17), ('rssi', 1, 18)), None),
+  'netRemote.sys.net.wlan.selectAP': ('BaseSysNetWlanSelectAP', 'NodeU32', 0, None, None),
+  'netRemote.sys.net.wlan.selectProfile': ('BaseSysNetWlanSelectProfile', 'NodeU8', 0, None, None),
+  'netRemote.sys.net.wlan.setAuthType': ('BaseSysNetWlanSetAuthType', 'NodeE8', 0, None, ('OPEN', 'PSK', 'WPA', 'WPA2')),
+  'netRemote.sys.net.wlan.setEncType': ('BaseSysNetWlanSetEncType', 'NodeE8', 0, None, ('NONE', 'WEP', 'TKIP', 'AES')),
+  'netRemote.sys.net.wlan.setFccTestChanNum': ('BaseSysNetWlanSetFccTestChanNum', 'NodeU8', 0, None, None),
+  'netRemote.sys.net.wlan.setFccTestDataRate': ('BaseSysNetWlanSetFccTestDataRate', 'NodeE8', 0, None, ('_1M', '_2M', '_5_5M', '_11M', '_22M', '_6M', '_9M', '_12M', '_18M', '_24M', '_36M', '_48M', '_54M', '_72M')),
+  'netRemote.sys.net.wlan.setFccTestTxDataPattern': ('BaseSysNetWlanSetFccTestTxDataPattern', 'NodeU32', 0, None, None),
+  'netRemote.sys.net.wlan.setFccTestTxPower': ('BaseSysNetWlanSetFccTestTxPower', 'NodeU8', 0, None, None),
+  'netRemote.sys.net.wlan.setFccTxOff': ('BaseSysNetWlanSetFccTxOff', 'NodeE8', 0, None, ('TX_ON', 'TX_OFF')),
+  'netRemote.sys.net.wlan.setPassphrase': ('BaseSysNetWlanSetPassphrase', 'NodeC', 0, None, None),
+  'netRemote.sys.net.wlan.setSSID': ('BaseSysNetWlanSetSSID', 'NodeC', 0, None, None),
+  'netRemote.sys.net.wlan.wpsPinRead': ('BaseSysNetWlanWpsPinRead', 'NodeC', 4, None, None),
+  'netRemote.sys.power': ('BaseSysPower', 'NodeE8', 3, None, ('OFF', 'ON')),
+  'netRemote.sys.rsa.publicKey': ('BaseSysRsaPublicKey', 'NodeC', 4, None, None),
+  'netRemote.sys.rsa.status': ('BaseSysRsaStatus', 'NodeE8', 4, None, ('GENERATION_IN_PROGRESS', 'KEY_AVAILABLE')),
+  'netRemote.sys.sleep': ('BaseSysSleep', 'NodeU32', 0, None, None),
+  'netRemote.sys.state': ('BaseSysState', 'NodeE8', 2, None, ('NORMAL_MODE', 'SAPU_MODE')),
+  'netRemote.test.iperf.commandLine': ('BaseTestIperfCommandLine', 'NodeC', 0, None, None),
+  'netRemote.test.iperf.console': ('BaseTestIperfConsole', 'NodeC', 0, None, None),
+  'netRemote.test.iperf.execute': ('BaseTestIperfExecute', 'NodeE8', 0, None, ('STOP', 'START')),
+}
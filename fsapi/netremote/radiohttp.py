@@ -26,16 +26,22 @@ Basic network operations on the NetRemote API will be delegated via the
 
 '''
 
-import urllib3
+import time
 import xml.etree.ElementTree as xmltree
 
-from ..netconfig import FSNetConfiguration
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+from ..netconfig import FSNetConfiguration, get_default_netconfig
+from .basenode import NodeError, _ARG_CONVERTERS, _convert_field
+from .encoder import get_set_encoder, encode_parameters
+from .trace import RequestTrace, get_request_hooks
 
 __all__ = [ 
   "RADIO_HTTP_DEFAULT_PIN", "GET", "GET_MULTIPLE", "SET", "SET_MULTIPLE", 
   "LIST_GET", "LIST_GET_NEXT", "CREATE_SESSION", "DELETE_SESSION",
   "NodeError", "ApiResponse", "RadioHttp", "netremote_request",
-  "is_list_class"
+  "is_list_class", "netremote_list_pages", "netremote_list_items"
 ]
 
 RADIO_HTTP_DEFAULT_PIN = '1234'
@@ -49,9 +55,12 @@ LIST_GET_NEXT   = 'LIST_GET_NEXT'
 CREATE_SESSION  = 'CREATE_SESSION'
 DELETE_SESSION  = 'DELETE_SESSION'
 
-class NodeError(Exception):
-  """The base class for all node related issues."""
-  pass
+def _convert_value(node_class, text: str) -> object:
+  # Converts the text of a value into the python type declared by the node's
+  # prototype. Value nodes define exactly one argument.
+  prototype = node_class.get_prototype()
+  if not prototype: return text
+  return _convert_field(_ARG_CONVERTERS.get(prototype.get_args()[0].data_type), text)
 
 class ApiResponse:
   '''An object wrapper storing HTTP response data.
@@ -61,6 +70,8 @@ class ApiResponse:
   :param content: a node instance of type ``node_class``, which is created when 
                   ``parsexml()`` was called.
   :param status: the status code from the HTTP-response
+  :param listend: whether the response contains the `listend` marker, which the device 
+                  appends to the last page of a list
   '''
   
   def __init__(self, node_class, xml_root: xmltree.Element = None) -> None:
@@ -68,37 +79,55 @@ class ApiResponse:
     self.node_class = node_class
     self.status = None
     self.content = None
+    self.listend = False
 
   def parsexml(self, content: bytes, as_list: bool = False):
+    '''Parses the given XML-response.
+
+    The children of the root element are visited exactly once: the status and the 
+    first value are taken in that pass and the value is converted to the python type 
+    declared by the node's prototype. List items are passed to the node's 
+    ``loaditem()`` method.
+
+    :param content: the response body
+    :param as_list: whether the response contains list items
+    '''
     self.xml_root = xmltree.fromstring(content)
-    self.status = self.xml_root.find('status').text
-    if self.status != 'FS_OK':
-      return
 
-    self.content = self.node_class()
-    prototype = self.content.get_prototype()
+    for element in self.xml_root:
+      tag = element.tag
+      if tag == 'status':
+        self.status = element.text
+        if self.status != 'FS_OK':
+          return
+        self.content = self.node_class()
+      elif self.content is None:
+        continue
+      elif as_list:
+        if tag == 'item':
+          self.content.loaditem(element)
+        elif tag == 'listend':
+          self.listend = True
+      elif tag == 'value' and len(element):
+        self.content.value = _convert_value(self.node_class, element[0].text)
+      elif tag == 'sessionId':
+        self.content.value = element.text
 
-    # xmltree.dump(self.xml_root)
-    if not as_list:
-      if 'CreateSession' in self.node_class.__name__:
-        self.content.value = self.xml_root.find('sessionId').text
-      else:
-        value = self.xml_root.find('value')
-        if value:
-          for i, argument in enumerate(prototype):
-            self.content.value = value[i].text
-            self.content.update()
-    else:
-      self.content.loadxml(self.xml_root)
+  def to_json(self, columnar: bool = False): #  -> dict | str
+    '''Returns the content of this response as a JSON serializable object.
 
-  def to_json(self): #  -> dict | str
+    :param columnar: if enabled, the items of a list node are exported as a dictionary 
+                     of columns (without copying them) instead of a list of dictionaries.
+    '''
     if not self.content: return ""
     else:
       is_list = is_list_class(self.node_class)
       
-      values = self.content.__dict__
+      values = dict(self.content.__dict__)
       if is_list: 
-        values['items'] = [x.attr for x in self.content.items]
+        values.pop('columns', None)
+        items = self.content.get_items()
+        values['items'] = items.to_json() if columnar else [x.attr for x in items]
       if 'prototype' in values: values.pop('prototype')
       return values
 
@@ -110,11 +139,13 @@ class RadioHttp:
   
   :param host: the target host IP-Address.
   :param pin: the target's PIN (default "`1234`"). 
+  :param hooks: hooks called with a ``RequestTrace`` after each request to this radio
   '''
-  def __init__(self, host: str, pin: str = RADIO_HTTP_DEFAULT_PIN) -> None:
+  def __init__(self, host: str, pin: str = RADIO_HTTP_DEFAULT_PIN, hooks: list = None) -> None:
     self.host = host
     self.pin = pin
     self.sessionid = None
+    self.hooks = hooks
   
   def __str__(self) -> str:
     return "Radio(host='%s', pin='%s')" % (self.host, self.pin)
@@ -127,9 +158,25 @@ def is_list_class(node_class) -> bool:
     if 'List' in class_name.__name__:
       return True
 
+_NODE_METHODS = (GET, SET, LIST_GET, LIST_GET_NEXT)
+
+# URL paths by method and node class
+_url_paths = {}
+
+def _get_url_path(method: str, node_class) -> str:
+  path = _url_paths.get((method, node_class))
+  if path is None:
+    if method in _NODE_METHODS:
+      path = '/fsapi/%s/%s' % (method, quote(node_class.get_name()))
+    else:
+      path = '/fsapi/%s' % method
+    _url_paths[(method, node_class)] = path
+  return path
+
 # [async]
 def netremote_request(method: str, node_class, radio: RadioHttp,
-                 netconfig: FSNetConfiguration = None, parameters: dict = None) -> ApiResponse:
+                 netconfig: FSNetConfiguration = None, parameters: dict = None,
+                 start_key: int = -1, attempt: int = 0) -> ApiResponse:
   '''Performs a NetRemote-Request.
 
   This method can be called in different situations and will behave always the same: First, it 
@@ -154,29 +201,161 @@ def netremote_request(method: str, node_class, radio: RadioHttp,
   :param parameters: used if a list of items is queried or a new value should be applied to a node. Please 
                      refer to the related node class, which parameters are accepted (if there is no argument
                      name, use value as parameter name).
+  :param start_key: the key of the list item after which the next items should be returned 
+                    (only used with `LIST_GET_NEXT`, default `-1` for the start of the list).
+  :param attempt: the attempt of a ``RetryPolicy`` (``0`` for the first request), which 
+                  is reported in the ``RequestTrace``.
+
+  The parameters of a `SET` request are validated against the node's prototype before the 
+  request is sent (see ``SetEncoder``), all parameters are URL-encoded.
+
+  If request hooks are registered (globally or in ``radio.hooks``), each of them is called with 
+  a ``RequestTrace`` of this request, even if the request failed.
   
+  :raises NodeValueError: if a value of a `SET` request is invalid
   :returns: an ``ApiReponse`` object including a node instance with the gathered value
   '''
 
-  node_uri = node_class.get_name()
-  if LIST_GET in method: node_uri += '/-l' # -l for -list
+  start = time.perf_counter()
+  hooks = get_request_hooks(radio)
+  trace = RequestTrace(method, node_class.get_name(), radio.host) if hooks else None
+  if trace: trace.attempt = attempt
 
-  if method not in [GET, LIST_GET_NEXT, SET, LIST_GET]: 
-    url = 'http://%s/fsapi/%s?pin=%s' % (radio.host, method, radio.pin) 
-  else: 
-    url = 'http://%s/fsapi/%s/%s?pin=%s' % (radio.host, method, node_uri, radio.pin)
-    if parameters: url += '&' + '&'.join(['%s=%s' % (key, parameters[key]) for key in parameters])
+  path = _get_url_path(method, node_class)
+  if LIST_GET in method: path += '/%d' % start_key
 
-  if netconfig:
-    response = netconfig.delegate_request(GET, url)
-  else:
-    pool = urllib3.PoolManager()
-    response = pool.request(GET, url)
-  
-  if response.status != 200:
-    raise NodeError('Invalid response code')
-  
-  api_response = ApiResponse(node_class)
-  api_response.parsexml(response.data, as_list=(LIST_GET in method))
-  
-  return api_response
\ No newline at end of file
+  url = 'http://%s%s?pin=%s' % (radio.host, path, quote(str(radio.pin), safe=''))
+  if method == SET:
+    url += get_set_encoder(node_class).encode(parameters)
+  elif method in _NODE_METHODS:
+    url += encode_parameters(parameters)
+
+  try:
+    request_start = time.perf_counter()
+    response = (netconfig or get_default_netconfig()).delegate_request(GET, url, preload_content=False)
+    read_start = time.perf_counter()
+    data = response.data
+    response.release_conn()
+    parse_start = time.perf_counter()
+
+    if trace:
+      trace.http_status = response.status
+      trace.size = len(data)
+      trace.retries = len(response.retries.history) if response.retries else 0
+      trace.ttfb = read_start - request_start
+      trace.read = parse_start - read_start
+
+    if response.status != 200:
+      raise NodeError('Invalid response code: %d' % response.status, response.status)
+
+    api_response = ApiResponse(node_class)
+    api_response.parsexml(data, as_list=(LIST_GET in method))
+    if trace:
+      trace.status = api_response.status
+      trace.parse = time.perf_counter() - parse_start
+    return api_response
+  except Exception as error:
+    if trace: trace.error = str(error) or type(error).__name__
+    raise
+  finally:
+    if trace:
+      trace.total = time.perf_counter() - start
+      for hook in hooks: hook(trace)
+
+def _next_list_key(api_response: ApiResponse, start_key: int):
+  # Returns the key of the last item on the given page, or None if there is 
+  # nothing more to fetch.
+  if api_response.status != 'FS_OK' or api_response.listend:
+    return None
+
+  items = api_response.content.get_items()
+  if not items: return None
+  try:
+    key = int(items[-1].get_attr_by_name('key'))
+  except (TypeError, ValueError):
+    return None
+  # The key has to advance, otherwise we would request the same page forever
+  return key if key > start_key else None
+
+def netremote_list_pages(node_class, radio: RadioHttp, netconfig: FSNetConfiguration = None,
+                         parameters: dict = None, max_items: int = 100, start_key: int = -1,
+                         prefetch: bool = True, retry_policy = None):
+  '''Iterates over all pages of a list node by following the key of the last item.
+
+  Each page is fetched with a `LIST_GET_NEXT` request and yielded as an ``ApiResponse``. If 
+  ``prefetch`` is enabled, the following page will be requested in the background while the 
+  caller consumes the current one. The iteration stops at the page containing the `listend` 
+  marker or if the device returns a status other than `FS_OK`. Note that a non-`FS_OK` 
+  response is only yielded if it is the first page:
+
+  >>> for page in fsapi.netremote_list_pages(fsapi.nodes.BaseNavPresets, radio, max_items=20):
+  ...   print(page.content.size())
+
+  :param node_class: the list node class to query
+  :param radio: the radio object storing the pin value and the target host string
+  :param netconfig: an optional custom network configuration
+  :param parameters: additional parameters like the session id (`sid`)
+  :param max_items: the maximum amount of items per page (`maxItems`)
+  :param start_key: the key after which the first page should start
+  :param prefetch: whether the next page should be fetched while the current page is consumed
+  :param retry_policy: an optional ``RetryPolicy`` used to fetch each page
+
+  :returns: a generator of ``ApiResponse`` objects
+  '''
+  params = {'maxItems': max_items}
+  if parameters: params.update(parameters)
+
+  def fetch(key: int) -> ApiResponse:
+    if retry_policy:
+      return retry_policy.request(LIST_GET_NEXT, node_class, radio, netconfig, params, start_key=key)
+    return netremote_request(LIST_GET_NEXT, node_class, radio, netconfig, params, start_key=key)
+
+  executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+  pending = None
+  try:
+    key = start_key
+    api_response = fetch(key)
+    first = True
+    while True:
+      if not first and api_response.status != 'FS_OK':
+        return
+      
+      next_key = _next_list_key(api_response, key)
+      if next_key is not None and executor:
+        pending = executor.submit(fetch, next_key)
+
+      yield api_response
+      if next_key is None:
+        return
+
+      key, first = next_key, False
+      if pending:
+        api_response, pending = pending.result(), None
+      else:
+        api_response = fetch(key)
+  finally:
+    if pending: pending.cancel()
+    if executor: executor.shutdown(wait=False)
+
+def netremote_list_items(node_class, radio: RadioHttp, netconfig: FSNetConfiguration = None,
+                         parameters: dict = None, max_items: int = 100, 
+                         prefetch: bool = True, retry_policy = None):
+  '''Iterates over all items of a list node without buffering the whole list.
+
+  This function wraps ``netremote_list_pages()`` and yields each ``NodeListItem`` as soon 
+  as its page has been received. 
+
+  :raises NodeError: if the first page could not be retrieved (status other than `FS_OK`
+                     or `FS_LIST_END`)
+  :returns: a generator of ``NodeListItem`` objects
+  '''
+  for api_response in netremote_list_pages(node_class, radio, netconfig, parameters,
+                                           max_items, prefetch=prefetch,
+                                           retry_policy=retry_policy):
+    if api_response.status == 'FS_LIST_END':
+      return
+    if api_response.status != 'FS_OK':
+      raise NodeError('Could not fetch list: %s' % api_response.status, api_response.status)
+    
+    for item in api_response.content.get_items():
+      yield item
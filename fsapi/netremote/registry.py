@@ -0,0 +1,185 @@
+# MIT License
+
+# Copyright (c) 2022 MatrixEditor
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+__doc__ = '''
+The ``NodeRegistry`` answers all lookups of node names and node classes. It is
+built once from the node table and keeps a trie over the dotted node names, so
+all nodes below a namespace can be queried without scanning the whole table::
+
+    registry = fsapi.get_node_registry()
+
+    # exact lookup (the node class is created on first access)
+    node_class = registry['netRemote.sys.info.version']
+
+    # all nodes below netRemote.sys.caps
+    names = registry.names('netRemote.sys.caps')
+
+    # all list nodes that can be altered
+    types = registry.types(list_only=True, readonly=False)
+
+Results of queries are cached. Names are returned as tuples and node types as
+read-only mappings.
+'''
+
+from types import MappingProxyType
+
+from .nodetable import NODE_TABLE, NODE_CACHEABLE, NODE_NOTIFYING, NODE_READONLY
+
+__all__ = [
+  "NodeRegistry", "get_node_registry"
+]
+
+class _TrieNode:
+  __slots__ = ('children', 'name')
+
+  def __init__(self) -> None:
+    self.children = {}
+    self.name = None
+
+class NodeRegistry:
+  '''A registry of all nodes defined in the node table.
+
+  :param table: the node table to use (default ``NODE_TABLE``)
+  '''
+
+  def __init__(self, table: dict = None) -> None:
+    self.table = table if table is not None else NODE_TABLE
+    self._types = {}
+    self._queries = {}
+    self._type_queries = {}
+    self._root = _TrieNode()
+    for name in self.table:
+      node = self._root
+      for segment in name.split('.'):
+        child = node.children.get(segment)
+        if child is None:
+          child = node.children[segment] = _TrieNode()
+        node = child
+      node.name = name
+
+  def get(self, name: str, default: type = None) -> type:
+    '''Returns the class type of the node with the given name.'''
+    node_type = self._types.get(name)
+    if node_type is None:
+      entry = self.table.get(name)
+      if entry is None:
+        return default
+      from . import nodes
+      node_type = self._types[name] = getattr(nodes, entry[0])
+    return node_type
+
+  def names(self, prefix: str = None, list_only: bool = None, readonly: bool = None,
+            notifying: bool = None, cacheable: bool = None) -> tuple:
+    '''Returns the names of all nodes matching the given filters.
+
+    The prefix is matched segment by segment: ``netRemote.sys.caps`` returns the node
+    itself (if defined) and all nodes below it. The last segment may be incomplete,
+    so ``netRemote.sys.info.fr`` matches ``netRemote.sys.info.friendlyName``. A filter
+    set to ``None`` is ignored.
+
+    :param prefix: the dotted namespace of the nodes
+    :param list_only: whether only list nodes (``True``) or no list nodes (``False``)
+                      should be returned
+    :param readonly: filter by the readonly flag
+    :param notifying: filter by the notifying flag
+    :param cacheable: filter by the cacheable flag
+    '''
+    key = (prefix, list_only, readonly, notifying, cacheable)
+    result = self._queries.get(key)
+    if result is None:
+      names = self._find(prefix) if prefix else tuple(self.table)
+      result = self._queries[key] = tuple(
+        name for name in names
+        if self._matches(self.table[name], list_only, readonly, notifying, cacheable)
+      )
+    return result
+
+  def types(self, prefix: str = None, list_only: bool = None, readonly: bool = None,
+            notifying: bool = None, cacheable: bool = None) -> MappingProxyType:
+    '''Same as ``names()``, but returns a read-only mapping of the node names to their
+    class type.'''
+    key = (prefix, list_only, readonly, notifying, cacheable)
+    result = self._type_queries.get(key)
+    if result is None:
+      result = self._type_queries[key] = MappingProxyType({
+        name: self.get(name) for name in self.names(*key)
+      })
+    return result
+
+  def _find(self, prefix: str) -> tuple:
+    segments = prefix.rstrip('.').split('.')
+    node = self._root
+    for segment in segments[:-1]:
+      node = node.children.get(segment)
+      if node is None:
+        return ()
+
+    last = segments[-1]
+    if last in node.children:
+      starts = [node.children[last]]
+    else:
+      starts = [child for segment, child in node.children.items() if segment.startswith(last)]
+
+    names = []
+    stack = list(reversed(starts))
+    while stack:
+      node = stack.pop()
+      if node.name is not None: names.append(node.name)
+      stack.extend(reversed(list(node.children.values())))
+    return tuple(names)
+
+  @staticmethod
+  def _matches(entry: tuple, list_only: bool, readonly: bool, notifying: bool,
+               cacheable: bool) -> bool:
+    flags = entry[2]
+    if list_only is not None and (entry[1] == 'NodeList') != list_only:
+      return False
+    if readonly is not None and bool(flags & NODE_READONLY) != readonly:
+      return False
+    if notifying is not None and bool(flags & NODE_NOTIFYING) != notifying:
+      return False
+    if cacheable is not None and bool(flags & NODE_CACHEABLE) != cacheable:
+      return False
+    return True
+
+  def __getitem__(self, name: str) -> type:
+    node_type = self.get(name)
+    if node_type is None:
+      raise KeyError(name)
+    return node_type
+
+  def __contains__(self, name: str) -> bool:
+    return name in self.table
+
+  def __iter__(self):
+    return iter(self.table)
+
+  def __len__(self) -> int:
+    return len(self.table)
+
+_registry = None
+
+def get_node_registry() -> NodeRegistry:
+  '''Returns the registry of all nodes (created on the first call).'''
+  global _registry
+  if _registry is None:
+    _registry = NodeRegistry()
+  return _registry
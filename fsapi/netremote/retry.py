@@ -0,0 +1,220 @@
+# MIT License
+
+# Copyright (c) 2022 MatrixEditor
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+__doc__ = '''
+A ``RetryPolicy`` repeats requests that failed for a transient reason, e.g. a device
+answering with `FS_TIMEOUT` or a dropped connection. Statuses like
+`FS_NODE_DOES_NOT_EXIST` are never retried, because the answer won't change:
+
+>>> policy = fsapi.RetryPolicy(budget=30)
+>>> result = policy.request(fsapi.GET, fsapi.nodes.BaseSysInfoVersion, radio)
+
+Between two attempts the policy waits an exponentially growing, randomized time. The
+total time spent waiting is limited by the ``budget`` of the policy, which is shared
+by all requests made with it. Additionally, each device gets a ``CircuitBreaker``: after
+too many failures in a row, requests to that device fail immediately with a
+``CircuitOpenError`` until the ``reset_timeout`` has passed. Only the statuses in
+``DEFAULT_SUCCESS_STATUSES`` close the breaker again, all other answers and errors
+count as failures.
+
+Each attempt is reported to the request hooks, the ``RequestTrace`` of a retry
+carries the number of the attempt.
+'''
+
+import random
+import threading
+import time
+import urllib3
+
+from ..netconfig import FSNetConfiguration
+from .radiohttp import *
+
+__all__ = [
+  "RetryPolicy", "CircuitBreaker", "CircuitOpenError", "DEFAULT_RETRY_RULES",
+  "DEFAULT_SUCCESS_STATUSES", "RETRY_ERROR"
+]
+
+# Used as the status of requests that failed without a response
+RETRY_ERROR = 'ERROR'
+
+# The maximum amount of retries per status. Statuses not present here are
+# not retried.
+DEFAULT_RETRY_RULES = {
+  'FS_TIMEOUT': 3,
+  'FS_NODE_BLOCKED': 1,
+  RETRY_ERROR: 2,
+  500: 2, 502: 2, 503: 3, 504: 3,
+}
+
+# Statuses of a device that handled the request. These reset the circuit breaker,
+# although only FS_OK carries a value.
+DEFAULT_SUCCESS_STATUSES = frozenset((
+  'FS_OK', 'FS_LIST_END', 'FS_NODE_DOES_NOT_EXIST', 'FS_PACKET_BAD'
+))
+
+class CircuitOpenError(NodeError):
+  """Raised if requests to a device are blocked by its circuit breaker."""
+  pass
+
+class CircuitBreaker:
+  '''Blocks requests to a device after too many failures in a row.
+
+  After ``reset_timeout`` seconds, one request is let through. If it succeeds, the
+  breaker is closed again, otherwise it stays open for another ``reset_timeout``.
+
+  :param threshold: the amount of failures in a row that open the breaker
+  :param reset_timeout: the time in seconds until a request is tried again
+  '''
+
+  def __init__(self, threshold: int = 5, reset_timeout: float = 30.0) -> None:
+    self.threshold = threshold
+    self.reset_timeout = reset_timeout
+    self.failures = 0
+    self.opened_at = None
+    self.lock = threading.Lock()
+
+  def is_open(self) -> bool:
+    return self.opened_at is not None
+
+  def allow(self) -> bool:
+    '''Returns whether a request may be sent.'''
+    with self.lock:
+      if self.opened_at is None:
+        return True
+      if time.monotonic() - self.opened_at >= self.reset_timeout:
+        # Let one request through, the next ones wait for its result
+        self.opened_at = time.monotonic()
+        return True
+      return False
+
+  def record_success(self) -> None:
+    with self.lock:
+      self.failures = 0
+      self.opened_at = None
+
+  def record_failure(self) -> None:
+    with self.lock:
+      self.failures += 1
+      if self.failures >= self.threshold:
+        self.opened_at = time.monotonic()
+
+class RetryPolicy:
+  '''Retries failed requests with exponential backoff and jitter.
+
+  The delay before the n-th retry is a random value between ``0`` and
+  ``min(max_backoff, backoff * factor ** n)``.
+
+  :param rules: the maximum amount of retries per status (HTTP status codes,
+                `fsapiResponse` status or ``RETRY_ERROR`` for connection errors)
+  :param backoff: the base delay in seconds
+  :param factor: the growth of the delay per attempt
+  :param max_backoff: the maximum delay in seconds
+  :param jitter: whether the delay should be randomized
+  :param budget: the total time in seconds this policy may spend waiting for retries
+                 (``None`` for no limit)
+  :param threshold: the amount of failures in a row that open the circuit breaker of
+                    a device (``0`` disables circuit breakers)
+  :param reset_timeout: the time in seconds a circuit breaker stays open
+  :param success: the statuses that are recorded as a success by the circuit breaker
+  '''
+
+  def __init__(self, rules: dict = None, backoff: float = 0.1, factor: float = 2.0,
+               max_backoff: float = 5.0, jitter: bool = True, budget: float = None,
+               threshold: int = 5, reset_timeout: float = 30.0,
+               success: set = None) -> None:
+    self.rules = dict(DEFAULT_RETRY_RULES if rules is None else rules)
+    self.backoff = backoff
+    self.factor = factor
+    self.max_backoff = max_backoff
+    self.jitter = jitter
+    self.budget = budget
+    self.threshold = threshold
+    self.reset_timeout = reset_timeout
+    self.success = frozenset(DEFAULT_SUCCESS_STATUSES if success is None else success)
+    self.spent = 0.0
+    self.breakers = {}
+    self.lock = threading.Lock()
+
+  def get_breaker(self, host: str) -> CircuitBreaker:
+    '''Returns the circuit breaker of the given host (``None`` if disabled).'''
+    if not self.threshold:
+      return None
+    with self.lock:
+      breaker = self.breakers.get(host)
+      if breaker is None:
+        breaker = self.breakers[host] = CircuitBreaker(self.threshold, self.reset_timeout)
+      return breaker
+
+  def get_delay(self, attempt: int) -> float:
+    '''Returns the delay before the given retry (starting at ``0``).'''
+    delay = min(self.max_backoff, self.backoff * self.factor ** attempt)
+    return random.uniform(0, delay) if self.jitter else delay
+
+  def _reserve(self, delay: float) -> bool:
+    # Takes the delay from the budget, if there is enough left
+    with self.lock:
+      if self.budget is not None and self.spent + delay > self.budget:
+        return False
+      self.spent += delay
+      return True
+
+  def request(self, method: str, node_class, radio: RadioHttp,
+              netconfig: FSNetConfiguration = None, parameters: dict = None,
+              start_key: int = -1) -> ApiResponse:
+    '''Performs ``netremote_request()`` and retries it according to this policy.
+
+    If all retries of a response status were used, the last response is returned.
+
+    :raises CircuitOpenError: if the circuit breaker of the device is open
+    :raises NodeError: if the request failed and can't be retried
+    :returns: the ``ApiResponse`` of the last attempt
+    '''
+    breaker = self.get_breaker(radio.host)
+    attempt = 0
+    while True:
+      if breaker and not breaker.allow():
+        raise CircuitOpenError('Circuit open for host: %s' % radio.host, RETRY_ERROR)
+
+      try:
+        response = netremote_request(method, node_class, radio, netconfig, parameters,
+                                     start_key, attempt=attempt)
+        status, error = response.status, None
+      except NodeError as node_error:
+        response, status, error = None, node_error.status, node_error
+      except urllib3.exceptions.HTTPError as http_error:
+        response, status, error = None, RETRY_ERROR, http_error
+
+      if breaker:
+        if status in self.success: breaker.record_success()
+        else: breaker.record_failure()
+
+      retries = self.rules.get(status, 0)
+
+      if attempt < retries:
+        delay = self.get_delay(attempt)
+        if self._reserve(delay):
+          time.sleep(delay)
+          attempt += 1
+          continue
+
+      if error is not None:
+        raise error
+      return response
@@ -0,0 +1,229 @@
+# MIT License
+
+# Copyright (c) 2022 MatrixEditor
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+__doc__ = '''
+Each call of ``netremote_request()`` can be traced by hooks. A hook is a callable that
+receives a ``RequestTrace`` after the request has finished (or failed). Hooks can be
+registered for all requests or only for the requests of one ``RadioHttp`` object:
+
+>>> metrics = fsapi.RequestMetrics()
+>>> fsapi.add_request_hook(metrics)
+>>> radio = fsapi.RadioHttp('127.0.0.1', hooks=[fsapi.LoggingHook()])
+>>> ...
+>>> print(metrics.to_prometheus())
+
+The following times (in seconds) are recorded:
+
+* ``ttfb``: from sending the request until the response headers were received. urllib3
+  does not expose the DNS lookup and connection setup, so both are included here.
+* ``read``: reading the response body
+* ``parse``: parsing the XML response
+* ``total``: the complete request including the creation of the URL
+'''
+
+import bisect
+import logging
+import threading
+
+__all__ = [
+  "RequestTrace", "RequestMetrics", "Histogram", "LoggingHook",
+  "add_request_hook", "remove_request_hook", "get_request_hooks", "DEFAULT_BUCKETS"
+]
+
+# Upper bounds of the histogram buckets in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+REQUEST_HOOKS = []
+
+class RequestTrace:
+  '''The timing and result of a single request.
+
+  :param method: the request method
+  :param node: the node name
+  :param host: the target host
+  :param http_status: the HTTP status code
+  :param status: the status of the ``fsapiResponse``
+  :param size: the size of the response body in bytes
+  :param retries: the amount of retries done by urllib3
+  :param attempt: the attempt of a ``RetryPolicy`` this request belongs to (``0`` for
+                  the first request, ``n`` for the n-th retry)
+  :param error: the error message if the request failed
+  '''
+  __slots__ = ('method', 'node', 'host', 'http_status', 'status', 'size', 'retries',
+               'attempt', 'ttfb', 'read', 'parse', 'total', 'error')
+
+  def __init__(self, method: str, node: str, host: str) -> None:
+    self.method = method
+    self.node = node
+    self.host = host
+    self.http_status = None
+    self.status = None
+    self.size = 0
+    self.retries = 0
+    self.attempt = 0
+    self.ttfb = 0.0
+    self.read = 0.0
+    self.parse = 0.0
+    self.total = 0.0
+    self.error = None
+
+  def to_json(self) -> dict:
+    return {name: getattr(self, name) for name in self.__slots__}
+
+  def __str__(self) -> str:
+    return "RequestTrace(method='%s', node='%s', host='%s', status='%s', total=%.3fms)" % (
+      self.method, self.node, self.host, self.status or self.error, self.total * 1e3)
+
+def add_request_hook(hook) -> None:
+  '''Registers a hook that is called for every request.
+
+  :param hook: a callable accepting a ``RequestTrace``
+  '''
+  if hook not in REQUEST_HOOKS:
+    REQUEST_HOOKS.append(hook)
+
+def remove_request_hook(hook) -> None:
+  '''Removes a hook registered by ``add_request_hook()``.'''
+  if hook in REQUEST_HOOKS:
+    REQUEST_HOOKS.remove(hook)
+
+def get_request_hooks(radio = None) -> list:
+  '''Returns the global hooks together with the hooks of the given radio.'''
+  hooks = getattr(radio, 'hooks', None)
+  if hooks:
+    return REQUEST_HOOKS + hooks
+  return REQUEST_HOOKS
+
+class Histogram:
+  '''A cumulative histogram as used by Prometheus.
+
+  :param buckets: the sorted upper bounds of the buckets
+  '''
+  __slots__ = ('buckets', 'counts', 'count', 'sum')
+
+  def __init__(self, buckets: tuple = DEFAULT_BUCKETS) -> None:
+    self.buckets = buckets
+    self.counts = [0] * (len(buckets) + 1)
+    self.count = 0
+    self.sum = 0.0
+
+  def observe(self, value: float) -> None:
+    self.counts[bisect.bisect_left(self.buckets, value)] += 1
+    self.count += 1
+    self.sum += value
+
+  def cumulative(self) -> list:
+    '''Returns the ``(upper bound, count)`` pairs including the ``+Inf`` bucket.'''
+    result, total = [], 0
+    for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+      total += count
+      result.append((bound, total))
+    return result
+
+class RequestMetrics:
+  '''A hook collecting counters and latency histograms of all traced requests.
+
+  Counters are kept per node, method and status. Histograms are kept per node and
+  phase (``ttfb``, ``read``, ``parse`` and ``total``). The retries counter includes
+  the retries of urllib3 and the requests repeated by a ``RetryPolicy``.
+
+  :param by_host: whether the host should be added as a label to all metrics
+  :param buckets: the upper bounds of the histogram buckets
+  '''
+
+  PHASES = ('ttfb', 'read', 'parse', 'total')
+
+  def __init__(self, by_host: bool = False, buckets: tuple = DEFAULT_BUCKETS) -> None:
+    self.by_host = by_host
+    self.buckets = buckets
+    self.requests = {}
+    self.errors = {}
+    self.bytes = {}
+    self.retries = {}
+    self.histograms = {}
+    self.lock = threading.Lock()
+
+  def __call__(self, trace: RequestTrace) -> None:
+    labels = (trace.host, trace.node) if self.by_host else (trace.node,)
+    with self.lock:
+      key = labels + (trace.method, trace.status or 'ERROR')
+      self.requests[key] = self.requests.get(key, 0) + 1
+      if trace.error:
+        self.errors[labels] = self.errors.get(labels, 0) + 1
+      self.bytes[labels] = self.bytes.get(labels, 0) + trace.size
+      self.retries[labels] = self.retries.get(labels, 0) + trace.retries + (trace.attempt > 0)
+
+      for phase in self.PHASES:
+        histogram = self.histograms.get(labels + (phase,))
+        if histogram is None:
+          histogram = self.histograms[labels + (phase,)] = Histogram(self.buckets)
+        histogram.observe(getattr(trace, phase))
+
+  def _labels(self, values: tuple, names: tuple) -> str:
+    names = (('host',) if self.by_host else ()) + ('node',) + names
+    return ','.join('%s="%s"' % (name, str(value).replace('"', '\\"'))
+                    for name, value in zip(names, values))
+
+  def to_prometheus(self, prefix: str = 'fsapi_netremote') -> str:
+    '''Returns all metrics in the Prometheus text format.'''
+    lines = []
+    with self.lock:
+      lines.append('# TYPE %s_requests_total counter' % prefix)
+      for key, value in self.requests.items():
+        lines.append('%s_requests_total{%s} %d' % (prefix, self._labels(key, ('method', 'status')), value))
+
+      for name, values in (('errors', self.errors), ('response_bytes', self.bytes),
+                           ('retries', self.retries)):
+        lines.append('# TYPE %s_%s_total counter' % (prefix, name))
+        for key, value in values.items():
+          lines.append('%s_%s_total{%s} %d' % (prefix, name, self._labels(key, ()), value))
+
+      lines.append('# TYPE %s_request_seconds histogram' % prefix)
+      for key, histogram in self.histograms.items():
+        labels = self._labels(key, ('phase',))
+        for bound, count in histogram.cumulative():
+          le = '+Inf' if bound == float('inf') else repr(bound)
+          lines.append('%s_request_seconds_bucket{%s,le="%s"} %d' % (prefix, labels, le, count))
+        lines.append('%s_request_seconds_sum{%s} %f' % (prefix, labels, histogram.sum))
+        lines.append('%s_request_seconds_count{%s} %d' % (prefix, labels, histogram.count))
+    return '\n'.join(lines) + '\n'
+
+class LoggingHook:
+  '''A hook writing each trace to a logger.
+
+  :param logger: the logger to use (default ``fsapi.netremote``)
+  :param level: the log level of successful requests, failed requests are logged
+                as warnings
+  '''
+
+  def __init__(self, logger: logging.Logger = None, level: int = logging.DEBUG) -> None:
+    self.logger = logger or logging.getLogger('fsapi.netremote')
+    self.level = level
+
+  def __call__(self, trace: RequestTrace) -> None:
+    level = logging.WARNING if trace.error else self.level
+    if self.logger.isEnabledFor(level):
+      self.logger.log(level, '%s %s %s status=%s size=%d retries=%d attempt=%d ttfb=%.1fms '
+                      'read=%.1fms parse=%.1fms total=%.1fms%s',
+                      trace.method, trace.host, trace.node, trace.status, trace.size,
+                      trace.retries, trace.attempt, trace.ttfb * 1e3, trace.read * 1e3,
+                      trace.parse * 1e3, trace.total * 1e3,
+                      ' error=%s' % trace.error if trace.error else '')
@@ -0,0 +1,61 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from isu_server import ISUServer
+from fsapi_server import StandInServer
+
+# A firmware binary with a directory archive shipped in the repository
+FIRMWARE_PATH = os.path.join(
+  ROOT, 'bin', 'FS2026', '0500', 'ir-mmi-FS2026-0500-0082_V2.6.12c3.EX45507-1A16.isu.bin'
+)
+
+@pytest.fixture
+def isu_server():
+  '''Returns a factory starting ``ISUServer`` instances, which are stopped afterwards.'''
+  servers = []
+
+  def start(*args, **kwargs) -> ISUServer:
+    server = ISUServer(*args, **kwargs).start()
+    servers.append(server)
+    return server
+
+  yield start
+  for server in servers:
+    server.stop()
+
+@pytest.fixture
+def fsapi_server():
+  '''Returns a factory starting NetRemote ``StandInServer`` instances.'''
+  servers = []
+
+  def start(*args, **kwargs) -> StandInServer:
+    server = StandInServer(*args, **kwargs).start()
+    servers.append(server)
+    return server
+
+  yield start
+  for server in servers:
+    server.stop()
+
+@pytest.fixture(scope='session')
+def firmware() -> bytes:
+  with open(FIRMWARE_PATH, 'rb') as fp:
+    return fp.read()
+
+@pytest.fixture
+def decompiler(tmp_path) -> str:
+  '''Returns the path of a fake decompiler printing a comment with the script name.
+  Each run is logged to ``runs.log`` and scripts containing ``fail`` are rejected.'''
+  path = tmp_path / 'ecma-decompiler'
+  path.write_text('#!/bin/sh\n'
+                  'echo "$1" >> "%s"\n'
+                  'grep -q fail "$1" && exit 1\n'
+                  'echo "// $(basename "$1")"\n' % (tmp_path / 'runs.log'))
+  path.chmod(0o755)
+  return str(path)
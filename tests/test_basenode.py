@@ -0,0 +1,40 @@
+from xml.etree import ElementTree as xmltree
+
+import pytest
+
+from fsapi.netremote.basenode import *
+
+PROTOTYPE = NodePrototype(args=[
+  NodeArg('key', 1, ARG_TYPE_U32), NodeArg('name', 65, ARG_TYPE_C),
+  NodeArg('type', 1, ARG_TYPE_U8)
+])
+
+ITEM = ('<item key="3"><field name="name"><c8_array>SWR3</c8_array></field>'
+        '<field name="type"><u8>2</u8></field><field name="extra"><u8>7</u8></field></item>')
+
+def test_columns_load_typed_values():
+  columns = NodeListColumns(PROTOTYPE)
+  columns.loadxml(xmltree.fromstring(ITEM))
+  columns.append({'key': '4', 'name': 'FM'})
+
+  assert len(columns) == 2
+  assert columns[0].attr == {'key': 3, 'name': 'SWR3', 'type': 2, 'extra': '7'}
+  # Undeclared fields are stored as text, missing fields as None
+  assert columns[-1].attr == {'key': 4, 'name': 'FM', 'type': None, 'extra': None}
+  assert columns.to_json()['key'] == [3, 4]
+
+def test_columns_views():
+  columns = NodeListColumns(PROTOTYPE)
+  columns.extend([{'key': str(i), 'name': 'item %d' % i} for i in range(5)])
+  assert [item.get_attr_by_name('key') for item in columns[1:3]] == [1, 2]
+  assert [item.get_attr_by_name('name') for item in columns][-1] == 'item 4'
+  assert columns[0].get_attr_by_name('missing') is None
+  with pytest.raises(IndexError):
+    columns[5]
+  with pytest.raises(TypeError):
+    columns[0].loadxml(xmltree.fromstring(ITEM))
+
+def test_invalid_numbers_are_kept():
+  columns = NodeListColumns(PROTOTYPE)
+  columns.append({'key': 'x'})
+  assert columns[0].get_attr_by_name('key') == 'x'
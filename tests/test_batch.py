@@ -0,0 +1,85 @@
+import json
+import os
+import subprocess
+import sys
+
+from fsapi.ecmascript.batch import (
+  BATCH_DONE, BATCH_FAILED, BATCH_SKIPPED, decompile_batch, find_scripts,
+  get_output_path, get_summary
+)
+from fsapi.ecmascript.cache import DecompilationCache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def create_scripts(root, names: dict) -> None:
+  for name, data in names.items():
+    path = root / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+def runs(tmp_path) -> int:
+  path = tmp_path / 'runs.log'
+  return len(path.read_text().splitlines()) if path.exists() else 0
+
+def test_find_scripts(tmp_path):
+  create_scripts(tmp_path / 'fsh1', {'main.es.bin': b'', 'web/a.es6.bin': b'', 'web/a.js': b''})
+  os.symlink(tmp_path / 'fsh1' / 'web', tmp_path / 'fsh1' / 'link')
+  root = str(tmp_path / 'fsh1')
+  assert find_scripts(root) == [os.path.join(root, 'main.es.bin'), os.path.join(root, 'web', 'a.es6.bin')]
+  assert find_scripts(os.path.join(root, 'main.es.bin')) == [os.path.join(root, 'main.es.bin')]
+
+def test_output_path():
+  assert get_output_path('web/main.es.bin') == 'web/main.js'
+  assert get_output_path('fsh1/web/main.es.bin', 'out', 'fsh1') == os.path.join('out', 'web', 'main.js')
+  assert get_output_path('fsh1/web/main.es.bin', 'out') == os.path.join('out', 'main.js')
+
+def test_decompile_batch(tmp_path, decompiler):
+  root = tmp_path / 'fsh1'
+  create_scripts(root, {'a.es.bin': b'a', 'b.es.bin': b'b', 'web/c.es.bin': b'fail'})
+  files = find_scripts(str(root))
+  out_dir = str(tmp_path / 'out')
+
+  results = list(decompile_batch(decompiler, files, workers=2, out_dir=out_dir, root=str(root)))
+  statuses = {os.path.basename(x.path): x.status for x in results}
+  assert statuses == {'a.es.bin': BATCH_DONE, 'b.es.bin': BATCH_DONE, 'c.es.bin': BATCH_FAILED}
+  with open(os.path.join(out_dir, 'a.js')) as fp:
+    assert fp.read() == '// a.es.bin\n'
+  assert not os.path.exists(os.path.join(out_dir, 'web', 'c.js'))
+
+  summary = get_summary(results, 1.23456)
+  assert (summary['total'], summary['done'], summary['failed'], summary['elapsed']) == (3, 2, 1, 1.235)
+  assert summary['failures'][0]['path'] == files[2]
+
+  # outputs that are up to date are skipped, the failed script is run again
+  results = list(decompile_batch(decompiler, files, out_dir=out_dir, root=str(root)))
+  assert sorted(x.status for x in results) == [BATCH_FAILED, BATCH_SKIPPED, BATCH_SKIPPED]
+  assert runs(tmp_path) == 4
+  list(decompile_batch(decompiler, files, force=True, out_dir=out_dir, root=str(root)))
+  assert runs(tmp_path) == 7
+
+def test_decompile_batch_with_cache(tmp_path, decompiler):
+  # the same script in two firmware images is only decompiled once
+  create_scripts(tmp_path, {'one/main.es.bin': b'main', 'two/main.es.bin': b'main'})
+  cache = DecompilationCache(str(tmp_path / 'cache'))
+  results = []
+  for name in ('one', 'two'):
+    results.extend(decompile_batch(decompiler, find_scripts(str(tmp_path / name)), cache=cache))
+
+  assert [x.cached for x in results] == [False, True]
+  assert get_summary(results)['cached'] == 1
+  assert runs(tmp_path) == 1
+  with open(results[1].output) as fp:
+    assert fp.read() == '// main.es.bin\n'
+
+def test_command_line(tmp_path, decompiler):
+  create_scripts(tmp_path / 'fsh1', {'a.es.bin': b'a', 'b.es.bin': b'fail'})
+  report = tmp_path / 'report.json'
+  result = subprocess.run([
+    sys.executable, '-m', 'fsapi.ecmascript', '-d', '-r', str(tmp_path / 'fsh1'),
+    '--use-decompiler', decompiler, '-w', '2', '--no-cache', '--report', str(report)
+  ], capture_output=True, text=True, cwd=ROOT)
+
+  assert result.returncode == 0, result.stderr
+  assert 'failed 1 of 2 files' in result.stdout
+  assert json.loads(report.read_text())['done'] == 1
+  assert (tmp_path / 'fsh1' / 'a.js').read_text() == '// a.es.bin\n'
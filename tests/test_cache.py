@@ -0,0 +1,42 @@
+import os
+
+from fsapi.ecmascript.cache import DecompilationCache, get_decompiler_identity, get_script_hash
+from fsapi.ecmascript.esbin import Decompiler
+
+def test_get_and_put(tmp_path):
+  cache = DecompilationCache(str(tmp_path / 'cache'))
+  script_hash, identity = get_script_hash(b'main'), 'a' * 64
+  assert cache.get(script_hash, identity) is None
+
+  cache.put(script_hash, identity, 'var x = 1;\n')
+  assert cache.get(script_hash, identity) == 'var x = 1;\n'
+  assert cache.get(script_hash, 'b' * 64) is None
+  assert (cache.hits, cache.misses) == (1, 2)
+
+  path = cache.get_path(script_hash, identity)
+  assert path == os.path.join(str(tmp_path / 'cache'), 'a' * 16, script_hash[:2], script_hash + '.js')
+  assert os.listdir(os.path.dirname(path)) == [script_hash + '.js']
+
+def test_decompiler_identity(tmp_path):
+  path = tmp_path / 'decompiler'
+  path.write_bytes(b'one')
+  identity = get_decompiler_identity(str(path))
+  assert identity == get_script_hash(b'one')
+
+  # a rebuilt decompiler gets a new identity
+  path.write_bytes(b'other')
+  os.utime(path, ns=(0, 1))
+  assert get_decompiler_identity(str(path)) == get_script_hash(b'other')
+  assert get_decompiler_identity(str(tmp_path / 'missing')) == get_script_hash(str(tmp_path / 'missing').encode())
+
+def test_decompiler_uses_cache(tmp_path, decompiler):
+  script = tmp_path / 'main.es.bin'
+  script.write_bytes(b'main')
+  cache = DecompilationCache(str(tmp_path / 'cache'))
+
+  with Decompiler(decompiler, str(script), cache) as first:
+    assert (first.code, first.cached) == ('// main.es.bin\n', False)
+  with Decompiler(decompiler, str(script), cache) as second:
+    assert (second.code, second.cached) == ('// main.es.bin\n', True)
+  assert (cache.hits, cache.misses) == (1, 1)
+  assert len((tmp_path / 'runs.log').read_text().splitlines()) == 1
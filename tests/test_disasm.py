@@ -0,0 +1,55 @@
+import struct
+
+import pytest
+
+from fsapi.ecmascript.disasm import disassemble, get_listing, iter_instructions, parse_header
+from fsapi.ecmascript.opcode import ECMASCRIPT_MAGIC_BYTES
+
+# name #0; pushobj; call 1; tableswitch (default +17, cases 1..2); goto -12;
+# lookupswitch (default +12, #3 -> +1); stop
+CODE = bytes([
+  59, 0, 0, 57, 58, 0, 1,
+  70, 0, 17, 0, 1, 0, 2, 0, 4, 0, 6,
+  6, 0xff, 0xf4,
+  71, 0, 12, 0, 1, 0, 3, 0, 1,
+  195,
+])
+
+def create_script(code: bytes, natoms: int = 4) -> bytes:
+  return struct.pack('<9I', ECMASCRIPT_MAGIC_BYTES, len(code), 0, 170, natoms, 0, 0, 0, 0) + code
+
+def test_disassemble(tmp_path):
+  path = tmp_path / 'main.es.bin'
+  path.write_bytes(create_script(CODE) + b'atoms')
+  header, instructions = disassemble(str(path))
+
+  assert (header.length, header.natoms) == (len(CODE), 4)
+  assert [x.name for x in instructions] == ['name', 'pushobj', 'call', 'tableswitch', 'goto', 'lookupswitch', 'stop']
+  assert [x.offset for x in instructions] == [0, 3, 4, 7, 18, 21, 30]
+  assert instructions[3].operands == (17, 1, 2, (4, 6))
+  assert instructions[4].operands == (-12,)
+  assert instructions[5].operands == (12, ((3, 1),))
+  assert sum(x.length for x in instructions) == len(CODE)
+
+def test_listing():
+  header, instructions = disassemble(create_script(CODE))
+  lines = get_listing(instructions, header).splitlines()
+  assert lines[0].startswith('; magic=0xdead0007, length=%d' % len(CODE))
+  assert lines[1:4] == ['00000:  name         #0', '00003:  pushobj', '00004:  call         1']
+  assert lines[4] == '00007:  tableswitch  default 17 (-> 00024), low 1, high 2 {1: 4 (-> 00011), 2: 6 (-> 00013)}'
+  assert lines[5] == '00018:  goto         -12 (-> 00006)'
+  assert lines[6] == '00021:  lookupswitch default 12 (-> 00033) {#3: 1 (-> 00022)}'
+
+def test_invalid_scripts():
+  with pytest.raises(ValueError):
+    parse_header(b'\x00' * 8)
+  with pytest.raises(ValueError):
+    parse_header(b'\x00' * 36)
+  with pytest.raises(ValueError):
+    disassemble(create_script(CODE)[:-1])
+  with pytest.raises(ValueError):
+    list(iter_instructions(bytes([216])))
+  with pytest.raises(ValueError):
+    list(iter_instructions(bytes([59, 0])))
+  with pytest.raises(ValueError):
+    list(iter_instructions(bytes([70, 0, 17, 0])))
@@ -0,0 +1,50 @@
+import pytest
+
+import fsapi.all as fsapi
+
+nodes = fsapi.nodes
+
+def test_integer_bounds():
+  encoder = fsapi.get_set_encoder(nodes.BaseSysAudioVolume)
+  assert encoder.encode({'value': 12}) == '&value=12'
+  assert encoder.encode({'value': '255'}) == '&value=255'
+  for value in (256, -1, 1.5, 'loud'):
+    with pytest.raises(fsapi.NodeValueError):
+      encoder.encode({'value': value})
+
+def test_enum_labels():
+  encoder = fsapi.get_set_encoder(nodes.BaseSysPower)
+  assert encoder.encode({'value': 'ON'}) == '&value=1'
+  assert encoder.encode({'value': 0}) == '&value=0'
+  with pytest.raises(fsapi.NodeValueError):
+    encoder.encode({'value': 2})
+  with pytest.raises(fsapi.NodeValueError):
+    encoder.encode({'value': 'STANDBY'})
+
+def test_text_is_quoted_and_limited():
+  encoder = fsapi.get_set_encoder(nodes.BaseSysInfoFriendlyName)
+  assert encoder.encode({'value': 'Küche & Bad', 'sid': 'a b'}) == '&value=K%C3%BCche%20%26%20Bad&sid=a%20b'
+  with pytest.raises(fsapi.NodeValueError):
+    encoder.encode({'value': 'x' * (nodes.BaseSysInfoFriendlyName.max_size + 1)})
+
+def test_readonly_node():
+  with pytest.raises(fsapi.NodeValueError):
+    fsapi.get_set_encoder(nodes.BaseSysInfoVersion).encode({'value': 'x'})
+
+def test_encoder_is_cached():
+  assert fsapi.get_set_encoder(nodes.BaseSysPower) is fsapi.get_set_encoder(nodes.BaseSysPower)
+
+def test_encode_parameters():
+  assert fsapi.encode_parameters(None) == ''
+  assert fsapi.encode_parameters({'pin': '1234', 'maxItems': 10}) == '&pin=1234&maxItems=10'
+  assert fsapi.encode_parameters({'q': 'a/b c'}) == '&q=a%2Fb%20c'
+
+def test_invalid_set_is_not_sent(fsapi_server):
+  server = fsapi_server()
+  radio = fsapi.RadioHttp(server.host)
+  with pytest.raises(fsapi.NodeValueError):
+    fsapi.netremote_request(fsapi.SET, nodes.BaseSysAudioVolume, radio, parameters={'value': 300})
+  assert server.requests == 0
+
+  fsapi.netremote_request(fsapi.SET, nodes.BaseSysInfoFriendlyName, radio, parameters={'value': 'A & B'})
+  assert server.values[nodes.BaseSysInfoFriendlyName.get_name()] == 'A & B'
@@ -0,0 +1,35 @@
+import os
+
+import pytest
+
+from fsapi.fileutil import atomic_write
+
+def test_atomic_write(tmp_path):
+  path = str(tmp_path / 'sub' / 'values.json')
+  with atomic_write(path) as fp:
+    fp.write('first')
+  with atomic_write(path, 'wb') as fp:
+    fp.write(b'second')
+  with open(path, 'rb') as fp:
+    assert fp.read() == b'second'
+  assert os.listdir(str(tmp_path / 'sub')) == ['values.json']
+
+def test_atomic_write_keeps_target_on_error(tmp_path):
+  path = str(tmp_path / 'values.json')
+  with atomic_write(path) as fp:
+    fp.write('stored')
+  with pytest.raises(RuntimeError):
+    with atomic_write(path) as fp:
+      fp.write('partial')
+      raise RuntimeError()
+  with open(path) as fp:
+    assert fp.read() == 'stored'
+  assert os.listdir(str(tmp_path)) == ['values.json']
+
+def test_capability_cache_save(tmp_path):
+  import fsapi.all as fsapi
+  path = str(tmp_path / 'capabilities.json')
+  cache = fsapi.CapabilityCache(path)
+  cache.record('2.12.25c', 'netRemote.sys.alarm.config', 'FS_NODE_DOES_NOT_EXIST')
+  cache.save()
+  assert fsapi.CapabilityCache(path).get_unsupported('2.12.25c') == {'netRemote.sys.alarm.config'}
@@ -0,0 +1,58 @@
+import socket
+
+import pytest
+
+import fsapi.all as fsapi
+
+PLAN = [
+  fsapi.FleetTask(fsapi.GET, 'netRemote.sys.info.version'),
+  fsapi.FleetTask(fsapi.SET, 'netRemote.sys.audio.volume', {'value': 5}),
+  fsapi.FleetTask(fsapi.LIST_GET_NEXT, 'netRemote.nav.presets'),
+]
+
+def _closed_port() -> int:
+  with socket.socket() as sock:
+    sock.bind(('127.0.0.1', 0))
+    return sock.getsockname()[1]
+
+def test_run(fsapi_server):
+  servers = [fsapi_server(items=15), fsapi_server(items=15)]
+  targets = [fsapi.RadioHttp(server.host) for server in servers]
+  executor = fsapi.FleetExecutor(max_workers=4, max_items=10, session=True)
+  results = {(r.host, r.node): r for r in executor.run(targets, PLAN)}
+
+  assert len(results) == 6
+  for server in servers:
+    assert results[(server.host, 'netRemote.sys.info.version')].value.startswith('ir-mmi')
+    assert results[(server.host, 'netRemote.sys.audio.volume')].status == 'FS_OK'
+    assert len(results[(server.host, 'netRemote.nav.presets')].value) == 15
+    assert server.values['netRemote.sys.audio.volume'] == '5'
+
+def test_unreachable_host():
+  radio = fsapi.RadioHttp('127.0.0.1:%d' % _closed_port())
+  results = list(fsapi.FleetExecutor(timeout=1.0).run([radio], PLAN))
+  assert len(results) == 3 and all(result.error for result in results)
+  assert [r.error for r in results][1:] == ['host unreachable'] * 2
+
+def test_capabilities(fsapi_server):
+  server = fsapi_server(unsupported={'netRemote.nav.presets'})
+  cache = fsapi.CapabilityCache()
+  executor = fsapi.FleetExecutor(capabilities=cache)
+  radio = fsapi.RadioHttp(server.host)
+
+  list(executor.run([radio], PLAN))
+  results = {r.node: r for r in executor.run([radio], PLAN)}
+  assert results['netRemote.nav.presets'].cached
+  assert not results['netRemote.sys.info.version'].cached
+
+def test_invalid_plan():
+  with pytest.raises(ValueError):
+    list(fsapi.FleetExecutor().run([fsapi.RadioHttp('127.0.0.1')],
+                                   [fsapi.FleetTask(fsapi.GET, 'netRemote.unknown')]))
+
+def test_targets(tmp_path):
+  assert [radio.host for radio in fsapi.expand_targets('10.0.0.0/30')] == ['10.0.0.1', '10.0.0.2']
+  path = tmp_path / 'targets.txt'
+  path.write_text('# devices\n10.0.0.1 4321\n10.0.0.0/30\n')
+  targets = fsapi.load_targets(str(path))
+  assert [(radio.host, radio.pin) for radio in targets] == [('10.0.0.1', '4321'), ('10.0.0.2', '1234')]
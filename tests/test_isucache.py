@@ -0,0 +1,51 @@
+import urllib3
+
+import fsapi.all as fsapi
+
+CUSTOMISATION, VERSION = 'ir-mmi-FS2026-0500-0549', '2.12.25c.EX72088-1A12'
+UPDATE = {'customisation': CUSTOMISATION, 'version': '2.12.26.EX72088-1A13', 'size': '64'}
+
+def _request(server, headers: dict = None) -> urllib3.HTTPResponse:
+  url = '%s/FindUpdate.aspx?customisation=%s&version=%s' % (server.base_url, CUSTOMISATION, VERSION)
+  return urllib3.request('GET', url, headers=headers)
+
+def test_fresh_response(isu_server):
+  server = isu_server(updates={(CUSTOMISATION, VERSION): [UPDATE]}, max_age=60)
+  cache = fsapi.UpdateCache()
+  stored = cache.update(CUSTOMISATION, VERSION, _request(server))
+  assert stored.status == 200 and b'2.12.26' in stored.data
+  assert cache.get(CUSTOMISATION, VERSION) == stored
+
+def test_revalidation(isu_server):
+  server = isu_server(updates={(CUSTOMISATION, VERSION): [UPDATE]}, max_age=0)
+  cache = fsapi.UpdateCache()
+  stored = cache.update(CUSTOMISATION, VERSION, _request(server))
+  assert cache.get(CUSTOMISATION, VERSION) is None
+
+  validators = cache.get_validators(CUSTOMISATION, VERSION)
+  assert validators['If-None-Match'] == stored.headers['etag']
+  result = cache.update(CUSTOMISATION, VERSION, _request(server, validators))
+  assert server.not_modified == 1
+  assert result.status == 200 and result.data == stored.data
+
+def test_save_and_load(isu_server, tmp_path):
+  server = isu_server(updates={(CUSTOMISATION, VERSION): [UPDATE]}, max_age=60)
+  path = str(tmp_path / 'updates.json')
+  cache = fsapi.UpdateCache(path)
+  stored = cache.update(CUSTOMISATION, VERSION, _request(server))
+  cache.save()
+
+  loaded = fsapi.UpdateCache(path).get(CUSTOMISATION, VERSION)
+  assert loaded.data == stored.data
+  # Header names stay case-insensitive after loading
+  assert loaded.headers['ETAG'] == stored.headers['ETag']
+
+def test_binary_body(tmp_path):
+  # Bodies that are not valid UTF-8 are restored byte by byte
+  path = str(tmp_path / 'updates.json')
+  data = b'<?xml version="1.0" encoding="ISO-8859-1"?><updates summary="\xe4\xff"/>'
+  response = urllib3.HTTPResponse(data, {'Cache-Control': 'max-age=60'}, status=200)
+  cache = fsapi.UpdateCache(path)
+  cache.update(CUSTOMISATION, VERSION, response)
+  cache.save()
+  assert fsapi.UpdateCache(path).get(CUSTOMISATION, VERSION).data == data
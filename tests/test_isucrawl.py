@@ -0,0 +1,39 @@
+import pytest
+
+import fsapi.all as fsapi
+
+CUSTOMISATION = 'ir-mmi-FS2026-0500-0549'
+
+def _path(version: str) -> str:
+  return '/updates/%s.%s.isu.bin' % (CUSTOMISATION, version)
+
+def test_expand_template():
+  assert list(fsapi.expand_template('1A{1..3}')) == ['1A1', '1A2', '1A3']
+  assert list(fsapi.expand_template('{a,b}{08..10}')) == ['a08', 'a09', 'a10', 'b08', 'b09', 'b10']
+
+def test_version_template():
+  assert fsapi.version_template('2.12.25c.EX72088-1A12', 10) == '2.12.25c.EX72088-1A{1..10}'
+  with pytest.raises(ValueError):
+    fsapi.version_template('2.12.25c-1A12')
+
+def test_crawl(isu_server):
+  versions = ['2.12.25c.EX72088-1A3', '2.12.25c.EX72088-1A17', '2.12.25.EX72088-1A5']
+  server = isu_server({_path(version): b'\x00' * 64 for version in versions})
+  crawler = fsapi.ISUCrawler(workers=4, rate=0, file_url=server.base_url,
+                             edge_url=server.base_url)
+
+  known = ['%s_V2.12.25.EX72088-1A5' % CUSTOMISATION]
+  hits = crawler.crawl(CUSTOMISATION, '2.12.25{,c}.EX72088-1A{1..20}', known)
+  assert [name for name, _ in hits] == [
+    '%s_V%s' % (CUSTOMISATION, version) for version in sorted(versions[:2])
+  ]
+  assert all(url.startswith(server.base_url) for _, url in hits)
+  assert crawler.checked == 39
+  # Requests are sent over the prober's connection pool
+  assert server.connections <= 4
+
+def test_crawl_skips_malformed_versions(isu_server):
+  server = isu_server({})
+  crawler = fsapi.ISUCrawler(workers=2, rate=0, file_url=server.base_url)
+  assert crawler.crawl(CUSTOMISATION, '2.12.{25,x-y}.EX72088-1A1') == []
+  assert crawler.checked == 1 and crawler.skipped == 1
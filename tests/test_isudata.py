@@ -0,0 +1,76 @@
+import xml.etree.ElementTree as xmltree
+
+import pytest
+
+from isu_server import create_update_xml
+from fsapi.isudata import ISUDevice, isu_find_updates, isu_parse_updates
+
+CUSTOMISATION = 'ir-mmi-FS2026-0500-0015'
+VERSION = '2.5.15.EX44478-1B9'
+LATEST = '2.6.12c3.EX45507-1A16'
+
+UPDATE = {
+  'customisation': CUSTOMISATION, 'version': LATEST, 'mandatory': 'False',
+  'download': 'http://update.wifiradiofrontier.com/Update.aspx?f=/updates/%s.isu.bin' % LATEST,
+  'product': 'ir', 'size': 2048, 'md5': '0' * 32, 'summary': 'Fixes', 'vendor': 'Frontier Silicon'
+}
+
+def test_find_updates_shares_queries(isu_server):
+  server = isu_server(updates={
+    (CUSTOMISATION, VERSION): [UPDATE],
+    (CUSTOMISATION, LATEST): [],
+  })
+  devices = [
+    ISUDevice('002261000001', CUSTOMISATION, VERSION),
+    ('002261000002', CUSTOMISATION, VERSION),
+    ISUDevice('002261000003', CUSTOMISATION, LATEST),
+    ISUDevice('002261000004', 'ir-mmi-FS2026-0500-0999', VERSION),
+    ISUDevice('invalid', CUSTOMISATION, VERSION),
+  ]
+  results = isu_find_updates(devices, workers=4, base_url=server.base_url)
+
+  assert len(results) == len(devices)
+  assert server.find_requests == 3
+
+  first, second = results[devices[0]], results[ISUDevice(*devices[1])]
+  assert first is second and first['update_present']
+  software = first['updates'][0]
+  assert (software.version, software.size, software.mandatory) == (LATEST, 2048, False)
+
+  # an empty answer, an unknown customisation (404) and a malformed MAC-Address
+  for device in devices[2:]:
+    result = results[device]
+    assert not result['updates']
+  assert not results[devices[3]]['update_present']
+  assert not results[devices[4]]['update_present']
+
+def test_find_updates_connection_errors():
+  devices = [ISUDevice('002261000001', CUSTOMISATION, VERSION)]
+  results = isu_find_updates(devices, base_url='http://127.0.0.1:9')
+  assert results[devices[0]] == {'update_present': False, 'headers': None, 'updates': []}
+
+def chunked(data: bytes, size: int):
+  return [data[i:i + size] for i in range(0, len(data), size)]
+
+def test_parse_updates_in_chunks():
+  second = dict(UPDATE, version='2.6.13.EX45507-1A17', mandatory='True')
+  data = b'\r\n' + create_update_xml([UPDATE, second]).encode('utf-8') + b'\r\ntrailing'
+
+  for size in (1, 3, 7, len(data)):
+    updates = list(isu_parse_updates(chunked(data, size)))
+    assert [(x.version, x.mandatory) for x in updates] == [(LATEST, False), ('2.6.13.EX45507-1A17', True)]
+    assert updates[0].md5hash == UPDATE['md5'] and updates[0].download_url == UPDATE['download']
+
+def test_parse_updates_is_lazy():
+  data = create_update_xml([UPDATE]).encode('utf-8')
+  # the element is returned before the rest of the (broken) document arrives
+  updates = isu_parse_updates([data[:data.index(b'</software>') + 11], b'<software'])
+  assert next(updates).version == LATEST
+  with pytest.raises(xmltree.ParseError):
+    next(updates)
+
+def test_parse_updates_errors():
+  with pytest.raises(ValueError):
+    list(isu_parse_updates([b'not found', b'']))
+  with pytest.raises(xmltree.ParseError):
+    list(isu_parse_updates([b'<?xml version="1.0"?><updates><software>']))
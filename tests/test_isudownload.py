@@ -0,0 +1,90 @@
+import hashlib
+import os
+
+import fsapi.all as fsapi
+
+from isu_server import create_files
+
+def _setup(isu_server, size: int = 0x18000, **kwargs) -> tuple:
+  files = create_files(1, size)
+  server = isu_server(files, **kwargs)
+  path, data = next(iter(files.items()))
+  return server, server.base_url + path, data
+
+def _read(path) -> bytes:
+  with open(str(path), 'rb') as fp:
+    return fp.read()
+
+def test_download(isu_server, tmp_path):
+  server, url, data = _setup(isu_server)
+  software = fsapi.ISUSoftwareElement(md5hash=hashlib.md5(data).hexdigest(), size=len(data))
+  downloader = fsapi.ISUDownloader(2, segments=1)
+  results = list(downloader.download([fsapi.DownloadTask(url, str(tmp_path / 'a.bin'), software)]))
+
+  assert [(r.error, r.status, r.size, r.expected) for r in results] == [(None, 200, len(data), len(data))]
+  assert _read(tmp_path / 'a.bin') == data
+  assert downloader.progress.files_done == 1 and downloader.progress.bytes_done == len(data)
+
+def test_resume(isu_server, tmp_path):
+  server, url, data = _setup(isu_server, drop_after=0x8000)
+  task = fsapi.DownloadTask(url, str(tmp_path / 'a.bin'))
+  downloader = fsapi.ISUDownloader(1, chunk_size=0x1000, segments=1)
+
+  result = downloader.fetch(task)
+  assert result.error and result.size == 0x8000 and result.expected == len(data)
+  # The second attempt continues the .part file
+  result = downloader.fetch(task)
+  assert result.error and result.size == 0x10000 and result.status == 206
+  assert os.path.getsize(task.path + '.part') == 0x10000
+
+  server.drop_after = 0
+  result = downloader.fetch(task)
+  assert result.error is None and result.size == len(data)
+  assert _read(task.path) == data
+
+def test_md5_mismatch(isu_server, tmp_path):
+  server, url, data = _setup(isu_server)
+  software = fsapi.ISUSoftwareElement(md5hash='0' * 32, size=len(data))
+  task = fsapi.DownloadTask(url, str(tmp_path / 'a.bin'), software)
+  result = fsapi.ISUDownloader(1, segments=1).fetch(task)
+
+  assert 'MD5 mismatch' in result.error
+  assert result.size == len(data) and result.expected == len(data)
+  # Invalid data is not kept for resuming
+  assert not os.path.exists(task.path) and not os.path.exists(task.path + '.part')
+
+def test_segmented_download(isu_server, tmp_path):
+  server, url, data = _setup(isu_server, size=0x40001)
+  software = fsapi.ISUSoftwareElement(md5hash=hashlib.md5(data).hexdigest(), size=len(data))
+  task = fsapi.DownloadTask(url, str(tmp_path / 'a.bin'), software)
+  downloader = fsapi.ISUDownloader(1, segments=4, segment_threshold=0x10000)
+  result = downloader.fetch(task)
+
+  assert result.error is None and result.status == 206 and result.size == len(data)
+  assert _read(task.path) == data
+  # One HEAD request and one request per segment
+  assert server.requests == 5
+  assert sorted(os.listdir(str(tmp_path))) == ['a.bin']
+
+def test_segmented_download_failure(isu_server, tmp_path):
+  server, url, data = _setup(isu_server, size=0x40000, drop_after=0x1000)
+  software = fsapi.ISUSoftwareElement(size=len(data))
+  task = fsapi.DownloadTask(url, str(tmp_path / 'a.bin'), software)
+  downloader = fsapi.ISUDownloader(1, chunk_size=0x400, segments=4, segment_threshold=0x10000)
+  result = downloader.fetch(task)
+  assert result.error and result.size == 4 * 0x1000 and result.expected == len(data)
+
+def test_not_found(isu_server, tmp_path):
+  server, url, data = _setup(isu_server)
+  result = fsapi.ISUDownloader(1).fetch(fsapi.DownloadTask(url + '.x', str(tmp_path / 'a.bin')))
+  assert result.status == 404 and result.size == 0 and result.error
+
+def test_store(isu_server, tmp_path):
+  server, url, data = _setup(isu_server)
+  store = fsapi.FirmwareStore(str(tmp_path / 'store'))
+  downloader = fsapi.ISUDownloader(1, segments=1, store=store)
+  assert not downloader.fetch(fsapi.DownloadTask(url, str(tmp_path / 'a.bin'))).cached
+
+  result = downloader.fetch(fsapi.DownloadTask(url, str(tmp_path / 'b.bin')))
+  assert result.cached and result.size == len(data)
+  assert server.requests == 1
@@ -0,0 +1,59 @@
+import json
+
+from fsapi.isuprobe import ISUProber, isu_url_candidates, split_firmware_name
+
+FS2026 = 'ir-mmi-FS2026-0500-0549_V2.12.25c.EX72088-1A12'
+FS2340 = 'ir-cui-FS2340-0000-0101_V4.3.5.r-3'
+FS5332 = 'ns-mmi-FS5332-0000-0007_1.0.57-37'
+
+def test_split_firmware_name():
+  assert split_firmware_name(FS2026) == ('ir-mmi-FS2026-0500-0549', '2.12.25c.EX72088-1A12')
+  assert split_firmware_name('ir-mmi-FS2026-0500-0549-V2.12') == ('ir-mmi-FS2026-0500-0549', '2.12')
+  assert split_firmware_name(FS5332) == ('ns-mmi-FS5332-0000-0007', '1.0.57-37')
+  assert split_firmware_name('firmware') is None
+
+def test_url_candidates():
+  candidates = isu_url_candidates(FS2026, 'http://file', 'http://edge')
+  assert candidates[0] == 'http://file/Update.aspx?f=/updates/ir-mmi-FS2026-0500-0549.2.12.25c.EX72088-1A12.isu.bin'
+  assert len(candidates) == len(set(candidates))
+  assert 'http://edge/srupdates/srupdates/ir-mmi-FS2026-0500-0549/%s.isu.bin' % FS2026 in candidates
+  assert isu_url_candidates('firmware') == []
+
+  candidates = isu_url_candidates(FS5332, 'http://file', 'http://edge')
+  assert candidates[0] == 'http://edge/nsupdates/nsupdates/ns-mmi-FS5332-0000-0007/%s.ota.bin' % FS5332
+
+def test_probe(isu_server, tmp_path):
+  # the FS2340 file is only located on the file server, not at the edge URL of
+  # isu_new_url()
+  server = isu_server({
+    '/updates/ir-mmi-FS2026-0500-0549.2.12.25c.EX72088-1A12.isu.bin': b'\x00' * 16,
+    '/updates/%s.isu.bin' % FS2340: b'\x00' * 16,
+  })
+  cache_path = str(tmp_path / 'urls.json')
+  prober = ISUProber(workers=4, cache_path=cache_path, file_url=server.base_url,
+                     edge_url=server.base_url + '/edge')
+  urls = prober.probe([FS2026, FS2340, FS2340 + ' ', 'ir-mmi-FS2026-0500-0000_V1.0.EX00000-1A1', ''])
+
+  assert urls == {
+    FS2026: prober.get_url(FS2026),
+    FS2340: server.base_url + '/Update.aspx?f=/updates/%s.isu.bin' % FS2340,
+    'ir-mmi-FS2026-0500-0000_V1.0.EX00000-1A1': None,
+  }
+  assert prober.modified
+  prober.save()
+  with open(cache_path) as fp:
+    assert json.load(fp)['urls'] == {FS2026: urls[FS2026], FS2340: urls[FS2340]}
+
+  # confirmed URLs are answered from the cache
+  requests = server.requests
+  prober = ISUProber(cache_path=cache_path, file_url=server.base_url)
+  assert prober.probe([FS2026, FS2340]) == {FS2026: urls[FS2026], FS2340: urls[FS2340]}
+  assert server.requests == requests and not prober.modified
+
+def test_check(isu_server):
+  server = isu_server({'/file.bin': b'data', '/empty.bin': b''})
+  prober = ISUProber(workers=1)
+  assert prober.check(server.base_url + '/file.bin')
+  assert not prober.check(server.base_url + '/empty.bin')
+  assert not prober.check(server.base_url + '/missing.bin')
+  assert not prober.check('http://127.0.0.1:9/file.bin')
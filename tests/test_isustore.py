@@ -0,0 +1,52 @@
+import os
+import stat
+
+import fsapi.all as fsapi
+
+NAME = 'ir-mmi-FS2026-0500-0549_V2.12.25c.EX72088-1A12'
+
+def _write(path, data: bytes = b'firmware') -> str:
+  with open(str(path), 'wb') as fp:
+    fp.write(data)
+  return str(path)
+
+def test_add_and_find(tmp_path):
+  store = fsapi.FirmwareStore(str(tmp_path / 'store'))
+  entry = store.add(_write(tmp_path / 'a.bin'), NAME, 'http://host/a.bin')
+  assert store.find('ir-mmi-FS2026-0500-0549', '2.12.25c.EX72088-1A12') == entry
+  assert store.find_md5(entry.md5.upper()).sha256 == entry.sha256
+  assert store.find_url('http://host/a.bin').sha256 == entry.sha256
+  # Stored objects are read-only
+  assert not os.stat(store.get_path(entry)).st_mode & stat.S_IWUSR
+
+  store.save()
+  assert fsapi.FirmwareStore(str(tmp_path / 'store')).find_name(NAME) == entry
+
+def test_add_move_links_to_object(tmp_path):
+  store = fsapi.FirmwareStore(str(tmp_path / 'store'))
+  first = _write(tmp_path / 'a.bin')
+  entry = store.add(first, NAME, move=True)
+  assert os.path.samefile(first, store.get_path(entry))
+
+  # The second file has the same content and must not stay as a copy
+  second = _write(tmp_path / 'b.bin')
+  store.add(second, move=True)
+  assert os.path.samefile(second, store.get_path(entry))
+  assert os.stat(store.get_path(entry)).st_nlink == 3
+
+def test_export(tmp_path):
+  store = fsapi.FirmwareStore(str(tmp_path / 'store'))
+  entry = store.add(_write(tmp_path / 'a.bin'))
+
+  linked = str(tmp_path / 'linked.bin')
+  store.export(entry, linked)
+  store.export(entry, linked)
+  assert os.path.samefile(linked, store.get_path(entry))
+
+  copied = str(tmp_path / 'copied.bin')
+  store.export(entry, copied, copy=True)
+  assert not os.path.samefile(copied, store.get_path(entry))
+  with open(copied, 'ab') as fp:
+    fp.write(b'patched')
+  with open(store.get_path(entry), 'rb') as fp:
+    assert fp.read() == b'firmware'
@@ -0,0 +1,81 @@
+import struct
+
+import fsapi.all as fsapi
+from fsapi.isu import *
+
+def _feed(stream: ISUStream, data: bytes, chunk_size: int = 0x8000) -> None:
+  for i in range(0, len(data), chunk_size):
+    if not stream.feed(data[i:i + chunk_size]):
+      break
+
+def _entries(tree) -> list:
+  result = []
+  for element in tree:
+    result.append(sorted(element.attr.items(), key=lambda item: item[0]))
+    result.extend(_entries(element))
+  return result
+
+def test_stream_matches_inspector(firmware):
+  expected = MMIInspector().get_fs_tree(ISUFile(firmware))
+  stages = []
+  stream = ISUStream(callback=lambda s, stage: stages.append((stage, s.size)))
+  _feed(stream, firmware)
+  stream.close()
+
+  assert [stage for stage, _ in stages] == [STREAM_HEADER, STREAM_PARTITIONS, STREAM_ARCHIVE]
+  # Metadata is available before the download completes
+  assert all(size < len(firmware) for _, size in stages)
+  assert str(stream.header.customisation).startswith('ir-mmi-FS2026-0500-0082')
+  assert [p.partition for p in stream.partitions] == [1, 2, 15]
+  assert stream.archive.attr == expected.attr
+  assert _entries(stream.archive) == _entries(expected)
+
+def test_stream_memory_is_bounded(firmware):
+  stream = ISUStream()
+  peak = 0
+  for i in range(0, len(firmware), 0x1000):
+    stream.feed(firmware[i:i + 0x1000])
+    peak = max(peak, len(stream._file) + len(stream._window))
+  # At most the start of the file or an archive index is buffered
+  assert peak <= max(stream.max_head, stream.archive.get_attribute('index_size') + 0x1000)
+  stream.close()
+  assert not stream._file and not stream._window
+
+def test_stream_skips_bogus_index(firmware):
+  # An archive candidate with a huge index must not be buffered until the end
+  bogus = b'FSH1' + struct.pack('<IHI', 0xFFFFFFF0, 0, 0x7FFFFFF0) + b'\x00' * 0x10000
+  data = firmware[:0x20000] + bogus + firmware[0x20000:]
+  stream = ISUStream()
+  _feed(stream, data)
+  assert stream.archive is not None
+  assert stream.archive.get_attribute('offset') == \
+    MMIInspector().get_fs_tree(ISUFile(data)).get_attribute('offset')
+
+def test_stream_abort(firmware):
+  stream = ISUStream(callback=lambda s, stage: stage != STREAM_HEADER)
+  assert not stream.feed(firmware[:0x1000])
+  assert stream.aborted and stream.stages == [STREAM_HEADER]
+  assert not stream.feed(firmware[0x1000:0x2000])
+
+def test_download_inspection(isu_server, firmware, tmp_path):
+  server = isu_server({'/a.isu.bin': firmware})
+  url = server.base_url + '/a.isu.bin'
+
+  stages = []
+  def inspect(task, stream, stage):
+    stages.append(stage)
+    return True
+
+  result = fsapi.ISUDownloader(1, inspect=inspect).fetch(
+    fsapi.DownloadTask(url, str(tmp_path / 'a.bin')))
+  assert result.error is None
+  assert stages == [STREAM_HEADER, STREAM_PARTITIONS, STREAM_ARCHIVE]
+  assert result.header.size == MMI_HEADER_LENGTH
+  assert result.archive is not None
+
+  reject = lambda task, stream, stage: stage != STREAM_HEADER
+  result = fsapi.ISUDownloader(1, inspect=reject).fetch(
+    fsapi.DownloadTask(url, str(tmp_path / 'b.bin')))
+  assert 'Aborted' in result.error
+  assert result.header is not None and result.archive is None
+  assert not (tmp_path / 'b.bin').exists() and not (tmp_path / 'b.bin.part').exists()
@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+import fsapi.__main__ as main
+import fsapi.all as fsapi
+
+UNSUPPORTED = 'netRemote.sys.audio.eqPreset'
+
+def explore(server, tmp_path, **kwargs) -> dict:
+  args = {'verbose': False, 'exclude': '', 'json': True, 'cache': str(tmp_path / 'capabilities.json'),
+          'no_cache': False}
+  args.update(kwargs)
+  requests = server.requests
+  main.delegate_explore(args, fsapi.RadioHttp(server.host))
+  path, = tmp_path.glob('fsapi_exploration-*.json')
+  with open(str(path)) as fp:
+    results = json.load(fp)
+  path.unlink()
+  return results, server.requests - requests
+
+@pytest.fixture(autouse=True)
+def setup(tmp_path, monkeypatch):
+  monkeypatch.chdir(tmp_path)
+  monkeypatch.setattr(main, 'sleep', lambda seconds: None)
+
+def test_explore_skips_unsupported_nodes(fsapi_server, tmp_path):
+  server = fsapi_server(unsupported={UNSUPPORTED})
+  results, requests = explore(server, tmp_path)
+  assert results[UNSUPPORTED] == {'status': 'FS_NODE_DOES_NOT_EXIST', 'result': ''}
+  assert (tmp_path / 'capabilities.json').exists()
+
+  # the second run takes the unsupported node from the cache
+  cached, cached_requests = explore(server, tmp_path)
+  assert cached[UNSUPPORTED] == {'status': 'FS_NODE_DOES_NOT_EXIST', 'result': '', 'cached': True}
+  assert cached.keys() == results.keys()
+  assert cached_requests < requests
+
+def test_explore_without_cache(fsapi_server, tmp_path):
+  server = fsapi_server(unsupported={UNSUPPORTED})
+  results, _ = explore(server, tmp_path, no_cache=True)
+  assert 'cached' not in results[UNSUPPORTED]
+  assert not (tmp_path / 'capabilities.json').exists()
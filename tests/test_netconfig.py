@@ -0,0 +1,50 @@
+import urllib3
+
+from fsapi.netconfig import FSNetConfiguration, get_default_netconfig, set_default_netconfig
+
+def get(config: FSNetConfiguration, url: str) -> bytes:
+  response = config.delegate_request('GET', url)
+  assert response.status == 200
+  return response.data
+
+def test_connections_are_reused(isu_server):
+  server = isu_server({'/file.bin': b'data'})
+  config = FSNetConfiguration()
+  for _ in range(5):
+    assert get(config, server.base_url + '/file.bin') == b'data'
+  assert (server.requests, server.connections) == (5, 1)
+  assert config.get_pool() is config.get_pool()
+
+  config.clear()
+  get(config, server.base_url + '/file.bin')
+  assert server.connections == 2
+
+def test_custom_headers(isu_server):
+  # 'Connection: close' replaces the keep-alive default, so each request needs
+  # its own connection
+  server = isu_server({'/file.bin': b'data'})
+  config = FSNetConfiguration(headers={'Connection': 'close'})
+  for _ in range(3):
+    get(config, server.base_url + '/file.bin')
+  assert server.connections == 3
+
+def test_custom_pool(isu_server):
+  server = isu_server({'/file.bin': b'data'})
+  host, port = server.server_address[:2]
+  pool = urllib3.HTTPConnectionPool(host, port, maxsize=1)
+  config = FSNetConfiguration(http_pool=pool)
+  assert config.get_pool() is pool
+  get(config, '/file.bin')
+  get(config, '/file.bin')
+  assert server.connections == 1
+  config.clear()
+
+def test_default_netconfig():
+  default = get_default_netconfig()
+  assert get_default_netconfig() is default
+  config = FSNetConfiguration(maxsize=1)
+  set_default_netconfig(config)
+  try:
+    assert get_default_netconfig() is config
+  finally:
+    set_default_netconfig(default)
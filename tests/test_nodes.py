@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import fsapi.all as fsapi
+
+def test_nodes_are_loaded_lazily():
+  # Runs in a new interpreter, so no other test has loaded the nodes module yet
+  code = ('import sys, fsapi.all as fsapi\n'
+          'assert "fsapi.netremote.nodes" not in sys.modules\n'
+          'assert len(fsapi.get_all_node_names()) > 200\n'
+          'assert "fsapi.netremote.nodes" not in sys.modules\n'
+          'fsapi.get_node_type("netRemote.sys.power")\n'
+          'assert "fsapi.netremote.nodes" in sys.modules\n')
+  subprocess.run([sys.executable, '-c', code], check=True)
+
+def test_node_classes_are_cached():
+  node_class = fsapi.get_node_type('netRemote.sys.power')
+  assert fsapi.nodes.BaseSysPower is node_class
+  assert fsapi.get_node_type('netRemote.sys.unknown') is None
+
+def test_node_class_from_table():
+  name, base, flags, args, labels = fsapi.NODE_TABLE['netRemote.sys.power']
+  node_class = fsapi.get_node_type('netRemote.sys.power')
+  assert node_class.__name__ == name and node_class.__bases__ == (fsapi.NodeE8,)
+  assert node_class.get_name() == 'netRemote.sys.power'
+  assert node_class.is_notifying() == bool(flags & fsapi.NODE_NOTIFYING)
+  assert node_class.is_readonly() == bool(flags & fsapi.NODE_READONLY)
+  assert node_class(1).get_enum_value() == labels[1]
+
+def test_node_prototypes():
+  # Value nodes of the same type share their prototype
+  assert fsapi.nodes.BaseSysInfoVersion.prototype is fsapi.nodes.BaseSysInfoFriendlyName.prototype
+  assert fsapi.nodes.BaseSysInfoFriendlyName.max_size == 1024
+
+  prototype = fsapi.nodes.BaseNavPresets.get_prototype()
+  assert [arg.name for arg in prototype][:2] == ['key', 'name']
+  assert prototype.get_args()[0].data_type == fsapi.ARG_TYPE_U32
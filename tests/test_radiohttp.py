@@ -0,0 +1,67 @@
+import os
+
+import pytest
+
+import fsapi.all as fsapi
+
+RESPONSES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'responses')
+
+def _response(name: str) -> bytes:
+  with open(os.path.join(RESPONSES_DIR, name + '.xml'), 'rb') as fp:
+    return fp.read()
+
+def _parse(name: str, content: bytes = None) -> fsapi.ApiResponse:
+  node_class = fsapi.get_all_node_types()[name]
+  api_response = fsapi.ApiResponse(node_class)
+  api_response.parsexml(content or _response(name), bool(fsapi.is_list_class(node_class)))
+  return api_response
+
+@pytest.mark.parametrize('name,value', [
+  ('netRemote.sys.audio.volume', 12),
+  ('netRemote.sys.mode', 2),
+  ('netRemote.play.status', 2),
+  ('netRemote.sys.info.friendlyName', 'Kitchen Radio'),
+])
+def test_parse_value(name, value):
+  api_response = _parse(name)
+  assert api_response.status == 'FS_OK'
+  assert api_response.content.value == value
+
+def test_value_uses_declared_type():
+  # The value is converted by the node's prototype and not by the response tag
+  content = (b'<fsapiResponse><status>FS_OK</status>'
+             b'<value><u8>1234</u8></value></fsapiResponse>')
+  assert _parse('netRemote.sys.info.friendlyName', content).content.value == '1234'
+  content = content.replace(b'u8>', b'c8_array>')
+  assert _parse('netRemote.sys.audio.volume', content).content.value == 1234
+
+def test_parse_error_status():
+  content = b'<fsapiResponse><status>FS_NODE_BLOCKED</status></fsapiResponse>'
+  api_response = _parse('netRemote.sys.power', content)
+  assert api_response.status == 'FS_NODE_BLOCKED'
+  assert api_response.content is None
+
+def test_parse_list():
+  api_response = _parse('netRemote.nav.presets')
+  items = api_response.content.get_items()
+  assert api_response.content.size() == 10
+  assert items[0].get_attr_by_name('key') == 0
+  assert items[1].get_attr_by_name('name') == 'SWR3'
+  assert api_response.to_json()['items'][0]['type'] == 'IR'
+
+def test_list_pages(fsapi_server):
+  server = fsapi_server(items=25)
+  radio = fsapi.RadioHttp(server.host)
+  pages = list(fsapi.netremote_list_pages(fsapi.nodes.BaseNavPresets, radio, max_items=10))
+  assert [page.content.size() for page in pages] == [10, 10, 5]
+  assert [page.listend for page in pages] == [False, False, True]
+  keys = [item.get_attr_by_name('key') for page in pages for item in page.content.get_items()]
+  assert keys == list(range(25))
+
+def test_listend_not_serialized(fsapi_server):
+  server = fsapi_server(items=5)
+  radio = fsapi.RadioHttp(server.host)
+  api_response = fsapi.netremote_request(fsapi.LIST_GET_NEXT, fsapi.nodes.BaseNavPresets, radio,
+                                         parameters={'maxItems': 10})
+  assert api_response.listend
+  assert set(api_response.to_json()) == {'items'}
@@ -0,0 +1,35 @@
+import pytest
+
+import fsapi.all as fsapi
+
+def test_prefix_lookup():
+  registry = fsapi.get_node_registry()
+  names = registry.names('netRemote.sys.info')
+  assert 'netRemote.sys.info.version' in names
+  assert all(name.startswith('netRemote.sys.info.') for name in names)
+  # The last segment may be incomplete
+  assert registry.names('netRemote.sys.info.friendly') == ('netRemote.sys.info.friendlyName',)
+  assert registry.names('netRemote.unknown') == ()
+
+def test_filters():
+  registry = fsapi.get_node_registry()
+  lists = registry.names(list_only=True)
+  assert 'netRemote.nav.presets' in lists
+  assert all(fsapi.is_list_class(registry[name]) for name in lists)
+  assert all(registry[name].is_readonly() for name in registry.names(readonly=True))
+  # Results are cached
+  assert registry.names(list_only=True) is lists
+
+def test_custom_table():
+  table = {'netRemote.a.b': fsapi.NODE_TABLE['netRemote.sys.power']}
+  registry = fsapi.NodeRegistry(table)
+  assert registry.names('netRemote') == ('netRemote.a.b',)
+  assert registry.get('netRemote.sys.power') is None
+
+def test_node_types_are_cached():
+  types = fsapi.get_all_node_types()
+  assert fsapi.get_all_node_types() is types
+  assert len(types) == len(fsapi.NODE_TABLE)
+  assert types['netRemote.sys.power'] is fsapi.nodes.BaseSysPower
+  with pytest.raises(TypeError):
+    types['netRemote.sys.power'] = None
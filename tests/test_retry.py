@@ -0,0 +1,49 @@
+import pytest
+
+import fsapi.all as fsapi
+
+NODE = fsapi.nodes.BaseSysInfoFriendlyName
+
+def _radio(server, traces: list, pin: str = '1234') -> fsapi.RadioHttp:
+  return fsapi.RadioHttp(server.host, pin, hooks=[traces.append])
+
+def test_retries_are_traced(fsapi_server):
+  server = fsapi_server(timeout_rate=1.0)
+  traces = []
+  policy = fsapi.RetryPolicy(backoff=0, threshold=10)
+
+  response = policy.request(fsapi.GET, NODE, _radio(server, traces))
+  assert response.status == 'FS_TIMEOUT'
+  assert [trace.attempt for trace in traces] == [0, 1, 2, 3]
+  assert policy.get_breaker(server.host).failures == 4
+
+  metrics = fsapi.RequestMetrics()
+  for trace in traces: metrics(trace)
+  assert metrics.retries[(NODE.get_name(),)] == 3
+
+def test_hard_failures_do_not_reset_breaker(fsapi_server):
+  server = fsapi_server()
+  policy = fsapi.RetryPolicy(backoff=0, threshold=3)
+  breaker = policy.get_breaker(server.host)
+  breaker.record_failure()
+
+  # The wrong PIN is answered with HTTP 403, which has no retry rule
+  with pytest.raises(fsapi.NodeError):
+    policy.request(fsapi.GET, NODE, _radio(server, [], pin='0000'))
+  assert breaker.failures == 2
+
+  server.unsupported.add(NODE.get_name())
+  response = policy.request(fsapi.GET, NODE, _radio(server, []))
+  assert response.status == 'FS_NODE_DOES_NOT_EXIST'
+  assert breaker.failures == 0
+
+def test_breaker_opens(fsapi_server):
+  server = fsapi_server(timeout_rate=1.0)
+  policy = fsapi.RetryPolicy(backoff=0, threshold=2, reset_timeout=60)
+  radio = _radio(server, [])
+  # The breaker opens while the request is retried
+  with pytest.raises(fsapi.CircuitOpenError):
+    policy.request(fsapi.GET, NODE, radio)
+  with pytest.raises(fsapi.CircuitOpenError):
+    policy.request(fsapi.GET, NODE, radio)
+  assert server.requests == 2
@@ -0,0 +1,56 @@
+import logging
+
+import pytest
+
+import fsapi.all as fsapi
+
+NODE = fsapi.nodes.BaseSysInfoFriendlyName
+
+@pytest.fixture
+def metrics():
+  metrics = fsapi.RequestMetrics()
+  fsapi.add_request_hook(metrics)
+  yield metrics
+  fsapi.remove_request_hook(metrics)
+
+def test_request_trace(fsapi_server, metrics):
+  server = fsapi_server()
+  traces = []
+  radio = fsapi.RadioHttp(server.host, hooks=[traces.append])
+  fsapi.netremote_request(fsapi.GET, NODE, radio)
+
+  trace = traces[0]
+  assert (trace.method, trace.node, trace.host) == (fsapi.GET, NODE.get_name(), server.host)
+  assert trace.http_status == 200 and trace.status == 'FS_OK' and trace.error is None
+  assert trace.size > 0 and trace.total >= trace.ttfb + trace.read + trace.parse
+  assert metrics.requests[(NODE.get_name(), fsapi.GET, 'FS_OK')] == 1
+
+def test_failed_request_is_traced(fsapi_server, metrics):
+  server = fsapi_server()
+  traces = []
+  radio = fsapi.RadioHttp(server.host, '0000', hooks=[traces.append])
+  with pytest.raises(fsapi.NodeError):
+    fsapi.netremote_request(fsapi.GET, NODE, radio)
+  assert traces[0].http_status == 403 and traces[0].error
+  assert metrics.errors[(NODE.get_name(),)] == 1
+
+def test_prometheus_output():
+  metrics = fsapi.RequestMetrics(by_host=True)
+  trace = fsapi.RequestTrace(fsapi.GET, NODE.get_name(), '10.0.0.1')
+  trace.status, trace.size, trace.total = 'FS_OK', 100, 0.02
+  metrics(trace)
+
+  text = metrics.to_prometheus()
+  labels = 'host="10.0.0.1",node="%s"' % NODE.get_name()
+  assert 'fsapi_netremote_requests_total{%s,method="GET",status="FS_OK"} 1' % labels in text
+  assert 'fsapi_netremote_response_bytes_total{%s} 100' % labels in text
+  assert 'fsapi_netremote_request_seconds_bucket{%s,phase="total",le="0.025"} 1' % labels in text
+  assert 'fsapi_netremote_request_seconds_bucket{%s,phase="total",le="0.01"} 0' % labels in text
+
+def test_logging_hook(caplog):
+  trace = fsapi.RequestTrace(fsapi.GET, NODE.get_name(), '10.0.0.1')
+  trace.error = 'timed out'
+  with caplog.at_level(logging.DEBUG, logger='fsapi.netremote'):
+    fsapi.LoggingHook()(trace)
+  assert caplog.records[0].levelno == logging.WARNING
+  assert 'error=timed out' in caplog.records[0].getMessage()